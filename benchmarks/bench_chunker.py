@@ -0,0 +1,74 @@
+""" Benchmark for chunking the tagged details of the roll into possible people and places. Compares NLTK's
+    RegexpParser with the TagChunker of tag_chunker.py, which compiles the same grammars into one regex over the
+    encoded tags and returns spans instead of trees. The details are tagged with the tagger of extract_entities.py
+    first. Run from the project root with:
+
+        python -m benchmarks.bench_chunker
+"""
+
+import timeit
+
+from nltk import Tree
+
+from receipt_roll import common, extract_entities
+from receipt_roll.data import columnar
+import settings
+
+# number of timing runs, the best is reported
+RUNS = 7
+
+# number of passes over the details in each run
+NUMBER = 10
+
+
+def parser_spans(parser, tagged):
+    """ The (start, end) of each chunk found by a RegexpParser. """
+    spans = []
+    start = 0
+    for child in parser.parse(Tree(1, tagged)):
+        end = start + (len(child) if isinstance(child, Tree) else 1)
+        if isinstance(child, Tree):
+            spans.append((start, end))
+        start = end
+    return spans
+
+
+def run_parsers(tagged_rows):
+    for tagged in tagged_rows:
+        parser_spans(extract_entities.person_parser, tagged)
+        parser_spans(extract_entities.places_parser, tagged)
+
+
+def run_chunkers(tagged_rows):
+    for tagged in tagged_rows:
+        extract_entities.person_chunker.spans(tagged)
+        extract_entities.places_chunker.spans(tagged)
+
+
+def microseconds_per_row(func, rows):
+    """ Best of RUNS timings, in microseconds per row. """
+    best = min(timeit.repeat(lambda: func(rows), number=NUMBER, repeat=RUNS))
+    return best / NUMBER / len(rows) * 1e6
+
+
+def main():
+    details = columnar.read_df(settings.ROLL_CSV)[common.DETAILS_COL]
+    tagged_rows = extract_entities.tag_chunk([extract_entities.clean_details(text) for text in details])
+
+    # both must agree before we compare their speed
+    for tagged in tagged_rows:
+        for parser, chunker in ((extract_entities.person_parser, extract_entities.person_chunker),
+                                (extract_entities.places_parser, extract_entities.places_chunker)):
+            assert parser_spans(parser, tagged) == chunker.spans(tagged), tagged
+
+    parsers = microseconds_per_row(run_parsers, tagged_rows)
+    chunkers = microseconds_per_row(run_chunkers, tagged_rows)
+
+    print('Rows: {:,}'.format(len(tagged_rows)))
+    print('RegexpParser: {:.2f} µs/row'.format(parsers))
+    print('TagChunker: {:.2f} µs/row'.format(chunkers))
+    print('Speedup: {:.2f}x'.format(parsers / chunkers))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+""" Benchmark for parsing a corpus of transcripts across worker processes. The 1301-2 transcript is copied
+    into a temporary directory to make a corpus, which is parsed with an increasing number of workers.
+    Run from the project root with:
+
+        python -m benchmarks.bench_corpus
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+import settings
+from receipt_roll import parse_corpus
+
+# number of copies of the transcript in the corpus
+ROLLS = 24
+
+# split transcripts into chunks of at least this many lines
+CHUNK_LINES = 500
+
+
+def main():
+    corpus_dir = tempfile.mkdtemp()
+    try:
+        for idx in range(ROLLS):
+            shutil.copy(settings.ROLL_TXT, os.path.join(corpus_dir, 'roll_{}.txt'.format(1301 + idx)))
+
+        workers = 1
+        serial = None
+        while workers <= os.cpu_count():
+            start = time.perf_counter()
+            parse_corpus.parse_corpus(corpus_dir, workers=workers, chunk_lines=CHUNK_LINES, write=False)
+            elapsed = time.perf_counter() - start
+            if serial is None:
+                serial = elapsed
+            print('{:>3} workers: {:.2f}s ({:.2f}x)'.format(workers, elapsed, serial / elapsed))
+            workers *= 2
+    finally:
+        shutil.rmtree(corpus_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+""" Benchmark for the engines that parse the transcript: the loop over the lines (iter_roll_entries) and the
+    vectorised engine that works on whole columns of lines (roll_dfs_from_lines). Both make the data frames of
+    the entries and daily sums from a transcript scaled up 100 times. Run from the project root with:
+
+        python -m benchmarks.bench_engines
+"""
+
+import timeit
+
+import pandas as pd
+
+from receipt_roll import create_data_csv
+
+# how many times the transcript is repeated to make a bigger sample
+REPEAT_TRANSCRIPT = 100
+
+# number of timing runs, the best is reported
+RUNS = 3
+
+
+def run_loop(lines):
+    entries = []
+    daily_sums = []
+    for record in create_data_csv.iter_roll_entries(lines):
+        if isinstance(record, create_data_csv.RollEntry):
+            entries.append(record)
+        else:
+            daily_sums.append(record)
+    return pd.DataFrame(entries, columns=create_data_csv.DATA_COLUMNS), \
+        create_data_csv.daily_sums_df_from_records(daily_sums)
+
+
+def run_vectorised(lines):
+    return create_data_csv.roll_dfs_from_lines(lines)
+
+
+def best_time(func, lines):
+    return min(timeit.repeat(lambda: func(lines), number=1, repeat=RUNS))
+
+
+def main():
+    lines = create_data_csv.read_transcript() * REPEAT_TRANSCRIPT
+
+    # both must agree before we compare their speed
+    for expected, actual in zip(run_loop(lines), run_vectorised(lines)):
+        pd.testing.assert_frame_equal(expected, actual)
+
+    loop = best_time(run_loop, lines)
+    vectorised = best_time(run_vectorised, lines)
+
+    print('Lines parsed: {:,}'.format(len(lines)))
+    print('Loop: {:.2f} seconds'.format(loop))
+    print('Vectorised: {:.2f} seconds'.format(vectorised))
+    print('Speedup: {:.2f}x'.format(loop / vectorised))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+""" Benchmark for finding the monetary value of a line of details. Compares money.parse_money, which finds the value
+    and its pence in a single scan with the English denomination table, with money.extract_value followed by
+    money.regex_value_to_pence, the regexes for each kind of value, and checks they give exactly the same. Also
+    times the conversions of the values and pence of the roll with and without the money cache, and reports its hit
+    rate, and the speed of the Latin scanner as its denomination table grows. Run from the project root with:
+
+        python -m benchmarks.bench_money
+"""
+
+import timeit
+
+from receipt_roll import create_data_csv, money
+
+# Latin details for the scanner of the 'la' locale
+LATIN_LINES = ['De vicecomite Dublin, xx li. xiii s. iiij d. ob., de firma comitatus.',
+               'De Willelmo de Lacy, pro licentia concordandi, di. marc.',
+               'De abbate sancte Marie, x marc. de fine.',
+               'De communitate ville de Drogheda, xl s. et vi d.',
+               'De eodem, pro eodem.'] * 200
+
+# denominations added to the Latin table to see if the scanner slows as the table grows
+EXTRA_DENOMINATIONS = 200
+
+# number of timing runs, the best is reported
+RUNS = 7
+
+# number of passes over the details in each run
+NUMBER = 10
+
+
+def run_extract_value(lines):
+    for line in lines:
+        val = money.extract_value(line)
+        if val is not None:
+            money.regex_value_to_pence(val)
+
+
+def run_parse_money(lines):
+    for line in lines:
+        money.parse_money(line)
+
+
+def run_conversions(values, pennies, value_to_pence, pence_to_psd):
+    for value in values:
+        value_to_pence(value)
+    for pence in pennies:
+        pence_to_psd(pence)
+
+
+def microseconds_per_line(func, lines):
+    """ Best of RUNS timings, in microseconds per line. """
+    best = min(timeit.repeat(lambda: func(lines), number=NUMBER, repeat=RUNS))
+    return best / NUMBER / len(lines) * 1e6
+
+
+def latin_scanner(extra_denominations):
+    """ The scanner of the Latin table with made up denominations added to it. """
+    table = money.MONEY_LOCALES['la']
+    extra = [money.Denomination('unit{}'.format(idx), 1, ['unit{}.'.format(idx), 'u{}'.format(idx)])
+             for idx in range(extra_denominations)]
+    return money.MoneyScanner(table._replace(denominations=table.denominations + extra))
+
+
+def hit_rate(info):
+    calls = info.hits + info.misses
+    return info.hits / calls if calls else 0
+
+
+def main():
+    lines = [line for line in create_data_csv.read_transcript()
+             if create_data_csv.classify_line(line)[0] == create_data_csv.DETAILS_LINE and line.strip()]
+
+    # both must agree, down to the types of the pence, before we compare their speed
+    for line in lines:
+        val = money.extract_value(line)
+        pence = money.regex_value_to_pence(val) if val is not None else None
+        found, pennies, span = money.parse_money(line)
+        assert (found, pennies, type(pennies)) == (val, pence, type(pence)), line
+
+    extract_value = microseconds_per_line(run_extract_value, lines)
+    parse_money = microseconds_per_line(run_parse_money, lines)
+
+    print('Detail lines: {:,}'.format(len(lines)))
+    print('extract_value + regex_value_to_pence: {:.2f} µs/line'.format(extract_value))
+    print('parse_money: {:.2f} µs/line'.format(parse_money))
+    print('Speedup: {:.2f}x'.format(extract_value / parse_money))
+
+    # the conversions of each value and its pence, as they are made when parsing and plotting the roll
+    values = [money.parse_money(line)[0] for line in lines]
+    values = [value for value in values if value is not None]
+    pennies = [money.value_to_pence(value) for value in values]
+
+    money.cache_clear()
+    run_conversions(values, pennies, money.value_to_pence, money.pence_to_psd)
+    print('Values: {:,}, distinct: {:,}'.format(len(values), len(set(values))))
+    for name, info in money.cache_info().items():
+        print('{} cache hit rate (one pass): {:.1%}'.format(name, hit_rate(info)))
+
+    uncached = microseconds_per_line(
+        lambda values: run_conversions(values, pennies, money.value_to_pence.__wrapped__,
+                                       money.pence_to_psd.__wrapped__), values)
+    cached = microseconds_per_line(
+        lambda values: run_conversions(values, pennies, money.value_to_pence, money.pence_to_psd), values)
+    print('value_to_pence + pence_to_psd, uncached: {:.2f} µs/value'.format(uncached))
+    print('value_to_pence + pence_to_psd, cached: {:.2f} µs/value'.format(cached))
+    print('Speedup: {:.2f}x'.format(uncached / cached))
+
+    # scanning Latin shouldn't get slower as the table grows
+    for extra in (0, EXTRA_DENOMINATIONS):
+        scanner = latin_scanner(extra)
+        spellings = len(scanner.denominations)
+        speed = microseconds_per_line(lambda lines: [scanner.scan(line) for line in lines], LATIN_LINES)
+        print('Latin scanner with {} spellings: {:.2f} µs/line'.format(spellings, speed))
+
+
+if __name__ == '__main__':
+    main()
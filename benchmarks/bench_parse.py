@@ -0,0 +1,81 @@
+""" Benchmark for classifying the lines of the transcript. Compares the compiled, single pass scanner used
+    by create_data_csv.parse_roll with the cascade of regex and 'in' checks it replaced. Run from the project
+    root with:
+
+        python -m benchmarks.bench_parse
+"""
+
+import re
+import timeit
+
+from receipt_roll import create_data_csv
+
+# how many times the transcript is repeated to make a bigger sample
+REPEAT_TRANSCRIPT = 50
+
+# number of timing runs, the best is reported
+RUNS = 5
+
+
+def classify_line_cascade(line):
+    """ The original cascade of checks from parse_roll, kept here as a baseline. """
+    if create_data_csv.membrane_regex.match(line):
+        return create_data_csv.MEMBRANE_LINE
+    elif create_data_csv.place_regex.match(line):
+        return create_data_csv.PLACE_LINE
+    elif create_data_csv.date_regex.match(line):
+        return create_data_csv.DATE_LINE
+    elif 'Gross receipt' in line:
+        return create_data_csv.TERM_LINE
+    elif 'DAILY SUM RECEIVED' in line or re.match('^SUM:', line):
+        return create_data_csv.DAILY_SUM_LINE
+    elif re.match('^SUM OF', line) or re.match('^SUM FOR', line) or re.match('^SUM MEDII', line):
+        return create_data_csv.IGNORED_LINE
+    elif re.match('^WEEKLY SUM', line) or re.match('^WEEKLY RECEIPT', line):
+        return create_data_csv.IGNORED_LINE
+    elif 'MONTHLY SUM' in line or 'TOTAL' in line:
+        return create_data_csv.IGNORED_LINE
+    elif re.match('^NOTHING', line):
+        return create_data_csv.IGNORED_LINE
+    elif create_data_csv.day_regex.match(line):
+        return create_data_csv.IGNORED_LINE
+    elif create_data_csv.receipt_regex.match(line):
+        return create_data_csv.IGNORED_LINE
+    else:
+        return create_data_csv.DETAILS_LINE
+
+
+def run_cascade(lines):
+    for line in lines:
+        classify_line_cascade(line)
+
+
+def run_scanner(lines):
+    for line in lines:
+        create_data_csv.classify_line(line)
+
+
+def lines_per_second(func, lines):
+    """ Best of RUNS timings, as lines per second. """
+    best = min(timeit.repeat(lambda: func(lines), number=1, repeat=RUNS))
+    return len(lines) / best
+
+
+def main():
+    lines = create_data_csv.read_transcript() * REPEAT_TRANSCRIPT
+
+    # both must agree before we compare their speed
+    for line in create_data_csv.read_transcript():
+        assert classify_line_cascade(line) == create_data_csv.classify_line(line)[0], line
+
+    cascade = lines_per_second(run_cascade, lines)
+    scanner = lines_per_second(run_scanner, lines)
+
+    print('Lines classified: {:,}'.format(len(lines)))
+    print('Cascade: {:,.0f} lines/second'.format(cascade))
+    print('Scanner: {:,.0f} lines/second'.format(scanner))
+    print('Speedup: {:.2f}x'.format(scanner / cascade))
+
+
+if __name__ == '__main__':
+    main()
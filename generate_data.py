@@ -1,25 +1,18 @@
 """ A script that pulls together all the other scripts to parse the transcript and create an Excel file. """
-from receipt_roll import create_data_csv, compare_sums_csv, extract_entities, create_excel_report
+from receipt_roll import update_data_csv, compare_sums_csv, extract_entities, create_excel_report, nltk_resources
 import settings
-import nltk
-import ssl
 
 if __name__ == '__main__':
 
-    # https://stackoverflow.com/questions/38916452/
-    print('Installing NLTK modules')
-    try:
-        _create_unverified_https_context = ssl._create_unverified_context
-    except AttributeError:
-        pass
-    else:
-        ssl._create_default_https_context = _create_unverified_https_context
+    # only the NLTK models the entities are extracted with, from the local directory if they're there
+    print('Checking NLTK models in ' + settings.NLTK_DATA_DIR)
+    nltk_resources.check_resources(tokenize=settings.TOKENIZER == extract_entities.NLTK_TOKENIZER,
+                                   tag=settings.TAGGER_ENGINE == extract_entities.PERCEPTRON_ENGINE,
+                                   download=settings.NLTK_DOWNLOAD)
 
-    nltk.download('popular')
-
-    # parse the transcript and create the CSV
+    # parse the transcript and create the CSV (only membranes edited since the last run are parsed)
     print('Parsing transcript to create  ' + settings.ROLL_CSV + " and " + settings.DAILY_SUMS_CSV)
-    create_data_csv.parse_roll()
+    update_data_csv.update_roll()
 
     # compare sums and create report
     print('Compare computed daily sums with those of the Exchequer clerk and write to '
@@ -3,6 +3,7 @@ import settings
 import sys
 
 # CSV column headers
+ROLL_COL = 'Roll'                   # The roll the entry is from, e.g. 'roll_1301' (corpus data only)
 MEM_COL = 'Membrane'                # The membrane the entry is recorded
 TERM_COL = 'Term'                   # The term of the entry (Michaelmas, Hilary, Easter and Trinity)
 DAY_COL = 'Day'                     # The day. e.g. 'Saturday'
@@ -13,6 +14,11 @@ VAL_COL = 'Value'                   # Value extracted from the details. e.g. '½
 PENCE_COL = 'Pence'                 # The pence equivalent of the value, easier for comparisons
 SOURCE_COL = 'Source'               # The source (often geographical), e.g. 'Dublin'
 DETAILS_COL = 'Details'             # The details, e.g. 'The same Nicholas, ½ mark for falsely raising hue and cry.'
+LINE_COL = 'Line'                   # The line number of the entry in the transcript
+OFFSET_COL = 'Offset'               # The byte offset of the line in the transcript
+SUM_LINE_COL = 'Sum Line'           # The line of the daily sum in the transcript
+FIRST_LINE_COL = 'First Entry Line'  # The line of the first entry of a day
+LAST_LINE_COL = 'Last Entry Line'   # The line of the last entry of a day
 PSD_COL = '£.s.d.'                  # £.s.d. (computed from the Pence)
 YEAR_MONTH_COL = 'Monthly Period'   # Year/Month (computed from the string held in the 'Date' column)
 
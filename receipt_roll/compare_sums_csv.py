@@ -5,14 +5,15 @@
 """
 
 import settings
-from receipt_roll import common
+from receipt_roll import common, money
 from receipt_roll.data import roll
 import pandas as pd
 
 
-def compare_pence(row):
-    """ Compare the clerks sums with our own! """
-    return row['Roll'] == row['Computed']
+def compare_pence(roll_pence, computed_pence):
+    """ Compare the clerks sums with our own! They are compared as whole numbers of farthings, so they match
+        exactly or not at all. """
+    return money.MoneyArray.from_pence(roll_pence) == money.MoneyArray.from_pence(computed_pence)
 
 
 def generate_report():
@@ -27,16 +28,22 @@ def generate_report():
     # compute daily sums ourselves
     df_sums_comp = roll.daily_sum_from_roll_df(df_roll)
 
-    # just get the date, pence and merge into a new data frame
-    df_sums_left = df_sums[[common.DATE_COL, common.PENCE_COL]]
+    # just get the date, pence (and the line of the sum) and merge into a new data frame
+    df_sums_left = df_sums[[common.DATE_COL, common.PENCE_COL, common.LINE_COL]]
     df_sums_right = df_sums_comp[[common.DATE_COL, common.PENCE_COL]]
     df_result = pd.merge(df_sums_left, df_sums_right, on=[common.DATE_COL])
 
     # rename columns
-    df_result = df_result.rename(columns={'Pence_x': 'Roll', 'Pence_y': 'Computed'})
+    df_result = df_result.rename(columns={'Pence_x': 'Roll', 'Pence_y': 'Computed',
+                                          common.LINE_COL: common.SUM_LINE_COL})
 
     # mark problematic rows
-    df_result['Match'] = df_result.apply(compare_pence, axis=1)
+    df_result['Match'] = compare_pence(df_result['Roll'], df_result['Computed'])
+
+    # the lines of the transcript the sums come from, so a mismatch can be found and checked
+    df_lines = df_roll.groupby(common.DATE_COL)[common.LINE_COL].agg(['min', 'max']).reset_index()
+    df_lines = df_lines.rename(columns={'min': common.FIRST_LINE_COL, 'max': common.LAST_LINE_COL})
+    df_result = pd.merge(df_result, df_lines, on=[common.DATE_COL], how='left')
 
     df_result.to_csv(settings.DAILY_SUMS_COMPARE_CSV, index=False)
 
@@ -1,14 +1,72 @@
 """ Parses the text document (transcript) and creates to CSV files. One has the individual
     entries of sums given in the roll and the other has the daily total of sums recorded by the Exchequer clerk. """
 
-import fileinput
+import argparse
+import csv
 import re
 import os
+from collections import namedtuple
+
+import numpy as np
 import pandas as pd
 
 from receipt_roll import money, common
+from receipt_roll.data import columnar
 import settings
 
+# pyarrow runs the regexes of the vectorised engine over whole columns of lines
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+# the engines that can parse the transcript, a loop over the lines or operations on whole columns of lines
+LOOP_ENGINE = 'loop'
+VECTORISED_ENGINE = 'vectorised'
+ENGINES = [LOOP_ENGINE, VECTORISED_ENGINE]
+
+# heading for the main dataset
+DATA_COLUMNS = [common.MEM_COL, common.TERM_COL, common.DATE_COL, common.DAY_ENTRY, common.DAY_COL,
+                common.SOURCE_COL, common.DETAILS_COL, common.VAL_COL, common.PENCE_COL, common.LINE_COL,
+                common.OFFSET_COL]
+
+# headings for the daily sums
+DAILY_SUMS_COLUMNS = [common.DATE_COL, common.VAL_COL, common.PENCE_COL, common.LINE_COL, common.OFFSET_COL]
+
+# an entry (item of business) in the roll, fields in the same order as DATA_COLUMNS. The line (numbered from 1)
+# and byte offset are where the entry is in the transcript.
+RollEntry = namedtuple('RollEntry', ['membrane', 'term', 'date', 'day_entry', 'day', 'source', 'details', 'value',
+                                     'pence', 'line', 'offset'])
+
+# a daily sum recorded by the Exchequer clerk, fields in the same order as DAILY_SUMS_COLUMNS
+DailySum = namedtuple('DailySum', ['date', 'value', 'pence', 'line', 'offset'])
+
+
+class ParseState(object):
+    """ The values that span multiple rows of the transcript, e.g. the current membrane, place and date. It is
+        updated by iter_roll_entries() once all the lines have been parsed, so parsing can be picked up where it
+        left off, e.g. by the next chunk of a large transcript. """
+
+    __slots__ = ('membrane', 'place', 'day', 'date', 'term', 'day_entry', 'previous', 'line', 'offset')
+
+    def __init__(self, membrane=None, place=None, day=None, date=None, term=None, day_entry=None, previous=None,
+                 line=0, offset=0):
+        self.membrane = membrane
+        self.place = place
+        self.day = day
+        self.date = date
+        self.term = term
+        self.day_entry = day_entry
+        self.previous = previous
+        # the number of lines, and bytes, read so far
+        self.line = line
+        self.offset = offset
+
+
+# the year the 1301-2 roll starts (Michaelmas 1301)
+START_YEAR = 1301
+
 # so we can create the MM in a YYYY-MM-DD format
 months_numerical = {
     "January": "01",
@@ -25,12 +83,15 @@ months_numerical = {
     "December": "12"
 }
 
+# days of the week and months, as used in the transcript
+DAYS_PATTERN = 'Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday'
+MONTHS_PATTERN = 'January|February|March|April|May|June|July|August|September|October|November|December'
+
 # regex for date matching
-date_regex = re.compile(r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)(.+)? (\d+) (January|February|'
-                        r'March|April|May|June|July|August|September|October|November|December)')
+date_regex = re.compile(r'^({0})(.+)? (\d+) ({1})'.format(DAYS_PATTERN, MONTHS_PATTERN))
 
 # regex for finding days of the week
-day_regex = re.compile(r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)')
+day_regex = re.compile(r'^({0})'.format(DAYS_PATTERN))
 
 # regex for finding 'Receipt' headings
 receipt_regex = re.compile('^Receipt(s?)')
@@ -41,154 +102,471 @@ membrane_regex = re.compile(r'^\[m\. \d*\]$')
 # regex for a place declaration
 place_regex = re.compile(r'^((\[)?[A-Z]{2,})(\])?(( .*)?( [A-Z]{2,}))?(\])?$')
 
+# the kinds of line found in the transcript
+MEMBRANE_LINE = 'membrane'
+PLACE_LINE = 'place'
+DATE_LINE = 'date'
+TERM_LINE = 'term'
+DAILY_SUM_LINE = 'daily_sum'
+IGNORED_LINE = 'ignored'
+DETAILS_LINE = 'details'
+
+# the pattern of each kind of line, in order of precedence, e.g. a membrane is checked before a place. The named
+# inner groups hold the values we need.
+LINE_PATTERNS = [
+    (MEMBRANE_LINE, r'\[m\. (?P<membrane_no>\d*)\]$'),
+    (PLACE_LINE, r'(\[)?[A-Z]{2,}(\])?(( .*)?( [A-Z]{2,}))?(\])?$'),
+    (DATE_LINE, r'(?P<weekday>{days})(.+)? (?P<day_no>\d+) (?P<month>{months})'.format(days=DAYS_PATTERN,
+                                                                                       months=MONTHS_PATTERN)),
+    (TERM_LINE, r'.*Gross receipt'),
+    (DAILY_SUM_LINE, r'.*DAILY SUM RECEIVED|SUM:'),
+    (IGNORED_LINE, r'SUM OF|SUM FOR|SUM MEDII|WEEKLY SUM|WEEKLY RECEIPT|.*MONTHLY SUM|.*TOTAL|NOTHING|'
+                   r'(?:{days})|Receipt'.format(days=DAYS_PATTERN))]
+
+# a single scanner that classifies a line of the transcript. The alternatives are tried in order and the name of
+# the outer group that matches gives the kind of line.
+line_regex = re.compile('|'.join('(?P<{}>{})'.format(kind, pattern) for kind, pattern in LINE_PATTERNS))
+
+# an unnamed group in a regex, i.e. an opening bracket that isn't escaped or followed by '?'
+unnamed_group_regex = re.compile(r'(?<!\\)\((?!\?)')
+
+# the terms, in the order they are looked for in a 'Gross receipt' heading
+TERM_NAMES = ['Michaelmas', 'Trinity', 'Hilary', 'Easter']
+
 
-def date_values(line_val):
+def classify_line(line):
+    """ Classify a line of the transcript with a single match. Returns the kind of line and the match object, which
+        holds the captured values, e.g. the membrane number or the day and month of a date. Lines that are not
+        headings, sums etc. are treated as details (the match is None). """
+    match = line_regex.match(line)
+    if match is None:
+        return DETAILS_LINE, None
+    return match.lastgroup, match
+
+
+def date_values(line_val, start_year=START_YEAR):
     date_match = date_regex.match(line_val)
-    day = date_match.group(1)
-    day_val = date_match.group(3)
-    month_val = date_match.group(4)
+    return date_parts_to_values(date_match.group(1), date_match.group(3), date_match.group(4), start_year)
+
+
+def date_parts_to_values(day, day_val, month_val, start_year=START_YEAR):
+    """ Turn the day of the week, the day of the month and the name of the month into the day of the week
+        and a YYYY-MM-DD string. The Exchequer year starts at Michaelmas, so September to December are in
+        the start year and the other months are in the following year. """
     if len(day_val) == 1:
         day_val = "0{}".format(day_val)
     month_val = months_numerical[month_val]
     if month_val == "09" or month_val == "10" or month_val == "11" or month_val == "12":
-        year_val = "1301"
+        year_val = start_year
     else:
-        year_val = "1302"
+        year_val = start_year + 1
     return day, "{}-{}-{}".format(year_val, month_val, day_val)
 
 
-def parse_roll():
-    # heading for the main dataset
-    data_columns = [common.MEM_COL, common.TERM_COL, common.DATE_COL, common.DAY_ENTRY, common.DAY_COL,
-                    common.SOURCE_COL, common.DETAILS_COL, common.VAL_COL, common.PENCE_COL]
+def read_transcript(file=None):
+    """ Read the whole transcript in one go and return a list of lines (without line endings). """
+    if file is None:
+        file = settings.ROLL_TXT
+    with open(file, 'r', encoding='utf-8') as transcript:
+        return transcript.read().split('\n')
+
+
+def iter_transcript(file=None):
+    """ Stream the lines of the transcript (without line endings), one at a time. """
+    if file is None:
+        file = settings.ROLL_TXT
+    with open(file, 'r', encoding='utf-8') as transcript:
+        for line in transcript:
+            yield line.rstrip('\n')
 
-    # headings for the daily sums
-    daily_sums_columns = [common.DATE_COL, common.VAL_COL, common.PENCE_COL]
 
-    # to hold the data
-    data = []
-    daily_sums = []
+def iter_roll_entries(lines=None, state=None, start_year=START_YEAR, locale=money.DEFAULT_LOCALE):
+    """ Parse the transcript and yield a RollEntry for each item of business and a DailySum for each daily
+        sum recorded by the Exchequer clerk, in the order they appear. Only the values that span multiple rows
+        (membrane, term, date, place etc.) are held in memory, so very large transcripts can be processed. If no
+        lines are given, the transcript is streamed from settings.ROLL_TXT. A ParseState can be given to start
+        from, and it holds the values at the end of the lines when the generator is exhausted. Each record has
+        the line number and byte offset of its line, which assume '\\n' line endings. Monetary values are
+        read in the given locale, see money.MONEY_LOCALES. """
+
+    if lines is None:
+        lines = iter_transcript()
+
+    if state is None:
+        state = ParseState()
 
     # keep track of values we use in rows (some span multiple rows)
-    number = None
-    place = None
-    day_of_week = None
-    date = None
-    term = None
+    number = state.membrane
+    place = state.place
+    day_of_week = state.day
+    date = state.date
+    term = state.term
+    day_entry = state.day_entry
+    previous = state.previous
+    line_no = state.line
+    offset = state.offset
 
     # go through each line of the transcript
-    for line in fileinput.input(settings.ROLL_TXT, openhook=fileinput.hook_encoded("utf-8")):
+    for line in lines:
+        line_no += 1
+        # classify the line with a single match
+        kind, match = classify_line(line)
         # do we have a declaration of a membrane number
-        if membrane_regex.match(line):
-            number = re.search(r"\d+", line).group(0)
+        if kind == MEMBRANE_LINE:
+            number = int(match.group('membrane_no'))
         # or are we declaring a place?
-        elif place_regex.match(line):
+        elif kind == PLACE_LINE:
             place = line.strip()
             if '[DUBLIN]' in place:
                 place = 'DUBLIN'
         # or are we declaring with a date declaration?
-        elif date_regex.match(line):
-            date__ = date_values(line)
-            day_of_week = date__[0]
+        elif kind == DATE_LINE:
+            day_of_week, date = date_parts_to_values(match.group('weekday'), match.group('day_no'),
+                                                     match.group('month'), start_year)
             day_entry = 1
-            date = date__[1]
         # or are we declaring the financial term?
-        elif 'Gross receipt' in line:
-            if 'Michaelmas' in line:
-                term = 'Michaelmas'
-            elif 'Trinity' in line:
-                term = 'Trinity'
-            elif 'Hilary' in line:
-                term = 'Hilary'
-            elif 'Easter' in line:
-                term = 'Easter'
+        elif kind == TERM_LINE:
+            for term_name in TERM_NAMES:
+                if term_name in line:
+                    term = term_name
+                    break
         # or are we getting a daily sum?
-        elif 'DAILY SUM RECEIVED' in line or re.match('^SUM:', line):
+        elif kind == DAILY_SUM_LINE:
             tmp = line.split(':')
             val = tmp[1].strip()
-            daily_sums.append([date, val, money.value_to_pence(val)])
-        # ignore these sums
-        elif re.match('^SUM OF', line) or re.match('^SUM FOR', line) or re.match('^SUM MEDII', line):
-            pass
-        # ignore these sums
-        elif re.match('^WEEKLY SUM', line) or re.match('^WEEKLY RECEIPT', line):
-            pass
-        # ignore these sums
-        elif 'MONTHLY SUM' in line or 'TOTAL' in line:
-            pass
-        elif re.match('^NOTHING', line):
-            pass
-        # ignore these sums
-        elif day_regex.match(line):
-            pass
-        # ignore these sums
-        elif receipt_regex.match(line):
+            yield DailySum(date, val, money.value_to_pence(val, locale), line_no, offset)
+        # ignore other sums, 'NOTHING', days and 'Receipt' headings
+        elif kind == IGNORED_LINE:
             pass
         # this should be some details ...
         else:
             # only process if we have a membrane number, place and the line has content
             if number is not None and place is not None and len(line.strip()) > 0:
-                # extract the value from the details
-                val = money.extract_value(line)
-                # if we extract details, get the value
-                if val is not None:
-                    # convert to pence
-                    pennies = money.value_to_pence(val)
-                else:
-                    pennies = None
+                # extract the value from the details and its value in pence
+                val, pennies, span = money.parse_money(line, locale)
                 # some entries don't have a value but refer to the line above
                 if val is None and pennies is None and 'the same' in line.lower():
-                    pennies = data[-1][-1]
-                    val = data[-1][-2]
-                # add the row to the data array
-                data.append([number, term, date, day_entry, day_of_week, place, line.strip(), val, pennies])
+                    pennies = previous.pence
+                    val = previous.value
+                previous = RollEntry(number, term, date, day_entry, day_of_week, place, line.strip(), val, pennies,
+                                     line_no, offset)
+                yield previous
                 day_entry += 1
+        # the next line starts after this one and its line ending
+        offset += len(line.encode('utf-8')) + 1
 
-    # create the data directory if necessary
-    if not os.path.exists(settings.DATA_DIR):
-        os.makedirs(settings.DATA_DIR)
+    # so we can continue from where we left off
+    state.membrane = number
+    state.place = place
+    state.day = day_of_week
+    state.date = date
+    state.term = term
+    state.day_entry = day_entry
+    state.previous = previous
+    state.line = line_no
+    state.offset = offset
+
+
+def write_entries_csv(records, roll_file, sums_file):
+    """ A sink for iter_roll_entries(). Entries and daily sums are written to their CSV files as they arrive,
+        so nothing is held in memory. This is a raw dump of the entries as they appear in the transcript, in the
+        columns of DATA_COLUMNS, i.e. without the 'Term Week' column or the days the Exchequer didn't sit. The roll
+        data of roll_df_from_entries() can be made from it later with roll_df_from_entries(pd.read_csv(roll_file)).
+        The daily sums are the same as those of daily_sums_df_from_records(). """
 
-    # make a data frame
-    df = pd.DataFrame(data, columns=data_columns)
+    with open(roll_file, 'w', newline='', encoding='utf-8') as roll_csv, \
+            open(sums_file, 'w', newline='', encoding='utf-8') as sums_csv:
+        roll_writer = csv.writer(roll_csv)
+        sums_writer = csv.writer(sums_csv)
+        roll_writer.writerow(DATA_COLUMNS)
+        sums_writer.writerow(DAILY_SUMS_COLUMNS)
+        for record in records:
+            if isinstance(record, RollEntry):
+                roll_writer.writerow(record)
+            else:
+                sums_writer.writerow(record)
 
-    # cast the membrane to a number
-    df[common.MEM_COL] = df[common.MEM_COL].apply(pd.to_numeric)
+
+def nothing_csv_for(transcript):
+    """ The CSV file of the days the Exchequer didn't sit for a roll. For a transcript such as 'roll_1305.txt' this
+        is 'roll_1305_nothing_dates.csv' in the same directory; the 1301-2 roll uses settings.NOTHING_CSV. Returns
+        None if a roll doesn't have one. """
+    nothing_csv = os.path.splitext(transcript)[0] + '_nothing_dates.csv'
+    if os.path.isfile(nothing_csv):
+        return nothing_csv
+    if os.path.basename(transcript) == os.path.basename(settings.ROLL_TXT):
+        return settings.NOTHING_CSV
+    return None
+
+
+def nothing_df_for(transcript):
+    """ The days the Exchequer didn't sit for a roll as a data frame, which is empty if the roll doesn't have any. """
+    nothing_csv = nothing_csv_for(transcript)
+    if nothing_csv is None:
+        return pd.DataFrame(columns=DATA_COLUMNS)
+    return pd.read_csv(nothing_csv)
+
+
+def add_nothing_days(df, nothing_df):
+    """ Add the days the Exchequer didn't sit to the entries of the roll and sort by date and membrane. The feast
+        days are appended and a stable sort puts them in place, so on a date that also has entries they come last.
+        The entries are parsed in date order, so this is cheap. """
+    if len(nothing_df) > 0:
+        df = pd.concat([df, nothing_df.reindex(columns=DATA_COLUMNS)], ignore_index=True)
+    return df.sort_values(by=[common.DATE_COL, common.MEM_COL], kind='mergesort')
+
+
+def roll_df_from_entries(entries, nothing_df=None):
+    """ Create the roll data frame from RollEntry records (or a data frame of them), adding the days the Exchequer
+        didn't sit and the week of the term. The days the Exchequer didn't sit default to those in
+        settings.NOTHING_CSV. """
+
+    # make a data frame (unless we already have one)
+    if isinstance(entries, pd.DataFrame):
+        df = entries
+    else:
+        df = pd.DataFrame(entries, columns=DATA_COLUMNS)
 
     # get the feast days ... days recorded, but no values given
-    nothing_df = pd.read_csv(settings.NOTHING_CSV)
+    if nothing_df is None:
+        nothing_df = pd.read_csv(settings.NOTHING_CSV)
 
-    # merge data with feast dates
-    df = pd.merge(df, nothing_df, on=[common.MEM_COL, common.TERM_COL, common.DATE_COL, common.DAY_ENTRY,
-                                      common.DAY_COL, common.SOURCE_COL, common.DETAILS_COL, common.VAL_COL,
-                                      common.PENCE_COL],
-                  how='outer', sort=True)
+    # add the feast days in date order
+    df = add_nothing_days(df, nothing_df)
 
-    df = df.sort_values(by=[common.DATE_COL, common.MEM_COL])
+    # feast days are not in the transcript, so don't have a line or offset
+    df[[common.LINE_COL, common.OFFSET_COL]] = df[[common.LINE_COL, common.OFFSET_COL]].astype('Int64')
 
     # calculate week of the term
-    week_values = []
-    for term, term_g in df.groupby(common.TERM_COL, sort=False):
-        idx = 0
-        new_week_on_monday = False
-        week = 1
-        for index, row in term_g.iterrows():
-            day = row[common.DAY_COL]
-            if new_week_on_monday is True and day == 'Monday':
-                new_week_on_monday = False
-                week = week + 1
-            if day != 'Monday':
-                new_week_on_monday = True
-            week_values.append(week)
-
-    df.insert(4, common.WEEK_COL, week_values)
-
-    # write to file
-    df.to_csv(settings.ROLL_CSV, index=False)
+    df.insert(4, common.WEEK_COL, term_weeks(df))
+
+    return df
+
+
+def term_weeks(df):
+    """ Calculate the week of the term for each row of a data frame sorted by date. A term starts in week 1 and
+        a new week starts on the first Monday after any other day, i.e. a term that starts on a Monday doesn't
+        start a second week that day. If the data frame has a 'Roll' column, each roll is treated separately.
+        Returns a Series with the same index as the data frame. """
+
+    keys = [common.TERM_COL]
+    if common.ROLL_COL in df.columns:
+        keys = [common.ROLL_COL, common.TERM_COL]
+    groups = [df[key] for key in keys]
+
+    # a new week starts on a Monday that follows another day in the same term
+    is_monday = df[common.DAY_COL] == 'Monday'
+    after_other_day = (~is_monday).groupby(groups, sort=False).shift(1, fill_value=False)
+    new_week = is_monday & after_other_day
+
+    return new_week.astype('int64').groupby(groups, sort=False).cumsum() + 1
+
+
+def daily_sums_df_from_records(daily_sums):
+    """ Create the daily sums data frame from DailySum records. """
+    return pd.DataFrame(daily_sums, columns=DAILY_SUMS_COLUMNS)
+
+
+def re2_pattern(pattern):
+    """ The pattern of a Python regex for pyarrow, which uses RE2 and only allows named groups, so the other groups
+        are made non-capturing. """
+    if hasattr(pattern, 'pattern'):
+        pattern = pattern.pattern
+    return unnamed_group_regex.sub('(?:', pattern)
+
+
+def to_numpy(array):
+    """ A pyarrow array as a numpy array, with nulls as None. """
+    return array.to_numpy(zero_copy_only=False)
+
+
+def extract_values(details, locale=money.DEFAULT_LOCALE):
+    """ The monetary value of each of a pyarrow array of details, the same as money.parse_money() but with the regex
+        of each form of the locale run over the whole array. Each form is only looked for in the lines that don't
+        have a value of a form that comes before it. Values in locales without forms are found line by line with
+        money.parse_money(). Returns a numpy array of values or None. """
+    scanner = money.money_scanner(locale)
+    if scanner.forms is None:
+        return np.array([money.parse_money(text, locale)[0] for text in details.to_pylist()], dtype=object)
+
+    values = np.full(len(details), None, dtype=object)
+    remaining = np.arange(len(details))
+    for kind, pattern in scanner.form_patterns:
+        found = pc.extract_regex(details.take(remaining), '(?P<value>{})'.format(re2_pattern(pattern)))
+        is_found = to_numpy(found.is_valid())
+        values[remaining[is_found]] = to_numpy(found.field('value').filter(found.is_valid()))
+        remaining = remaining[~is_found]
+    is_nothing = to_numpy(pc.match_substring(details.take(remaining), 'NOTHING'))
+    values[remaining[is_nothing]] = 'NOTHING'
+    return values
+
+
+def pence_of_values(values, locale=money.DEFAULT_LOCALE):
+    """ The pence of a Series of values, converting each distinct value once. Unlike money.values_to_pence(), the
+        pence keep the types value_to_pence() gives them, so the columns have the same types as those of the loop
+        engine. """
+    distinct = values.dropna().unique()
+    return values.map({value: money.value_to_pence(value, locale) for value in distinct})
+
+
+def in_force(is_heading, values):
+    """ For every line, the value of the last heading of a kind at or before it, e.g. the place of a line is the
+        last place declared. is_heading marks the lines with a heading and values holds the values of those
+        headings, in order. Lines before the first heading have None. """
+    values = np.append(np.asarray(values, dtype=object), [None])
+    return values[np.cumsum(is_heading) - 1]
+
+
+def dates_from_parts(date_parts, start_year):
+    """ The days of the week and YYYY-MM-DD dates from the parts of date headings extracted with pyarrow, the
+        same as date_parts_to_values(). """
+    months = pd.Series(to_numpy(date_parts.field('month')), dtype=object).map(months_numerical)
+    years = pd.Series(np.where(months.isin(['09', '10', '11', '12']), start_year, start_year + 1), dtype=str)
+    days = pd.Series(to_numpy(date_parts.field('day_no')), dtype=object).str.zfill(2)
+    return to_numpy(date_parts.field('weekday')), (years + '-' + months + '-' + days).to_numpy(dtype=object)
+
+
+def roll_dfs_from_lines(lines, start_year=START_YEAR, locale=money.DEFAULT_LOCALE):
+    """ Parse the lines of a transcript with operations on whole columns rather than a loop over the lines. Every
+        line is classified by running the scanner over the column (with pyarrow), the membrane, place, date and
+        term of each line come from the last heading of each kind before it and the values of the entries are
+        extracted a regex at a time. Returns data frames of the entries and daily sums, the same as those made
+        from the records of iter_roll_entries(). The regexes are run by RE2, which only differs from Python's re
+        for non-ASCII digits and spaces. Monetary values are read in the given locale, see money.MONEY_LOCALES. """
+
+    if locale != money.DEFAULT_LOCALE:
+        # fail before any work if there isn't a table for the locale
+        money.money_scanner(locale)
+
+    if pc is None:
+        raise ImportError('The vectorised engine needs pyarrow')
+
+    array = pa.array(lines, type=pa.string())
+
+    # the line numbers and byte offsets
+    line_numbers = np.arange(1, len(array) + 1)
+    line_bytes = to_numpy(pc.binary_length(array)).astype('int64') + 1
+    offsets = np.cumsum(line_bytes) - line_bytes
+
+    # find the headings, sums etc. in one pass, then which kind each is, the first kind that matches wins
+    heading_rows = np.flatnonzero(to_numpy(pc.match_substring_regex(array, '^(?:{})'.format(
+        re2_pattern(line_regex)))))
+    headings = array.take(heading_rows)
+    matches = [to_numpy(pc.match_substring_regex(headings, '^(?:{})'.format(re2_pattern(pattern))))
+               for kind, pattern in LINE_PATTERNS]
+
+    # the kind of each line as a number, the position of its pattern in LINE_PATTERNS (-1 for details)
+    patterns = dict(LINE_PATTERNS)
+    codes = {kind: code for code, (kind, pattern) in enumerate(LINE_PATTERNS)}
+    kind = np.full(len(array), -1, dtype='int8')
+    kind[heading_rows] = np.select(matches, list(range(len(LINE_PATTERNS))), -1)
+
+    # the values of each kind of heading
+    is_membrane = kind == codes[MEMBRANE_LINE]
+    membranes = pc.extract_regex(array.filter(pa.array(is_membrane)), '^' + re2_pattern(patterns[MEMBRANE_LINE]))
+    membranes = to_numpy(pc.cast(membranes.field('membrane_no'), pa.int64()))
+
+    is_place = kind == codes[PLACE_LINE]
+    places = array.filter(pa.array(is_place))
+    places = to_numpy(pc.if_else(pc.match_substring(places, '[DUBLIN]'), 'DUBLIN', pc.utf8_trim_whitespace(places)))
+
+    is_date = kind == codes[DATE_LINE]
+    days, dates = dates_from_parts(pc.extract_regex(array.filter(pa.array(is_date)),
+                                                    '^' + re2_pattern(patterns[DATE_LINE])), start_year)
+
+    # only term headings that name a term change it
+    is_term = kind == codes[TERM_LINE]
+    terms = array.filter(pa.array(is_term))
+    terms = pc.case_when(pc.make_struct(*[pc.match_substring(terms, name) for name in TERM_NAMES]), *TERM_NAMES)
+    is_term[is_term] = to_numpy(terms.is_valid())
+    terms = to_numpy(terms.drop_null())
+
+    # the daily sums
+    sum_rows = np.flatnonzero(kind == codes[DAILY_SUM_LINE])
+    sum_values = pd.Series(to_numpy(pc.utf8_trim_whitespace(pc.list_element(
+        pc.split_pattern(array.take(sum_rows), ':'), 1))), dtype=object)
+    daily_sums_df = pd.DataFrame({common.DATE_COL: in_force(is_date, dates)[sum_rows].tolist(),
+                                  common.VAL_COL: sum_values.tolist(),
+                                  common.PENCE_COL: pence_of_values(sum_values, locale).tolist(),
+                                  common.LINE_COL: line_numbers[sum_rows].tolist(),
+                                  common.OFFSET_COL: offsets[sum_rows].tolist()},
+                                 columns=DAILY_SUMS_COLUMNS)
+
+    # the entries, details after a membrane and place are declared
+    details = pc.utf8_trim_whitespace(array)
+    is_entry = (kind == -1) & (np.cumsum(is_membrane) > 0) & (np.cumsum(is_place) > 0) & \
+        (to_numpy(pc.utf8_length(details)) > 0)
+    entry_rows = np.flatnonzero(is_entry)
+    entry_lines = array.take(entry_rows)
+
+    # entries are numbered from the date heading
+    entry_count = np.cumsum(is_entry)
+    day_entry = entry_count - in_force(is_date, entry_count[is_date]).astype('float64')
+    day_entry = np.where(np.isnan(day_entry), entry_count, day_entry).astype('int64')
+
+    # the value of each entry
+    values = extract_values(entry_lines, locale)
+
+    # 'the same' takes the value of the entry above
+    the_same = pd.isna(values) & to_numpy(pc.match_substring(pc.utf8_lower(entry_lines), 'the same'))
+    values = pd.Series(in_force(~the_same, values[~the_same]), dtype=object)
+
+    # the pence
+    pence = pence_of_values(values, locale)
+
+    # the columns as lists, so their types are inferred just as they are from records
+    entries_df = pd.DataFrame({common.MEM_COL: in_force(is_membrane, membranes)[entry_rows].tolist(),
+                               common.TERM_COL: in_force(is_term, terms)[entry_rows].tolist(),
+                               common.DATE_COL: in_force(is_date, dates)[entry_rows].tolist(),
+                               common.DAY_ENTRY: day_entry[entry_rows].tolist(),
+                               common.DAY_COL: in_force(is_date, days)[entry_rows].tolist(),
+                               common.SOURCE_COL: in_force(is_place, places)[entry_rows].tolist(),
+                               common.DETAILS_COL: details.take(entry_rows).to_pylist(),
+                               common.VAL_COL: values.tolist(),
+                               common.PENCE_COL: pence.tolist(),
+                               common.LINE_COL: line_numbers[entry_rows].tolist(),
+                               common.OFFSET_COL: offsets[entry_rows].tolist()},
+                              columns=DATA_COLUMNS)
+
+    return entries_df, daily_sums_df
+
+
+def parse_roll(engine=LOOP_ENGINE):
+    """ Parse the transcript and write the entries and daily sums to CSV. The engine is either LOOP_ENGINE, which
+        goes line by line, or VECTORISED_ENGINE, which works on whole columns of lines. Both give the same files. """
+
+    if engine == VECTORISED_ENGINE:
+        entries_df, daily_sums_df = roll_dfs_from_lines(read_transcript())
+    elif engine == LOOP_ENGINE:
+        # to hold the data
+        data = []
+        daily_sums = []
+
+        # go through each entry and daily sum in the transcript
+        for record in iter_roll_entries(read_transcript()):
+            if isinstance(record, RollEntry):
+                data.append(record)
+            else:
+                daily_sums.append(record)
+
+        entries_df = pd.DataFrame(data, columns=DATA_COLUMNS)
+        daily_sums_df = daily_sums_df_from_records(daily_sums)
+    else:
+        raise ValueError('Unknown engine {}, expected one of {}'.format(engine, ENGINES))
+
+    # create the data directory if necessary
+    if not os.path.exists(settings.DATA_DIR):
+        os.makedirs(settings.DATA_DIR)
+
+    # write to file (and a typed columnar copy)
+    columnar.write_df(roll_df_from_entries(entries_df), settings.ROLL_CSV)
 
     # use pandas to write the daily sums csv
-    df2 = pd.DataFrame(daily_sums, columns=daily_sums_columns)
-    df2.to_csv(settings.DAILY_SUMS_CSV, index=False)
+    columnar.write_df(daily_sums_df, settings.DAILY_SUMS_CSV)
 
 
 if __name__ == '__main__':
-    parse_roll()
+    parser = argparse.ArgumentParser(description='Parse the transcript of the roll.')
+    parser.add_argument('--engine', choices=ENGINES, default=LOOP_ENGINE, help='how the transcript is parsed')
+    args = parser.parse_args()
+    parse_roll(args.engine)
@@ -0,0 +1,86 @@
+""" Typed, columnar (Parquet) copies of the CSV data sets. The CSV files remain the files we share, but reading
+    a Parquet file is much quicker and it keeps the types of the columns, e.g. categories for the term, day and
+    source, integers for the membrane and real dates. Parquet needs pyarrow; without it only CSV is written.
+
+    The data sets are read with the term, day and source as plain strings unless categories are asked for: grouping by
+    a category column also gives the groups of categories that don't occur (with pandas' default observed=False) and
+    orders the groups by category, which the plots and matrices of the roll don't expect. """
+
+import os
+
+import pandas as pd
+
+from receipt_roll import common
+
+try:
+    import pyarrow  # noqa: F401
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+# columns that hold a small set of repeated values
+CATEGORY_COLUMNS = [common.ROLL_COL, common.TERM_COL, common.DAY_COL, common.SOURCE_COL]
+
+# columns that hold whole numbers, 'Day Entry', 'Line' and 'Offset' are missing for days the Exchequer didn't sit
+INTEGER_COLUMNS = {common.MEM_COL: 'int64', common.DAY_ENTRY: 'Int64', common.WEEK_COL: 'int64',
+                   common.LINE_COL: 'Int64', common.OFFSET_COL: 'Int64'}
+
+
+def typed_df(df):
+    """ Set the types of the columns of one of the data sets, e.g. the roll or daily sums. Pence are kept as
+        floats, which hold the quarter, half and three-quarter pence exactly and which the plots do arithmetic on;
+        money.MoneyArray is only used for a while, where sums must be exact, e.g. roll.daily_sum_from_roll_df(). """
+
+    df = df.copy()
+
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            if column == common.TERM_COL:
+                df[column] = pd.Categorical(df[column], categories=common.TERMS)
+            else:
+                df[column] = df[column].astype('category')
+
+    for column, dtype in INTEGER_COLUMNS.items():
+        if column in df.columns:
+            df[column] = df[column].astype(dtype)
+
+    if common.DATE_COL in df.columns:
+        df[common.DATE_COL] = pd.to_datetime(df[common.DATE_COL], format='%Y-%m-%d')
+
+    if common.PENCE_COL in df.columns:
+        df[common.PENCE_COL] = df[common.PENCE_COL].astype('float64')
+
+    return df
+
+
+def columnar_file(csv_file):
+    """ The Parquet file that sits next to a CSV file, e.g. roll_1301.parquet for roll_1301.csv. """
+    return os.path.splitext(csv_file)[0] + '.parquet'
+
+
+def write_df(df, csv_file):
+    """ Write a data set to CSV and, if we can, a typed Parquet file next to it. """
+    df.to_csv(csv_file, index=False)
+    if HAVE_PYARROW:
+        typed_df(df).to_parquet(columnar_file(csv_file), index=False)
+
+
+def without_categories(df):
+    """ The category columns of a data set as plain strings (object columns), the other types are kept. """
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(object)
+    return df
+
+
+def read_df(csv_file, categories=False):
+    """ Read a typed data set. The Parquet file is preferred if present and at least as new as the CSV file,
+        otherwise the CSV file is read and the types set. The term, day and source are categories only if asked
+        for, where the memory saving matters, otherwise they are strings. """
+    parquet_file = columnar_file(csv_file)
+    if HAVE_PYARROW and os.path.isfile(parquet_file) and \
+            (not os.path.isfile(csv_file) or os.path.getmtime(parquet_file) >= os.path.getmtime(csv_file)):
+        df = pd.read_parquet(parquet_file)
+    else:
+        df = typed_df(pd.read_csv(csv_file))
+    return df if categories else without_categories(df)
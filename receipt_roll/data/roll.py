@@ -3,9 +3,8 @@ from datetime import datetime
 import pandas as pd
 import settings
 from receipt_roll import money, common
+from receipt_roll.data import columnar
 import numpy as np
-import matplotlib.pyplot as plot
-import seaborn as sn
 
 
 def terms_for_index():
@@ -21,7 +20,7 @@ def terms_for_column():
 # ---------- Methods used in apply()
 
 def date_to_period(row, freq='D'):
-    """ 'Date' is a string. Create a Period. Default is year, month and day. """
+    """ 'Date' is a date (or a string). Create a Period. Default is year, month and day. """
     date = row[common.DATE_COL]
     period = pd.Period(date, freq=freq)
     return period
@@ -40,34 +39,38 @@ def date_to_week_freq(row):
 
 
 def roll_as_df():
-    """ Return the CSV file as a pandas data frame"""
-    return pd.read_csv(settings.ROLL_CSV)
+    """ Return the roll data as a typed pandas data frame (from the Parquet file if we have it) """
+    return columnar.read_df(settings.ROLL_CSV)
 
 
 def daily_sums_df():
-    """ Return the CSV file with the daily sums """
-    return pd.read_csv(settings.DAILY_SUMS_CSV)
+    """ Return the daily sums as a typed pandas data frame (from the Parquet file if we have it) """
+    return columnar.read_df(settings.DAILY_SUMS_CSV)
 
 
 def daily_sum_from_roll_df(df):
-    """ Create a new data frame of daily sums in pence and the equivalent £.s.d. from the roll data """
+    """ Create a new data frame of daily sums in pence and the equivalent £.s.d. from the roll data. The sums are
+        exact, they are added up in whole farthings. """
 
-    data = []
-    columns = [common.DATE_COL, common.PENCE_COL, common.PSD_COL]
+    farthings = pd.Series(money.pence_to_farthings(df[common.PENCE_COL]), index=df.index).fillna(0).astype('int64')
+    sums = farthings.groupby(df[common.DATE_COL]).sum()
+    df_sums = pd.DataFrame({common.DATE_COL: sums.index,
+                            common.PENCE_COL: money.MoneyArray(sums.values).to_pence()})
+    df_sums[common.PSD_COL] = money.pence_to_psd_series(df_sums[common.PENCE_COL])
 
-    date_group = df.groupby(common.DATE_COL)
+    return df_sums
 
-    for date, group in date_group:
-        pence = group[common.PENCE_COL].sum()
-        row = [date, pence, money.pence_to_psd(pence)]
-        data.append(row)
 
-    return pd.DataFrame(data, columns=columns)
+def roll_with_entities_df():
+    """ Return the roll with entities as a typed pandas data frame (from the Parquet file if we have it) """
+    return columnar.read_df(settings.ROLL_WITH_ENTITIES_CSV)
 
 
-def roll_with_entities_df():
-    """ Return the CSV file of the roll with entities as a pandas data frame"""
-    return pd.read_csv(settings.ROLL_WITH_ENTITIES_CSV)
+def shorten_source_labels(df):
+    """ Shorten long labels in the 'Source' column. """
+    df[common.SOURCE_COL] = df[common.SOURCE_COL].astype(object).replace(
+        ['ENGLISH DEBTS BY THE MERCHANTS OF LUCCA'], 'MERCHANTS OF LUCCA')
+    return df
 
 
 def compare_daily_sums_df():
@@ -117,7 +120,7 @@ def payments_overview_df():
     df = roll_with_entities_df()
 
     # shorten the label
-    df = df.replace(['ENGLISH DEBTS BY THE MERCHANTS OF LUCCA'], 'MERCHANTS OF LUCCA')
+    df = shorten_source_labels(df)
 
     data = []
 
@@ -136,7 +139,7 @@ def source_term_payments_matrix_df():
     df = roll_with_entities_df()
 
     # shorten the label
-    df = df.replace(['ENGLISH DEBTS BY THE MERCHANTS OF LUCCA'], 'MERCHANTS OF LUCCA')
+    df = shorten_source_labels(df)
 
     # columns
     terms_names = terms_for_column()
@@ -175,7 +178,7 @@ def source_term_payments_pc_matrix_df():
     df = roll_with_entities_df()
 
     # shorten the label
-    df = df.replace(['ENGLISH DEBTS BY THE MERCHANTS OF LUCCA'], 'MERCHANTS OF LUCCA')
+    df = shorten_source_labels(df)
 
     # columns
     terms_names = terms_for_column()
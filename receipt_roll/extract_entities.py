@@ -1,5 +1,14 @@
-from receipt_roll import common
-from nltk import Tree, RegexpParser, word_tokenize, pos_tag, FreqDist
+from receipt_roll import common, nltk_resources, roll_tokenizer, tag_chunker
+from receipt_roll.data import columnar
+from receipt_roll.tag_cache import TagCache
+from receipt_roll.tag_chunker import TagChunker
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import argparse
+import hashlib
+import inspect
+import json
+import os
 import pandas
 import re
 import settings
@@ -37,12 +46,6 @@ PERSON_GRAMMAR_REGEX = "{0}: {{{1}|{2}|{3}}}".format(POSSIBLE_PERSON_LABEL, PERS
 # regex for POS labels that might construct provide a place
 PLACE_GRAMMAR_REGEX = POSSIBLE_PLACE_LABEL + ': { (<NN>|<NNS>)<IN><NNP><NNP>?(<CC><NNP>)?}'
 
-# regex parser for names
-person_parser = RegexpParser(PERSON_GRAMMAR_REGEX)
-
-# regex parser for places
-places_parser = RegexpParser(PLACE_GRAMMAR_REGEX)
-
 # regex to find text in square brackets (TODO: keep these in a custom tagger?)
 square_brackets_regex = re.compile(r'\[.+\]')
 
@@ -52,36 +55,347 @@ psd_regex = re.compile(r'(£\d+\.?)(\d+s\.)?(\d+([¼|½|¾])?d\.)?|(\d+s\.)(\d+(
 # regex for marks
 marks_regex = re.compile(r'((\d+|¼|½|¾|One|one|a)\smark(s?))')
 
+# the number of rows in each task when extracting entities across a pool of worker processes
+CHUNK_ROWS = 200
+
+# the number of details tagged together by pos_tag_sents()
+TAG_BATCH_ROWS = 50
+
+# the number of rows of the roll CSV read at a time when extracting entities
+READ_ROWS = 10000
+
+# the default NLTK tagger
+PERCEPTRON_ENGINE = 'perceptron'
+
+# the tagger trained on the details of the roll, see roll_tagger.py
+ROLL_ENGINE = 'roll'
+
+# the taggers that can tag the details
+TAGGER_ENGINES = [PERCEPTRON_ENGINE, ROLL_ENGINE]
+
+# NLTK's word_tokenize()
+NLTK_TOKENIZER = 'nltk'
+
+# the regex tokenizer for the details of the roll, see roll_tokenizer.py
+ROLL_TOKENIZER = 'roll'
+
+# the tokenizers that can split the details into words
+TOKENIZERS = [NLTK_TOKENIZER, ROLL_TOKENIZER]
+
+# bump if the format of the manifest of the entities CSV changes
+ENTITIES_MANIFEST_VERSION = 2
+
 # Omitted value place-holder
 OVP_LABEL = 'OVP'
 
-# stop words not to be used in keywords
-KEYWORD_STOP_WORDS = load_words_into_array(settings.KEYWORDS_STOP_WORDS_TXT)
 
-# Load a list of words used in the 'Source' column that doesn't represent a geographical areas.
-PLACES_NOUNS = load_words_into_array(settings.PLACES_NOUNS_TXT)
+@lru_cache(maxsize=None)
+def lexicon(words_file):
+    """ The words of a text file, loaded the first time they're needed. """
+    return load_words_into_array(words_file)
+
+
+@lru_cache(maxsize=None)
+def grammar_parser(grammar):
+    """ NLTK's regex parser of a grammar, made the first time it's needed. """
+    from nltk import RegexpParser
+    return RegexpParser(grammar)
+
+
+@lru_cache(maxsize=None)
+def grammar_chunker(grammar):
+    """ The chunker of a grammar, the same chunks as grammar_parser() without building trees, made the first time
+        it's needed. """
+    return TagChunker(grammar)
+
+
+def nltk_name(name):
+    """ A name from NLTK, which is only imported when it's needed. """
+    import nltk
+    return nltk if name == 'nltk' else getattr(nltk, name)
+
+
+# the parsers, chunkers, stop words and NLTK functions that used to be made when the module was imported, they are
+# now made the first time they're used by __getattr__()
+LAZY_NAMES = {
+    # regex parsers for names and places
+    'person_parser': (grammar_parser, PERSON_GRAMMAR_REGEX),
+    'places_parser': (grammar_parser, PLACE_GRAMMAR_REGEX),
+    # chunkers for names and places
+    'person_chunker': (grammar_chunker, PERSON_GRAMMAR_REGEX),
+    'places_chunker': (grammar_chunker, PLACE_GRAMMAR_REGEX),
+    # stop words not to be used in keywords
+    'KEYWORD_STOP_WORDS': (lexicon, settings.KEYWORDS_STOP_WORDS_TXT),
+    # words that come before a place, e.g. 'city' in 'city of Dublin'
+    'PLACES_NOUNS': (lexicon, settings.PLACES_NOUNS_TXT),
+    # words used in the 'Source' column that don't represent a geographical area
+    'SOURCES_STOP_WORDS': (lexicon, settings.SOURCE_STOP_WORDS_TXT),
+    'nltk': (nltk_name, 'nltk'),
+    'Tree': (nltk_name, 'Tree'),
+    'RegexpParser': (nltk_name, 'RegexpParser'),
+    'FreqDist': (nltk_name, 'FreqDist'),
+    'word_tokenize': (nltk_name, 'word_tokenize'),
+    'pos_tag_sents': (nltk_name, 'pos_tag_sents'),
+}
+
+
+def __getattr__(name):
+    """ Make the names in LAZY_NAMES the first time they're used, e.g. extract_entities.person_parser. """
+    if name in LAZY_NAMES:
+        make, arg = LAZY_NAMES[name]
+        return make(arg)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def add_entities_to_data_csv(workers=1, chunk_rows=CHUNK_ROWS, cache_file=settings.TAG_CACHE_DB,
+                             batch_rows=TAG_BATCH_ROWS, read_rows=READ_ROWS, engine=None, tokenizer=None,
+                             incremental=True):
+    """ Take the roll CSV and extract data, and add to additional columns. The CSV is read read_rows at a time and
+        the details are tagged in batches of batch_rows. With more than one worker, the details are tagged in chunks
+        across a pool of worker processes (the number of CPUs if workers is None). Tags are kept in a cache (unless
+        cache_file is None), so details that were tagged before aren't tagged again. The details are split into words
+        by the tokenizer, settings.TOKENIZER by default, and tagged by the engine, settings.TAGGER_ENGINE by
+        default. If incremental, the entities of rows whose details and source haven't changed since the last run
+        are carried over from the previous entities CSV. Returns the number of rows whose entities were
+        extracted. """
+
+    engine = engine or settings.TAGGER_ENGINE
+    tokenizer = tokenizer or settings.TOKENIZER
+    fingerprint = extractor_fingerprint(engine, tokenizer)
+    previous = previous_entities(settings.ROLL_WITH_ENTITIES_CSV, settings.ROLL_ENTITIES_MANIFEST,
+                                 fingerprint) if incremental else {}
+    cache = TagCache(cache_file, tagger_fingerprint(engine, tokenizer)) if cache_file is not None else None
+
+    # extract people, places and keywords from each part of the roll CSV, tagging the details of each row once
+    dfs = []
+    extracted = 0
+    try:
+        for df in pandas.read_csv(settings.ROLL_CSV, chunksize=read_rows):
+            keys = [row_key(*key) for key in zip(df[common.MEM_COL], df[common.DATE_COL], df[common.DAY_ENTRY])]
+            rows = list(zip(df[common.DETAILS_COL], df[common.SOURCE_COL]))
+
+            # only the rows that are new or have changed are extracted
+            entities = carried_entities(keys, rows, previous)
+            changed = [idx for idx, row_entities in enumerate(entities) if row_entities is None]
+            if changed:
+                new_entities = extract_entities_of_rows([rows[idx] for idx in changed], workers, chunk_rows, cache,
+                                                        batch_rows, engine, tokenizer)
+                for idx, row_entities in zip(changed, new_entities):
+                    entities[idx] = row_entities
+            extracted += len(changed)
+
+            add_entity_columns(df, entities)
+            dfs.append(df)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    # write to a CSV file (and a typed columnar copy)
+    columnar.write_df(pandas.concat(dfs, ignore_index=True), settings.ROLL_WITH_ENTITIES_CSV)
+    save_entities_manifest(fingerprint, settings.ROLL_ENTITIES_MANIFEST)
+
+    return extracted
+
+
+def row_key(membrane, date, day_entry):
+    """ The key of a row of the roll, which doesn't change when the details are edited. Days the Exchequer didn't
+        sit have no day entry, and one row. """
+    return int(membrane), date, None if pandas.isna(day_entry) else int(day_entry)
+
+
+def row_hash(details, source):
+    """ A hash of the text the entities of a row are extracted from. """
+    return hashlib.sha1('{}\n{}'.format(details, source).encode('utf-8')).hexdigest()
+
+
+def extractor_fingerprint(engine=None, tokenizer=None):
+    """ Identifies the tagger (see tagger_fingerprint()), the rules that find the entities in the tags and the word
+        lists they use. Entities extracted by any others are out of date. """
+    digest = hashlib.sha1(tagger_fingerprint(engine, tokenizer).encode('utf-8'))
+    for path in (__file__, tag_chunker.__file__, settings.KEYWORDS_STOP_WORDS_TXT, settings.PLACES_NOUNS_TXT,
+                 settings.SOURCE_STOP_WORDS_TXT):
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def save_entities_manifest(fingerprint, manifest_file):
+    """ Record the extractor that made the entities CSV. """
+    with open(manifest_file, 'w', encoding='utf-8') as file:
+        json.dump({'version': ENTITIES_MANIFEST_VERSION, 'extractor': fingerprint}, file)
+
+
+def previous_entities(entities_csv, manifest_file, fingerprint):
+    """ The row hash and the people, places and keywords of each row of the previous entities CSV, by row key.
+        Empty if there isn't one or it was made by another extractor (or its manifest is missing). """
+    if not os.path.isfile(entities_csv) or not os.path.isfile(manifest_file):
+        return {}
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except ValueError:
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('version') != ENTITIES_MANIFEST_VERSION or \
+            manifest.get('extractor') != fingerprint:
+        return {}
+
+    df = pandas.read_csv(entities_csv)
+    columns = [df[column] for column in (common.MEM_COL, common.DATE_COL, common.DAY_ENTRY, common.DETAILS_COL,
+                                         common.SOURCE_COL, common.PEOPLE_COL, common.PLACES_COL,
+                                         common.KEYWORDS_COL)]
+    return {row_key(membrane, date, day_entry): (row_hash(details, source), people, places, keywords)
+            for membrane, date, day_entry, details, source, people, places, keywords in zip(*columns)}
+
+
+def carried_entities(keys, rows, previous):
+    """ The people, places and keywords of each (details, source) row carried over from the previous run, or None
+        for the rows that are new or have changed. """
+    entities = []
+    for key, (details, source) in zip(keys, rows):
+        row_entities = previous.get(key)
+        if row_entities is not None and row_entities[0] == row_hash(details, source):
+            entities.append(row_entities[1:])
+        else:
+            entities.append(None)
+    return entities
+
+
+def tagger_fingerprint(engine=None, tokenizer=None):
+    """ Identifies the tokenizer, tagger and the rules of tidy_tuples(), the tags in a TagCache made by any others
+        are out of date. The roll tagger is also identified by its model, which changes when it's trained again, and
+        the roll tokenizer by its rules. """
+    import nltk
+
+    engine = engine or settings.TAGGER_ENGINE
+    tokenizer = tokenizer or settings.TOKENIZER
+    digest = hashlib.sha1()
+    for part in (nltk.__version__, nltk.word_tokenize.__module__, nltk.pos_tag_sents.__module__,
+                 inspect.getsource(tidy_tuples), engine, tokenizer):
+        digest.update(part.encode('utf-8'))
+    if tokenizer == ROLL_TOKENIZER:
+        for part in (roll_tokenizer.token_regex.pattern, inspect.getsource(roll_tokenizer.roll_tokenize)):
+            digest.update(part.encode('utf-8'))
+    if engine == ROLL_ENGINE:
+        with open(settings.ROLL_TAGGER_MODEL, 'rb') as model_file:
+            digest.update(model_file.read())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def roll_tagger(model_file):
+    """ The tagger trained on the details of the roll, loaded once in each process. """
+    from receipt_roll.roll_tagger import RollTagger
+    return RollTagger.load(model_file)
+
+
+def sentence_tagger(engine=None):
+    """ The function that tags a list of sentences of an engine, settings.TAGGER_ENGINE by default. """
+    engine = engine or settings.TAGGER_ENGINE
+    if engine == PERCEPTRON_ENGINE:
+        from nltk import pos_tag_sents
+        nltk_resources.use_data_dir()
+        return pos_tag_sents
+    if engine == ROLL_ENGINE:
+        return roll_tagger(settings.ROLL_TAGGER_MODEL).tag_sents
+    raise ValueError('Unknown tagger engine {}, expected one of {}'.format(engine, TAGGER_ENGINES))
+
+
+def word_tokenizer(tokenizer=None):
+    """ The function that splits a text into words of a tokenizer, settings.TOKENIZER by default. """
+    tokenizer = tokenizer or settings.TOKENIZER
+    if tokenizer == NLTK_TOKENIZER:
+        from nltk import word_tokenize
+        nltk_resources.use_data_dir()
+        return word_tokenize
+    if tokenizer == ROLL_TOKENIZER:
+        return roll_tokenizer.roll_tokenize
+    raise ValueError('Unknown tokenizer {}, expected one of {}'.format(tokenizer, TOKENIZERS))
+
+
+def warm_tagger(engine=None, tokenizer=None):
+    """ Load the tokenizer and tagger models by tagging an entry. It's called before the pool of workers is created,
+        so forked workers start with the models loaded, and in each worker in case they are spawned instead. """
+    tag_chunk([clean_details('Richard fitz John, ½ mark to have a writ.')], engine=engine, tokenizer=tokenizer)
+
+
+def tag_chunk(texts, batch_rows=TAG_BATCH_ROWS, engine=None, tokenizer=None):
+    """ The tags of each of a chunk of cleaned details (run in a worker process). The details are tagged in batches,
+        which is quicker than one at a time and gives the same tags. """
+
+    # tokenize the sentences
+    tokenize = word_tokenizer(tokenizer)
+    tokens = [tokenize(text) for text in texts]
+
+    # use the tagger, then tidy up
+    tag_sents = sentence_tagger(engine)
+    tagged = []
+    for start in range(0, len(tokens), batch_rows):
+        tagged.extend(tidy_tuples(tags) for tags in tag_sents(tokens[start:start + batch_rows]))
+    return tagged
+
+
+def tag_cleaned_texts(texts, workers=1, chunk_rows=CHUNK_ROWS, cache=None, batch_rows=TAG_BATCH_ROWS, engine=None,
+                      tokenizer=None):
+    """ The tags of cleaned details, as a dictionary of text to a list of (word, tag). Each distinct text is tagged
+        once, and not at all if it's in the cache. New tags are added to the cache. """
+
+    engine = engine or settings.TAGGER_ENGINE
+    tokenizer = tokenizer or settings.TOKENIZER
+
+    distinct = list(dict.fromkeys(texts))
+    tagged = cache.get_many(distinct) if cache is not None else {}
+    missing = [text for text in distinct if text not in tagged]
+
+    if workers == 1 or len(missing) <= chunk_rows:
+        new_tags = tag_chunk(missing, batch_rows, engine, tokenizer)
+    else:
+        chunks = [missing[start:start + chunk_rows] for start in range(0, len(missing), chunk_rows)]
+        warm_tagger(engine, tokenizer)
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_tagger,
+                                 initargs=(engine, tokenizer)) as executor:
+            # results come back in the same order as the chunks
+            new_tags = [tags for chunk in executor.map(tag_chunk, chunks, [batch_rows] * len(chunks),
+                                                       [engine] * len(chunks), [tokenizer] * len(chunks))
+                        for tags in chunk]
 
-# Load a list of words used in the 'Source' column that doesn't represent a geographical areas
-SOURCES_STOP_WORDS = load_words_into_array(settings.SOURCE_STOP_WORDS_TXT)
+    new_tagged = dict(zip(missing, new_tags))
+    if cache is not None and new_tagged:
+        cache.put_many(new_tagged)
 
+    tagged.update(new_tagged)
+    return tagged
 
-def add_entities_to_data_csv():
-    """ Take the roll CSV and extract data, and add to additional columns. """
 
-    # open the roll CSV
-    df = pandas.read_csv(settings.ROLL_CSV)
+def extract_entities_of_rows(rows, workers=1, chunk_rows=CHUNK_ROWS, cache=None, batch_rows=TAG_BATCH_ROWS,
+                             engine=None, tokenizer=None):
+    """ The people, places and keywords of each (details, source) row, in the same order as the rows and the same
+        however many worker processes are used and whether or not the tags come from a cache. """
+
+    cleaned = [clean_details(details) for details, source in rows]
+    tagged = tag_cleaned_texts(cleaned, workers, chunk_rows, cache, batch_rows, engine, tokenizer)
+    return [entities_from_tagged(tagged[text], source) for text, (details, source) in zip(cleaned, rows)]
+
+
+def add_entity_columns(df, entities):
+    """ Add the people, places and keywords of each row, as returned by extract_row_entities(), to the data frame. """
+    people, places, keywords = (list(column) for column in zip(*entities)) if entities else ([], [], [])
+    df[common.PEOPLE_COL] = people
+    df[common.PLACES_COL] = places
+    df[common.KEYWORDS_COL] = keywords
 
-    # extract people
-    df[common.PEOPLE_COL] = df.apply(apply_extract_people, axis=1)
 
-    # extract places
-    df[common.PLACES_COL] = df.apply(apply_extract_places, axis=1)
+def extract_row_entities(details, source):
+    """ The people, places and keywords of a row of the roll. The details are cleaned, tokenized and tagged once,
+        and the three are extracted from the same tags. """
+    return entities_from_tagged(tokenize_tag_text(details), source)
 
-    # extract keywords
-    df[common.KEYWORDS_COL] = df.apply(extract_keywords, axis=1)
 
-    # write to a CSV file
-    df.to_csv(settings.ROLL_WITH_ENTITIES_CSV, index=False)
+def entities_from_tagged(tagged, source):
+    """ The people, places and keywords in the tagged details of a row. """
+    people = people_from_tagged(tagged)
+    places = join_places(places_from_tagged(tagged), source, people)
+    keywords = keywords_from_tagged(tagged)
+    return people, places, keywords
 
 
 def apply_extract_people(row):
@@ -100,11 +414,15 @@ def apply_extract_places(row):
     # extract the details
     places = extract_places(details)
 
-    # get the source since it night be place
-    area_place = row[common.SOURCE_COL]
+    return join_places(places, row[common.SOURCE_COL], row[common.PEOPLE_COL])
+
+
+def join_places(places, area_place, people):
+    """ Add the source, since it might be a place, and the toponyms of the people to the places found in the
+        details, and join them into a string delimited by a semicolon. """
 
     # only process if not a stop word
-    if area_place not in SOURCES_STOP_WORDS:
+    if area_place not in lexicon(settings.SOURCE_STOP_WORDS_TXT):
 
         # transform to title case
         area_place = area_place.title()
@@ -114,7 +432,7 @@ def apply_extract_places(row):
             places.append(area_place)
 
     # lets add toponyms in people to the mix ...
-    toponyms = extract_place_from_toponym(row[common.PEOPLE_COL])
+    toponyms = extract_place_from_toponym(people)
 
     # return the values as a string delimited by a semicolon
     return ';'.join(places + toponyms)
@@ -154,57 +472,51 @@ def tidy_tuples(tuple_array):
     return results
 
 
-def tokenize_tag_text(text):
+def tokenize_tag_text(text, engine=None, tokenizer=None):
     """ Create a POS tag so we can make an educated (ha!) guess about what it us referring to.
-        Take the details text from the roll, clean it up, POS tag it, and then correct the tagging if necessary. """
-
-    # clean the text for tagging
-    cleaned_text = clean_details(text)
+        Take the details text from the roll, clean it up, POS tag it, and then correct the tagging if necessary.
+        Returns a list of (word, tag), which the chunkers take as it is. The tokenizer and tagger engine are
+        settings.TOKENIZER and settings.TAGGER_ENGINE by default. """
 
-    # tokenize the sentence
-    tokens = word_tokenize(cleaned_text)
+    # clean the text for tagging, tag it and return
+    return tag_cleaned_text(clean_details(text), engine, tokenizer)
 
-    # use the default tagger
-    tagged = pos_tag(tokens)
 
-    # tidy up and return
-    return Tree(1, tidy_tuples(tagged))
+def tag_cleaned_text(cleaned_text, engine=None, tokenizer=None):
+    """ The tidied tags, a list of (word, tag), of details cleaned by clean_details(). """
+    return tag_chunk([cleaned_text], engine=engine, tokenizer=tokenizer)[0]
 
 
-def extract_people(text):
+def extract_people(text, engine=None, tokenizer=None):
     """ Take an entry from the roll and try and extract any personal names. We use the default NLTK POS tagger
       to identify nouns, prepositions etc. We then use a regex to find patterns that might be personal names,
       such as toponyms. """
+    return people_from_tagged(tokenize_tag_text(text, engine, tokenizer))
 
-    # turn into tokens
-    tokens = tokenize_tag_text(text)
 
-    # parse the tag into chunks ...
-    chunked = person_parser.parse(tokens)
+def people_from_tagged(tokens):
+    """ The personal names in the tagged tokens of an entry, see extract_people(). """
 
     # hold any people we find
     people = []
 
-    # traverse the chunks to find the names
-    for child in chunked:
-        if isinstance(child, Tree):
-            # chunk tagged as name
-            if child.label() == POSSIBLE_PERSON_LABEL:
-                # reconstruct the name
-                name = []
-                for num in range(len(child)):
-                    if child[num][1] == 'CC':
-                        people.append(' '.join(name))
-                        name.clear()
-                    else:
-                        name.append(child[num][0])
-                # if we have the bits of name, reconstruct
-                if len(name) > 0:
-                    # if the last item is a comma or full stop, drop it
-                    if name[-1] == ',' or name[-1] == '.':
-                        name = name[:-1]
-                    # remove any space preceding commas
-                    people.append(' '.join(name).replace(' , ', ', '))
+    # traverse the chunks tagged as names
+    for chunk in grammar_chunker(PERSON_GRAMMAR_REGEX).chunks(tokens):
+        # reconstruct the name
+        name = []
+        for word, tag in chunk:
+            if tag == 'CC':
+                people.append(' '.join(name))
+                name.clear()
+            else:
+                name.append(word)
+        # if we have the bits of name, reconstruct
+        if len(name) > 0:
+            # if the last item is a comma or full stop, drop it
+            if name[-1] == ',' or name[-1] == '.':
+                name = name[:-1]
+            # remove any space preceding commas
+            people.append(' '.join(name).replace(' , ', ', '))
 
     if len(people) > 0:
         if 'others' in people:
@@ -218,44 +530,41 @@ def extract_places(text):
     """ Take an entry from the roll and try and extract any places. We use the default NLTK POS tagger
         to identify nouns, prepositions etc. We then use a regex to find patterns that might be places
         by looking at nearby nouns, such as 'city' in 'city of Dublin'. """
+    return places_from_tagged(tokenize_tag_text(text))
 
-    # turn into tokens
-    tokens = tokenize_tag_text(text)
 
-    # parse the tag into chunks ...
-    chunked = places_parser.parse(tokens)
+def places_from_tagged(tokens):
+    """ The places in the tagged tokens of an entry, see extract_places(). """
 
     # hold places
     places = []
 
-    # traverse the chunks to find the places
-    for child in chunked:
-        if isinstance(child, Tree):
-            # chunk tagged as name
-            if child.label() == POSSIBLE_PLACE_LABEL:
-                # print(text + " --> " + child[0][0])
-                if child[0][0] in PLACES_NOUNS:
-                    place = []
-                    for num in range(len(child)):
-                        if child[num][1] == 'NNP':
-                            place.append(child[num][0])
-                        # if we have 'and' then it might be talking about more than one place
-                        elif child[num][1] == 'CC':
-                            places.append(' '.join(place))
-                            place.clear()
-
-                    if len(place) > 0:
-                        places.append(' '.join(place))
+    # traverse the chunks tagged as places
+    places_nouns = lexicon(settings.PLACES_NOUNS_TXT)
+    for chunk in grammar_chunker(PLACE_GRAMMAR_REGEX).chunks(tokens):
+        if chunk[0][0] in places_nouns:
+            place = []
+            for word, tag in chunk:
+                if tag == 'NNP':
+                    place.append(word)
+                # if we have 'and' then it might be talking about more than one place
+                elif tag == 'CC':
+                    places.append(' '.join(place))
+                    place.clear()
+
+            if len(place) > 0:
+                places.append(' '.join(place))
 
     return places
 
 
 def extract_keywords(row):
     """ Extract nouns as keywords. """
+    return keywords_from_tagged(tokenize_tag_text(row[common.DETAILS_COL]))
 
-    details = row[common.DETAILS_COL]
 
-    tokens_pos = tokenize_tag_text(details)
+def keywords_from_tagged(tokens_pos):
+    """ The keywords (nouns) in the tagged tokens of an entry. """
 
     # get the type of words we are interested in
     keywords = [word for word, word_type in tokens_pos if word_type in ['NN', 'NNS']]
@@ -267,7 +576,8 @@ def extract_keywords(row):
     keywords = [keyword for keyword in keywords if len(keyword) > 1]
 
     # remove stop words
-    keywords = [keyword for keyword in keywords if keyword not in KEYWORD_STOP_WORDS]
+    stop_words = lexicon(settings.KEYWORDS_STOP_WORDS_TXT)
+    keywords = [keyword for keyword in keywords if keyword not in stop_words]
 
     return ';'.join(keywords)
 
@@ -300,8 +610,10 @@ def create_details_corpus():
 
 
 def details_word_frequency():
+    from nltk import FreqDist
+
     raw = open(settings.DETAILS_TEXT_CORPUS).read()
-    tokens = word_tokenize(raw)
+    tokens = word_tokenizer(NLTK_TOKENIZER)(raw)
 
     # remove single letter tokens, usually punctuation
     tokens = [token for token in tokens if len(token) > 1]
@@ -310,7 +622,8 @@ def details_word_frequency():
 
     tokens = [token.lower() for token in tokens]
 
-    tokens = [token for token in tokens if token not in KEYWORD_STOP_WORDS]
+    stop_words = lexicon(settings.KEYWORDS_STOP_WORDS_TXT)
+    tokens = [token for token in tokens if token not in stop_words]
 
     freq = FreqDist(tokens)
 
@@ -319,4 +632,17 @@ def details_word_frequency():
 
 
 if __name__ == '__main__':
-    add_entities_to_data_csv()
+    parser = argparse.ArgumentParser(description='Extract people, places and keywords from the roll.')
+    parser.add_argument('--workers', type=int, default=1, help='number of worker processes (0 for one per CPU)')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='rows in each task of a worker')
+    parser.add_argument('--no-cache', action='store_true', help="don't use or update the cache of tags")
+    parser.add_argument('--batch-rows', type=int, default=TAG_BATCH_ROWS, help='details tagged together')
+    parser.add_argument('--read-rows', type=int, default=READ_ROWS, help='rows of the roll CSV read at a time')
+    parser.add_argument('--tagger', choices=TAGGER_ENGINES, default=settings.TAGGER_ENGINE, help='POS tagger')
+    parser.add_argument('--tokenizer', choices=TOKENIZERS, default=settings.TOKENIZER, help='word tokenizer')
+    parser.add_argument('--full', action='store_true', help='extract the entities of every row, not just changed rows')
+    args = parser.parse_args()
+    extracted = add_entities_to_data_csv(args.workers or None, args.chunk_rows,
+                                         None if args.no_cache else settings.TAG_CACHE_DB, args.batch_rows,
+                                         args.read_rows, args.tagger, args.tokenizer, not args.full)
+    print('Extracted the entities of {} row(s)'.format(extracted))
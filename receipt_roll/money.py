@@ -1,7 +1,17 @@
 """ Helper module for extracting monetary values from the transcript, normalising to pennies and
     converting back to pound, shilling and pence."""
 
+import functools
 import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray, ExtensionDtype, register_extension_dtype, take
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import is_integer, is_list_like
+
+import settings
 
 # convert shillings, pounds and marks to pence
 shilling_as_pence = 12
@@ -26,6 +36,311 @@ d_regex = re.compile(r'(((\d+)(¼|½|¾)?)d\.)')
 # pound
 p_regex = re.compile(r'(£(\d+))')
 
+# the decimal value of the vulgar fractions
+VULGAR_FRACTIONS = {'¼': 0.25, '½': 0.5, '¾': 0.75}
+
+
+# ---------- Denomination tables
+
+# a unit of money, its value in pence and the ways it is written. A prefix, like '£', is written before the number
+# and a unit that can stand alone, like 'ob.' (a halfpenny), can be written without one. A number can have a vulgar
+# fraction, e.g. '4½', and a count can also be a fraction, a word or a roman numeral on its own, e.g. '½ mark'. In
+# the forms of a locale, the gap is the text between the number and the unit and the joiner the text after a term
+# when another term follows, e.g. the '.' after '£8' in '£8.13s.'.
+Denomination = namedtuple('Denomination', ['unit', 'pence', 'spellings', 'prefix', 'alone', 'fraction', 'count',
+                                           'gap', 'joiner'], defaults=[False, False, True, True, r'\s*', ''])
+
+# the denominations of a locale, the words it uses for numbers and to join amounts, and if numbers can be written as
+# roman numerals. Without forms, an amount is a run of terms and the first in the text is the value. The forms are
+# the units an amount can be written in, in order of precedence: the form that comes first wins wherever it is in
+# the text and, of those, the first in the text. Numbers and units are whole words, and number words in any case,
+# unless whole_words is False, when they are found exactly as written, even inside a word.
+MoneyLocale = namedtuple('MoneyLocale', ['denominations', 'number_words', 'conjunctions', 'roman', 'forms',
+                                         'whole_words'], defaults=[None, True])
+
+# the locale of the 1301/2 roll
+DEFAULT_LOCALE = 'en'
+
+# the denominations of each locale, a new locale only needs a new table. The English forms are the kinds of value
+# of the regexes above, found as they are, e.g. 'a mark' in 'Ida mark', and marks are preferred wherever they are.
+MONEY_LOCALES = {
+    'en': MoneyLocale(
+        denominations=[
+            Denomination('pound', pound_as_pence, ['£'], prefix=True, fraction=False, count=False, gap='',
+                         joiner=r'\.'),
+            Denomination('mark', mark_as_pence, ['mark', 'marks'], fraction=False, gap=r'\s'),
+            Denomination('shilling', shilling_as_pence, ['s.'], fraction=False, count=False, gap=''),
+            Denomination('penny', 1, ['d.'], count=False, gap='')],
+        number_words={'One': 1, 'one': 1, 'a': 1}, conjunctions=[], roman=False,
+        forms=[('marks', ['mark']), ('psd', ['pound', 'shilling', 'penny']), ('ps', ['pound', 'shilling']),
+               ('pd', ['pound', 'penny']), ('sd', ['shilling', 'penny']), ('s', ['shilling']), ('d', ['penny']),
+               ('p', ['pound'])],
+        whole_words=False),
+    'la': MoneyLocale(
+        denominations=[
+            Denomination('pound', pound_as_pence, ['li.', 'lib.', 'libr.', 'librae', 'libras', 'libris']),
+            Denomination('mark', mark_as_pence, ['marc.', 'marca', 'marcae', 'marcam', 'marcas', 'marcis']),
+            Denomination('shilling', shilling_as_pence, ['s.', 'sol.', 'solidi', 'solidos', 'solidis']),
+            Denomination('penny', 1, ['d.', 'den.', 'denarii', 'denarios', 'denariis']),
+            Denomination('halfpenny', 0.5, ['ob.', 'obolus', 'obolum'], alone=True),
+            Denomination('farthing', 0.25, ['qua.', 'quad.', 'quadrans', 'quadrantem'], alone=True)],
+        number_words={'una': 1, 'unam': 1, 'di.': 0.5, 'dimidia': 0.5, 'dimidiam': 0.5}, conjunctions=['et'],
+        roman=True)}
+
+# the values of roman numerals, 'j' is a final 'i', e.g. 'iiij'
+ROMAN_NUMERALS = {'i': 1, 'j': 1, 'v': 5, 'x': 10, 'l': 50, 'c': 100, 'm': 1000}
+
+# not next to a letter, so a unit or number isn't found inside a word
+NOT_AFTER_LETTER = r'(?<![^\W\d_¼½¾])'
+NOT_BEFORE_LETTER = r'(?![^\W\d_¼½¾])'
+
+# a scanner for the forms of a locale. At every place a value could start, each form is tried in order of
+# precedence in a lookahead, so every value in the text is found, even one that starts inside another, e.g.
+# '20 marks' in '£20 marks'. The scanner consumes the first character of a value, so re can skip quickly to the
+# characters a value starts with, and looks behind it for the value. A value that starts inside a number would also
+# match from the start of the number, so only the first digit of a number is tried.
+MONEY_SCANNER_PATTERN = r'{}(?<=(?:(?<!\d)|(?!\d))(?:{}).)'
+
+
+def trie_pattern(words):
+    """ A regex that matches any of the words, built as a trie so each character is tried once however many words
+        there are, e.g. ['marc.', 'marca', 'marcas'] gives 'marc(?:\\.|a(?:s)?)'. The longest word is preferred. """
+
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def node_pattern(node):
+        branches = [re.escape(char) + node_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:{})'.format('|'.join(branches))
+        return '(?:{})?'.format(pattern) if '' in node else pattern
+
+    return node_pattern(trie)
+
+
+def roman_to_int(numeral):
+    """ The value of a roman numeral, e.g. 'xiiij' is 14. """
+    values = [ROMAN_NUMERALS[char] for char in numeral.lower()]
+    return sum(-value if value < following else value for value, following in zip(values, values[1:] + [0]))
+
+
+class MoneyScanner(object):
+    """ Finds amounts of money written in the denominations of a locale, e.g. '£8.13s.4d.' in English or
+        'xx li. xiii s. iiii d. ob.' in Latin. The spellings of all the denominations are compiled into one regex, as
+        a trie, so a scan doesn't get slower as the tables grow. An amount is a run of terms, each a number and a
+        denomination, or, if the locale has forms, the best of its forms in the text. """
+
+    def __init__(self, money_locale):
+        self.denominations = {spelling: denomination for denomination in money_locale.denominations
+                              for spelling in denomination.spellings}
+        self.number_words = money_locale.number_words
+        self.roman = money_locale.roman
+        self.whole_words = money_locale.whole_words
+        self.forms = money_locale.forms
+
+        if self.forms is not None:
+            self.compile_forms(money_locale)
+            return
+
+        def spellings(denominations):
+            return self.spellings_pattern(spelling for denomination in denominations
+                                          for spelling in denomination.spellings)
+
+        prefixes = [denomination for denomination in money_locale.denominations if denomination.prefix]
+        suffixes = [denomination for denomination in money_locale.denominations if not denomination.prefix]
+        alone = [denomination for denomination in money_locale.denominations if denomination.alone]
+        number = self.number_pattern(any(denomination.fraction for denomination in money_locale.denominations),
+                                     any(denomination.count for denomination in money_locale.denominations))
+
+        terms = []
+        if prefixes:
+            terms.append(r'(?P<prefix>{})\s*(?P<prefix_number>{})'.format(spellings(prefixes), number))
+        if suffixes:
+            terms.append(r'(?P<number>{})\s*(?P<suffix>{})'.format(number, spellings(suffixes)))
+        if alone:
+            terms.append(r'{}(?P<alone>{})'.format(NOT_AFTER_LETTER, spellings(alone)))
+        self.term_regex = re.compile('|'.join(terms))
+
+        # the text between the terms of an amount, e.g. '.' in '£8.13s.' or ' et ' in 'xx s. et vi d.'
+        conjunctions = r'(?:(?i:{}){}\s*)?'.format(trie_pattern(money_locale.conjunctions), NOT_BEFORE_LETTER) \
+            if money_locale.conjunctions else ''
+        self.separator_regex = re.compile(r'[.,]?\s*' + conjunctions)
+
+    def number_pattern(self, fraction, count):
+        """ A regex for a number in digits, with a vulgar fraction if fraction, and if count a vulgar fraction, word
+            or roman numeral on its own. Digits can be followed by their unit, e.g. '6s.'. """
+        numbers = [r'\d+[¼½¾]?' if fraction else r'\d+']
+        if count:
+            numbers.append('[¼½¾]')
+            words = [trie_pattern(self.number_words)] if self.number_words else []
+            if self.roman:
+                words.append('[{}]+'.format(''.join(ROMAN_NUMERALS)))
+            if words and self.whole_words:
+                numbers.append('(?i:{}){}'.format('|'.join(words), NOT_BEFORE_LETTER))
+            elif words:
+                numbers.append('|'.join(words))
+        if self.whole_words:
+            return '{}(?:{})'.format(NOT_AFTER_LETTER, '|'.join(numbers))
+        return '|'.join(numbers)
+
+    def spellings_pattern(self, spellings):
+        return '(?:{}){}'.format(trie_pattern(spellings), NOT_BEFORE_LETTER if self.whole_words else '')
+
+    def compile_forms(self, money_locale):
+        """ Compile a regex for each form, with a group for the number of each of its terms, e.g. 'psd_0' for the
+            pounds of '£8.13s.4d.'. The scanners of the forms in a text are compiled as they are needed. """
+        units = {denomination.unit: denomination for denomination in money_locale.denominations}
+
+        self.form_patterns = []
+        self.form_terms = {}
+        for kind, form in self.forms:
+            pattern = ''
+            for idx, denomination in enumerate(units[unit] for unit in form):
+                number = '(?P<{}_{}>{})'.format(kind, idx, self.number_pattern(denomination.fraction,
+                                                                               denomination.count))
+                spelling = self.spellings_pattern(denomination.spellings)
+                pattern += spelling + denomination.gap + number if denomination.prefix else \
+                    number + denomination.gap + spelling
+                if idx < len(form) - 1:
+                    pattern += denomination.joiner
+            self.form_patterns.append((kind, pattern))
+            self.form_terms[kind] = [('{}_{}'.format(kind, idx), units[unit].pence) for idx, unit in enumerate(form)]
+
+        self.precedence = {kind: idx for idx, (kind, form) in enumerate(self.forms)}
+
+        # a value on its own, as value_pence() reads it, the forms are tried in order of precedence
+        self.value_regex = re.compile('^(?:{})'.format('|'.join(
+            '(?P<{}>{})'.format(kind, pattern) for kind, pattern in self.form_patterns)))
+
+        # the shortest spellings of each unit, a form can only be in a text that has one of each of its units
+        self.clues = [(spelling, unit) for unit, denomination in units.items() for spelling in denomination.spellings
+                      if not any(other != spelling and other in spelling for other in denomination.spellings)]
+        self.form_units = [(kind, set(form)) for kind, form in self.forms]
+
+        # the characters the first term of each form can start with
+        self.start_chars = {}
+        for kind, form in self.forms:
+            denomination = units[form[0]]
+            if denomination.prefix:
+                chars = {spelling[0] for spelling in denomination.spellings}
+            else:
+                chars = {'\\d'}
+                if denomination.count:
+                    chars.update(VULGAR_FRACTIONS)
+                    words = list(self.number_words) + (list(ROMAN_NUMERALS) if self.roman else [])
+                    chars.update(word[0] for word in words)
+                    if self.whole_words:
+                        chars.update(word[0].upper() for word in words)
+            self.start_chars[kind] = chars
+
+        self.form_scanners = {}
+
+    def form_scanner(self, text):
+        """ The scanner of the forms that can be in the text and the precedence of the best of them, or None if there
+            aren't any. The scanners are compiled once for each set of units spelled in a text. """
+        key = tuple([spelling in text for spelling, unit in self.clues])
+        if key not in self.form_scanners:
+            spelled = {unit for (spelling, unit), found in zip(self.clues, key) if found}
+            kinds = [kind for kind, units in self.form_units if units <= spelled]
+            scanner = None
+            if kinds:
+                chars = set().union(*(self.start_chars[kind] for kind in kinds))
+                start = '[{}]'.format(''.join(char if char == '\\d' else re.escape(char) for char in sorted(chars)))
+                scanner = re.compile(MONEY_SCANNER_PATTERN.format(start, '|'.join(
+                    '(?=(?P<{}>{}))'.format(kind, pattern) for kind, pattern in self.form_patterns if kind in kinds)))
+                scanner = scanner, self.precedence[kinds[0]]
+            self.form_scanners[key] = scanner
+        return self.form_scanners[key]
+
+    def number_value(self, number):
+        """ The value of a number, in digits (with a vulgar fraction), a word or roman numerals. """
+        if number[0].isdigit():
+            return int(number[:-1]) + VULGAR_FRACTIONS[number[-1]] if number[-1] in VULGAR_FRACTIONS else int(number)
+        elif number in VULGAR_FRACTIONS:
+            return VULGAR_FRACTIONS[number]
+        elif number.lower() in self.number_words:
+            return self.number_words[number.lower()]
+        return roman_to_int(number)
+
+    def term_pence(self, match):
+        groups = match.groupdict()
+        if groups.get('prefix'):
+            return self.number_value(groups['prefix_number']) * self.denominations[groups['prefix']].pence
+        elif groups.get('suffix'):
+            return self.number_value(groups['number']) * self.denominations[groups['suffix']].pence
+        return self.denominations[groups['alone']].pence
+
+    def form_pence(self, kind, match):
+        """ The pence of a form found by the regex of a form, its terms added up. """
+        return sum(self.number_value(match.group(group)) * pence for group, pence in self.form_terms[kind])
+
+    def scan(self, text):
+        """ The value in the text, its value in pence and its span, or (None, None, None). """
+        if self.forms is not None:
+            return self.scan_forms(text)
+
+        match = self.term_regex.search(text)
+        if match is None:
+            return None, None, None
+
+        start = match.start()
+        end = match.end()
+        pennies = self.term_pence(match)
+
+        # add up the terms that follow on
+        while True:
+            match = self.term_regex.match(text, self.separator_regex.match(text, end).end())
+            if match is None or match.start() == match.end():
+                break
+            pennies += self.term_pence(match)
+            end = match.end()
+
+        return text[start:end], pennies, (start, end)
+
+    def scan_forms(self, text):
+        """ The form that comes first in precedence and, of those, the first in the text. """
+        scanner = self.form_scanner(text)
+        if scanner is None:
+            return None, None, None
+        scanner, first = scanner
+
+        best = None
+        best_precedence = len(self.forms)
+        for match in scanner.finditer(text):
+            precedence = self.precedence[match.lastgroup]
+            if precedence < best_precedence:
+                best = match
+                best_precedence = precedence
+                # nothing in the text comes before it
+                if precedence == first:
+                    break
+
+        if best is None:
+            return None, None, None
+        kind = best.lastgroup
+        return best.group(kind), self.form_pence(kind, best), best.span(kind)
+
+    def value_pence(self, value):
+        """ The pence of a value on its own, e.g. '£8.13s.4d.', or None. With forms the value starts with the form
+            that comes first in precedence, otherwise it is the first amount in the value. """
+        if self.forms is None:
+            return self.scan(value)[1]
+        match = self.value_regex.match(value)
+        return None if match is None else self.form_pence(match.lastgroup, match)
+
+
+@functools.lru_cache(maxsize=None)
+def money_scanner(locale):
+    """ The scanner of a locale, compiled once, e.g. money_scanner('la'). """
+    if locale not in MONEY_LOCALES:
+        raise ValueError("Unknown money locale '{}', expected one of {}".format(locale, ', '.join(MONEY_LOCALES)))
+    return MoneyScanner(MONEY_LOCALES[locale])
+
 
 def is_vulgar_fraction(val):
     """ Is a character representing a fraction? """
@@ -193,9 +508,9 @@ def extract_value(text):
         return None
 
 
-def value_to_pence(value):
-    """ Convert the monetary value of pound, shilling and pence to just pence. For example, '£8.13s.4d.'
-        will return the 2080 (int) """
+def regex_value_to_pence(value):
+    """ The pence of a value found by extract_value(), with the regexes for each kind of value. value_to_pence() reads
+        values with the English table, this is kept to check that it gives the same. """
 
     # marks
     if marks_regex.match(value):
@@ -226,6 +541,63 @@ def value_to_pence(value):
         return None
 
 
+def nothing_in(text):
+    """ ('NOTHING', 0, span) if the text has 'NOTHING', otherwise (None, None, None). """
+    start = text.find('NOTHING')
+    if start >= 0:
+        return 'NOTHING', 0, (start, start + len('NOTHING'))
+    return None, None, None
+
+
+def parse_money(text, locale=DEFAULT_LOCALE):
+    """ Find the monetary value in a string and its value in pence in a single scan. For example, from
+        'Of aid promised to the king, £8.13s.4d., by the community of the town of Kilkenny.' it returns
+        ('£8.13s.4d.', 2080, (29, 39)), the value, pence and span of the value in the string. The value and pence
+        are the same as extract_value() and value_to_pence(): the kind of value that comes first in precedence
+        wins and, of those, the first in the string. If there isn't a value, but the text has 'NOTHING', it
+        returns ('NOTHING', 0, span) and otherwise (None, None, None). The text is scanned with the denomination
+        table of the locale in MONEY_LOCALES, in Latin ('la') the first amount in the text is the value. """
+
+    value, pennies, span = money_scanner(locale).scan(text)
+    if value is not None:
+        return value, pennies, span
+    return nothing_in(text)
+
+
+def cached_conversion(function):
+    """ A conversion with an LRU cache of settings.MONEY_CACHE_SIZE, the same as functools.lru_cache(typed=True),
+        whose size can be changed with its resize(). The conversion stays the same function when it is resized, so
+        names bound to it elsewhere, e.g. by 'from receipt_roll.money import value_to_pence', use the new cache. """
+
+    # the cache, replaced by resize()
+    cached = [functools.lru_cache(maxsize=settings.MONEY_CACHE_SIZE, typed=True)(function)]
+
+    @functools.wraps(function)
+    def conversion(*args, **kwargs):
+        return cached[0](*args, **kwargs)
+
+    def resize(maxsize):
+        """ Change the size of the cache (None for no limit, 0 to turn it off), which empties it. """
+        cached[0] = functools.lru_cache(maxsize=maxsize, typed=True)(function)
+
+    conversion.resize = resize
+    conversion.cache_info = lambda: cached[0].cache_info()
+    conversion.cache_clear = lambda: cached[0].cache_clear()
+    return conversion
+
+
+@cached_conversion
+def value_to_pence(value, locale=DEFAULT_LOCALE):
+    """ Convert the monetary value of pound, shilling and pence to just pence. For example, '£8.13s.4d.'
+        will return the 2080 (int). Values are converted with the denomination table of the locale. """
+
+    pennies = money_scanner(locale).value_pence(value)
+    if pennies is None and value == 'NOTHING':
+        return 0
+    return pennies
+
+
+@cached_conversion
 def pence_to_psd(pennies):
     """ Convert pence back to pound, shilling and pence ... this might not reflect contemporary conventions."""
 
@@ -246,3 +618,303 @@ def pence_to_psd(pennies):
     pennies_fmt = "{}{}d.".format(int(pennies), fraction_fmt) if pennies > 0 or fraction > 0 else ""
 
     return "{}{}{}".format(pound_fmt, shilling_fmt, pennies_fmt)
+
+
+# the conversions that are cached, a few amounts (½ mark, 1 mark, 10s., 20s., £10) make up most of the roll
+CACHED_CONVERSIONS = ('value_to_pence', 'pence_to_psd')
+
+
+def cache_info():
+    """ The hits, misses and size of the cache of each conversion, e.g. cache_info()['pence_to_psd'].hits """
+    return {name: globals()[name].cache_info() for name in CACHED_CONVERSIONS}
+
+
+def cache_clear():
+    for name in CACHED_CONVERSIONS:
+        globals()[name].cache_clear()
+
+
+def set_cache_size(maxsize):
+    """ Change the size of the caches (None for no limit, 0 to turn them off). The caches are emptied. """
+    for name in CACHED_CONVERSIONS:
+        globals()[name].resize(maxsize)
+
+
+def values_to_pence(values, locale=DEFAULT_LOCALE):
+    """ Convert a Series of monetary values to pence, the same as value_to_pence() for each value. Values that
+        aren't recognised are NaN. The distinct values are converted once, with str.extract and NumPy, so whole
+        columns of values with repeated amounts convert quickly. """
+
+    codes, distinct = pd.factorize(values)
+    scanner = money_scanner(locale)
+
+    if scanner.forms is None:
+        pence = np.array([value_to_pence(value, locale) for value in distinct], dtype='float64')
+    else:
+        parts = pd.Series(distinct, dtype=object).str.extract(scanner.value_regex.pattern, expand=True)
+
+        def number(group):
+            return parts[group].map(scanner.number_value, na_action='ignore').fillna(0).to_numpy(dtype='float64')
+
+        pence = np.select(
+            [parts[kind].notna().to_numpy() for kind, form in scanner.forms] + [distinct == 'NOTHING'],
+            [sum(number(group) * pennies for group, pennies in scanner.form_terms[kind])
+             for kind, form in scanner.forms] + [0],
+            np.nan).astype('float64')
+
+    # missing values have a code of -1
+    return pd.Series(np.where(codes >= 0, np.append(pence, np.nan)[codes], np.nan), index=values.index,
+                     name=values.name)
+
+
+def pence_to_psd_series(pennies):
+    """ Convert a Series of pence to pound, shilling and pence, the same as pence_to_psd() for each value. The
+        distinct values are converted once, with NumPy integer division and modulo. """
+
+    codes, distinct = pd.factorize(pennies)
+    distinct = np.asarray(distinct, dtype='float64')
+
+    # use modulus and floor to convert back to pound, shillings and pence
+    pounds = distinct // pound_as_pence
+    remainder = distinct % pound_as_pence
+    shillings = remainder // shilling_as_pence
+    remainder = remainder % shilling_as_pence
+    fraction = remainder % 1
+
+    def whole(values):
+        return np.nan_to_num(values).astype('int64').astype(str).astype(object)
+
+    # format the various bits, we need to check for quarter fractions
+    pound_fmt = np.where(pounds > 0, '£' + whole(pounds) + '.', '')
+    shilling_fmt = np.where(shillings > 0, whole(shillings) + 's.', '')
+    fraction_fmt = pd.Series(fraction).map({value: key for key, value in VULGAR_FRACTIONS.items()}).fillna('')
+    pennies_fmt = np.where((remainder > 0) | (fraction > 0),
+                           whole(remainder) + fraction_fmt.to_numpy(dtype=object) + 'd.', '')
+
+    psd = (pound_fmt.astype(object) + shilling_fmt.astype(object) + pennies_fmt.astype(object))
+
+    # missing values have a code of -1, the same as pence_to_psd(NaN)
+    return pd.Series(np.append(psd, '')[codes], index=pennies.index, name=pennies.name, dtype=object)
+
+
+# ---------- Exact amounts of money
+
+# farthings in a penny, the smallest fraction of a penny in the roll is a quarter
+farthings_per_penny = 4
+
+
+def pence_to_farthings(pennies):
+    """ Convert pence (a number or an array) to whole farthings. NaN are left as NaN. """
+    return np.rint(np.asarray(pennies, dtype='float64') * farthings_per_penny)
+
+
+def pence_to_marks(pennies):
+    """ Convert pence to marks if they are a whole, half, quarter or three-quarter number of marks, e.g.
+        '5 marks' or '½ mark', otherwise to pound, shilling and pence. """
+    marks = pennies / mark_as_pence
+    whole = int(marks)
+    fraction = decimal_to_vulgar_fraction(marks - whole)
+    if marks == whole and whole > 0:
+        return "{} mark{}".format(whole, 's' if whole > 1 else '')
+    elif whole == 0 and fraction is not None:
+        return "{} mark".format(fraction)
+    return pence_to_psd(pennies)
+
+
+@functools.total_ordering
+class Money(object):
+    """ An exact amount of money, held as a whole number of farthings. """
+
+    __slots__ = ('farthings',)
+
+    def __init__(self, farthings):
+        self.farthings = int(farthings)
+
+    @classmethod
+    def from_pence(cls, pennies):
+        return cls(pence_to_farthings(pennies))
+
+    @property
+    def pence(self):
+        return self.farthings / farthings_per_penny
+
+    def marks(self):
+        """ The amount in marks, if it is a simple number of marks, otherwise in pound, shillings and pence. """
+        return pence_to_marks(self.pence)
+
+    def __add__(self, other):
+        if isinstance(other, Money):
+            return Money(self.farthings + other.farthings)
+        return NotImplemented
+
+    def __radd__(self, other):
+        # so sum() works, it starts with 0
+        if other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, Money):
+            return Money(self.farthings - other.farthings)
+        return NotImplemented
+
+    def __eq__(self, other):
+        return isinstance(other, Money) and self.farthings == other.farthings
+
+    def __lt__(self, other):
+        if isinstance(other, Money):
+            return self.farthings < other.farthings
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.farthings)
+
+    def __str__(self):
+        return pence_to_psd(self.pence)
+
+    def __repr__(self):
+        return "Money('{}')".format(self)
+
+
+@register_extension_dtype
+class MoneyDtype(ExtensionDtype):
+    """ A pandas dtype for exact amounts of money, e.g. series.astype('money'). """
+
+    name = 'money'
+    type = Money
+    kind = 'O'
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls):
+        return MoneyArray
+
+
+class MoneyArray(ExtensionArray):
+    """ A pandas array of exact amounts of money, held as int64 farthings with a mask of the missing amounts. Sums
+        are exact whole numbers. Amounts are shown in pound, shilling and pence. """
+
+    def __init__(self, farthings, mask=None):
+        self._data = np.asarray(farthings, dtype='int64')
+        self._mask = np.zeros(len(self._data), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+
+    @classmethod
+    def from_pence(cls, pennies):
+        """ An array from pence (floats, NaN for missing amounts). """
+        farthings = pence_to_farthings(pennies)
+        mask = np.isnan(farthings)
+        return cls(np.where(mask, 0, farthings), mask)
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        """ An array from Money, pence or values such as '£1.6s.4d.'. """
+        if isinstance(scalars, MoneyArray):
+            return scalars.copy() if copy else scalars
+        pennies = []
+        for scalar in scalars:
+            if isinstance(scalar, Money):
+                pennies.append(scalar.pence)
+            elif isinstance(scalar, str):
+                pence = value_to_pence(scalar)
+                pennies.append(np.nan if pence is None else pence)
+            elif scalar is None or pd.isna(scalar):
+                pennies.append(np.nan)
+            else:
+                pennies.append(scalar)
+        return cls.from_pence(np.array(pennies, dtype='float64'))
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, dtype=None, copy=False):
+        return cls._from_sequence(strings, dtype, copy)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(np.concatenate([array._data for array in to_concat]),
+                   np.concatenate([array._mask for array in to_concat]))
+
+    @property
+    def dtype(self):
+        return MoneyDtype()
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + self._mask.nbytes
+
+    @property
+    def farthings(self):
+        return self._data
+
+    def to_pence(self):
+        """ The amounts in pence, as floats with NaN for missing amounts. """
+        return np.where(self._mask, np.nan, self._data / farthings_per_penny)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, item):
+        if is_integer(item):
+            return pd.NA if self._mask[item] else Money(self._data[item])
+        item = check_array_indexer(self, item)
+        return type(self)(self._data[item], self._mask[item])
+
+    def __setitem__(self, key, value):
+        key = check_array_indexer(self, key)
+        value = type(self)._from_sequence(value if is_list_like(value) else [value])
+        self._data[key] = value._data
+        self._mask[key] = value._mask
+
+    def __array__(self, dtype=None, copy=None):
+        return self.to_pence() if dtype is None else self.to_pence().astype(dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, Money):
+            return ~self._mask & (self._data == other.farthings)
+        other = type(self)._from_sequence(other)
+        return ~self._mask & ~other._mask & (self._data == other._data)
+
+    def isna(self):
+        return self._mask.copy()
+
+    def copy(self):
+        return type(self)(self._data.copy(), self._mask.copy())
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        data = take(self._data, indices, allow_fill=allow_fill, fill_value=0)
+        mask = take(self._mask, indices, allow_fill=allow_fill, fill_value=True)
+        return type(self)(data, mask)
+
+    def _values_for_factorize(self):
+        # missing amounts are factorized as missing values
+        return np.where(self._mask, -1, self._data), -1
+
+    def _values_for_argsort(self):
+        return self._data
+
+    def _formatter(self, boxed=False):
+        return lambda value: 'NaN' if value is pd.NA else str(value)
+
+    def astype(self, dtype, copy=True):
+        if isinstance(dtype, MoneyDtype) or dtype == 'money':
+            return self.copy() if copy else self
+        if pd.api.types.is_float_dtype(dtype):
+            return self.to_pence().astype(dtype)
+        return super().astype(dtype, copy=copy)
+
+    def _reduce(self, name, skipna=True, keepdims=False, **kwargs):
+        """ Exact sums, minimums and maximums of the amounts. """
+        data = self._data[~self._mask] if skipna else self._data
+        if not skipna and self._mask.any():
+            result = pd.NA
+        elif name == 'sum':
+            result = Money(data.sum())
+        elif name in ('min', 'max'):
+            result = Money(getattr(data, name)()) if len(data) else pd.NA
+        else:
+            raise TypeError("Can't {} money".format(name))
+        return type(self)._from_sequence([result]) if keepdims else result
@@ -0,0 +1,92 @@
+""" The NLTK models needed to extract entities, and nothing more: the punkt sentence tokenizer for word_tokenize() and
+    the averaged perceptron tagger for pos_tag_sents(). They are looked for in a local directory
+    (settings.NLTK_DATA_DIR) first, then NLTK's usual places, and are only downloaded (into the local directory) if
+    they are missing and downloads are allowed. The roll tokenizer and roll tagger need neither. Check, or download,
+    them with:
+
+        python -m receipt_roll.nltk_resources [--download]
+"""
+
+import argparse
+import os
+import re
+
+import settings
+
+# the NLTK version from which the models have new names
+PUNKT_TAB_VERSION = (3, 8, 2)
+TAGGER_ENG_VERSION = (3, 9)
+
+
+def nltk_version():
+    import nltk
+    return tuple(int(part) for part in re.findall(r'\d+', nltk.__version__)[:3])
+
+
+def use_data_dir(data_dir=None):
+    """ Look for NLTK models in the local directory before NLTK's usual places. """
+    import nltk
+
+    if data_dir is None:
+        data_dir = settings.NLTK_DATA_DIR
+    if data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+
+
+def required_resources(tokenize=True, tag=True):
+    """ The (resource, package) of the models needed to tokenize with word_tokenize() and tag with pos_tag_sents(),
+        for the installed version of NLTK. """
+    version = nltk_version()
+    resources = []
+    if tokenize:
+        punkt = 'punkt_tab' if version >= PUNKT_TAB_VERSION else 'punkt'
+        resources.append(('tokenizers/' + punkt, punkt))
+    if tag:
+        tagger = 'averaged_perceptron_tagger_eng' if version >= TAGGER_ENG_VERSION else 'averaged_perceptron_tagger'
+        resources.append(('taggers/' + tagger, tagger))
+    return resources
+
+
+def missing_resources(resources):
+    """ The resources that can't be found, without touching the network. """
+    import nltk
+
+    missing = []
+    for resource, package in resources:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            missing.append((resource, package))
+    return missing
+
+
+def check_resources(tokenize=True, tag=True, data_dir=None, download=False):
+    """ Make sure the models to tokenize and tag are available, from the local directory if they're in it. Missing
+        models are downloaded into the local directory if download is True, otherwise a LookupError says how to
+        install them. """
+    import nltk
+
+    if data_dir is None:
+        data_dir = settings.NLTK_DATA_DIR
+    use_data_dir(data_dir)
+
+    missing = missing_resources(required_resources(tokenize, tag))
+    if missing and download:
+        os.makedirs(data_dir, exist_ok=True)
+        for resource, package in missing:
+            nltk.download(package, download_dir=data_dir, quiet=True)
+        missing = missing_resources(missing)
+
+    if missing:
+        raise LookupError('Missing NLTK models {}, install them in {} with: python -m nltk.downloader -d {} {}'.format(
+            ', '.join(resource for resource, package in missing), data_dir, data_dir,
+            ' '.join(package for resource, package in missing)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check the NLTK models needed to extract entities.')
+    parser.add_argument('--download', action='store_true', help='download missing models into the data directory')
+    parser.add_argument('--data-dir', default=settings.NLTK_DATA_DIR, help='local directory of NLTK models')
+    args = parser.parse_args()
+    check_resources(data_dir=args.data_dir, download=args.download)
+    print('NLTK models found')
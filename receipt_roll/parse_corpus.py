@@ -0,0 +1,211 @@
+""" Parses a directory of roll transcripts (a corpus) across a pool of worker processes and creates two CSV files
+    that combine the entries and the daily sums of all the rolls, tagged with the roll they came from.
+
+    Large transcripts are split into chunks at membrane ([m. N]) boundaries. The term, date, place etc. carry
+    over from one membrane to the next, so each chunk is parsed with those values marked as INHERITED. Once all
+    the chunks are parsed, the inherited values are filled in, in order, from the end of the previous chunk. """
+
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from receipt_roll import common, money
+from receipt_roll.data import columnar
+from receipt_roll.create_data_csv import ParseState, RollEntry, DailySum, START_YEAR, membrane_regex, \
+    iter_roll_entries, read_transcript, roll_df_from_entries, daily_sums_df_from_records, nothing_df_for
+import settings
+
+# marks a value that is carried over from the previous chunk of the transcript
+INHERITED = '<inherited>'
+
+# the minimum number of lines in a chunk, chunks only end at a membrane boundary
+CHUNK_LINES = 2000
+
+# file extension of the transcripts
+TRANSCRIPT_EXT = '.txt'
+
+# regex to find the year in the name of the transcript, e.g. 'roll_1301.txt'
+year_regex = re.compile(r'\d{4}')
+
+
+def roll_name(transcript):
+    """ The name of the roll is the name of the transcript file, without the extension, e.g. 'roll_1301'. """
+    return os.path.splitext(os.path.basename(transcript))[0]
+
+
+def roll_start_year(transcript):
+    """ The year the roll starts is taken from the name of the transcript, e.g. 1301 for 'roll_1301.txt'. """
+    year = year_regex.search(roll_name(transcript))
+    return int(year.group(0)) if year else START_YEAR
+
+
+def roll_locale(transcript):
+    """ The locale of the monetary values of the roll, from settings.ROLL_LOCALES, English by default. """
+    return settings.ROLL_LOCALES.get(roll_name(transcript), money.DEFAULT_LOCALE)
+
+
+def list_transcripts(directory):
+    """ The transcripts in a directory, sorted by name so the output is always in the same order. """
+    return sorted(os.path.join(directory, file) for file in os.listdir(directory) if file.endswith(TRANSCRIPT_EXT))
+
+
+def split_at_membranes(lines, chunk_lines=CHUNK_LINES):
+    """ Split the lines of a transcript into chunks of at least chunk_lines, each (apart from the first) starting
+        with a membrane declaration. """
+    chunks = []
+    start = 0
+    for idx, line in enumerate(lines):
+        if idx - start >= chunk_lines and membrane_regex.match(line):
+            chunks.append(lines[start:idx])
+            start = idx
+    chunks.append(lines[start:])
+    return chunks
+
+
+def inherited_state():
+    """ The state to parse a chunk with, when the values from the previous chunk are not yet known. """
+    return ParseState(place=INHERITED, day=INHERITED, date=INHERITED, term=INHERITED, day_entry=1,
+                      previous=RollEntry(*[INHERITED] * len(RollEntry._fields)))
+
+
+def parse_chunk(task):
+    """ Parse a chunk of a transcript (run in a worker process). Returns the entries and daily sums and the
+        state at the end of the chunk. """
+    lines, is_first, start_year, locale = task
+    state = ParseState() if is_first else inherited_state()
+    records = list(iter_roll_entries(lines, state, start_year, locale))
+    return records, state
+
+
+def resolve_record(record, carry):
+    """ Fill in any inherited values of an entry or daily sum from the state at the end of the previous chunk. The
+        line and offset are relative to the start of the chunk, so the lines and bytes before it are added. """
+    record = record._replace(line=record.line + carry.line, offset=record.offset + carry.offset)
+
+    if isinstance(record, DailySum):
+        if record.date == INHERITED:
+            record = record._replace(date=carry.date)
+        return record
+
+    if record.date == INHERITED:
+        day_entry = None if carry.day_entry is None else carry.day_entry + record.day_entry - 1
+        record = record._replace(date=carry.date, day=carry.day, day_entry=day_entry)
+    if record.term == INHERITED:
+        record = record._replace(term=carry.term)
+    if record.source == INHERITED:
+        record = record._replace(source=carry.place)
+    if record.value == INHERITED:
+        previous = carry.previous
+        record = record._replace(value=previous.value if previous else None,
+                                 pence=previous.pence if previous else None)
+    return record
+
+
+def resolve_chunks(chunks, results, start_year, locale=money.DEFAULT_LOCALE):
+    """ Join the parsed chunks of a transcript back together, in order, filling in the inherited values. The result
+        is the same as parsing the whole transcript in one go. """
+    carry = ParseState()
+    records = []
+
+    for idx, (chunk, (chunk_records, end)) in enumerate(zip(chunks, results)):
+        # without a place, entries at the start of the chunk would have been dropped, so parse it again
+        if idx > 0 and carry.place is None:
+            chunk_records = list(iter_roll_entries(chunk, carry, start_year, locale))
+            records.extend(chunk_records)
+            continue
+
+        if idx > 0:
+            for record in chunk_records:
+                record = resolve_record(record, carry)
+                if isinstance(record, RollEntry):
+                    carry.previous = record
+                records.append(record)
+        else:
+            records.extend(chunk_records)
+            carry.previous = end.previous
+
+        # the state at the end of this chunk is the start of the next
+        carry.line += end.line
+        carry.offset += end.offset
+        carry.membrane = end.membrane
+        if end.place != INHERITED:
+            carry.place = end.place
+        if end.term != INHERITED:
+            carry.term = end.term
+        if end.date != INHERITED:
+            carry.date = end.date
+            carry.day = end.day
+            carry.day_entry = end.day_entry
+        elif carry.day_entry is not None:
+            carry.day_entry += end.day_entry - 1
+
+    return records
+
+
+def parse_corpus(directory=None, workers=None, chunk_lines=CHUNK_LINES, write=True):
+    """ Parse all the transcripts in a directory across a pool of worker processes (the number of CPUs by default)
+        and return data frames of the entries and daily sums of all the rolls. These are also written to
+        settings.CORPUS_CSV and settings.CORPUS_DAILY_SUMS_CSV. """
+
+    if directory is None:
+        directory = settings.ROLLS_DIR
+
+    transcripts = list_transcripts(directory)
+
+    # split every transcript into chunks
+    chunks = {}
+    tasks = []
+    for transcript in transcripts:
+        chunks[transcript] = split_at_membranes(read_transcript(transcript), chunk_lines)
+        start_year = roll_start_year(transcript)
+        locale = roll_locale(transcript)
+        tasks.extend((chunk, idx == 0, start_year, locale) for idx, chunk in enumerate(chunks[transcript]))
+
+    # parse the chunks, results come back in the same order as the tasks
+    if workers == 1:
+        results = list(map(parse_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(parse_chunk, tasks))
+
+    roll_dfs = []
+    sums_dfs = []
+    offset = 0
+
+    for transcript in transcripts:
+        roll_chunks = chunks[transcript]
+        records = resolve_chunks(roll_chunks, results[offset:offset + len(roll_chunks)], roll_start_year(transcript),
+                                 roll_locale(transcript))
+        offset += len(roll_chunks)
+
+        entries = [record for record in records if isinstance(record, RollEntry)]
+        daily_sums = [record for record in records if isinstance(record, DailySum)]
+
+        roll_df = roll_df_from_entries(entries, nothing_df_for(transcript))
+        roll_df.insert(0, common.ROLL_COL, roll_name(transcript))
+        roll_dfs.append(roll_df)
+
+        sums_df = daily_sums_df_from_records(daily_sums)
+        sums_df.insert(0, common.ROLL_COL, roll_name(transcript))
+        sums_dfs.append(sums_df)
+
+    df = pd.concat(roll_dfs, ignore_index=True)
+    df_sums = pd.concat(sums_dfs, ignore_index=True)
+
+    if write:
+        columnar.write_df(df, settings.CORPUS_CSV)
+        columnar.write_df(df_sums, settings.CORPUS_DAILY_SUMS_CSV)
+
+    return df, df_sums
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Parse a directory of roll transcripts.')
+    parser.add_argument('directory', nargs='?', default=settings.ROLLS_DIR, help='directory of transcripts')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--chunk-lines', type=int, default=CHUNK_LINES, help='minimum lines in a chunk')
+    args = parser.parse_args()
+    parse_corpus(args.directory, args.workers, args.chunk_lines)
@@ -1,7 +1,6 @@
-from datetime import datetime
-
 import matplotlib.pyplot as plt
 import os
+import pandas as pd
 
 import settings
 
@@ -26,7 +25,7 @@ months_labels_cal = ['[1301] Sep', 'Oct', 'Nov', 'Dec', '[1302] Jan', 'Feb', 'Ma
 
 
 def to_date(row):
-    return datetime.strptime(str(row['Date']), '%Y-%m-%d')
+    return pd.Timestamp(row['Date']).to_pydatetime()
 
 
 def filter_out_nothing(df):
@@ -1,16 +1,16 @@
 """ The following plots are used to illustrate business and income on the various terms. """
 
-import math
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-from receipt_roll import common, money
+from receipt_roll import common
 from receipt_roll.data import roll
 from receipt_roll.plots.base import save_or_show, set_labels_title, SN_STYLE, FONT_NAME, PLOT_DIMENSIONS, set_labels, \
     title_text
 from receipt_roll.plots.radar import plot_radar
+from receipt_roll.plots.ticker import psd_axis
 
 
 # ---------- Monthly look at totals and business (line plots)
@@ -24,20 +24,14 @@ def plt_monthly_total(save=False, file_name='plt_monthly_total.png', file_format
     # set the style
     sns.set(style=SN_STYLE)
 
-    # tick range in pence (divisible by 240, which is £1)
-    ticks_range = np.arange(0, 480000, 120000)
-
-    # show the labels as £ rather than pennies
-    ticks_labels = []
-    for x in np.nditer(ticks_range.T):
-        ticks_labels.append(money.pence_to_psd(x))
-    plt.yticks(ticks_range, ticks_labels)
-
     # create a frequency by year, month
     df['year_month'] = df.apply(roll.date_to_month_year_period, axis=1)
     ax = df.groupby(df.year_month)[common.PENCE_COL].sum().plot(marker='o')
     ax.autoscale(True)
 
+    # show the labels as £ rather than pennies
+    psd_axis(ax)
+
     # add labels etc.
     set_labels_title('Months', 'Total payments', 'Total payments per month ')
 
@@ -128,19 +122,13 @@ def plt_total_receipts_by_week_and_term(save=False, file_name='plt_total_receipt
     df = roll.roll_with_entities_df()
     df = df[df[common.SOURCE_COL] != 'NOTHING']
 
-    # tick range in pence (divisible by 240, which is £1)
-    ticks_range = np.arange(0, 240000, 24000)
-
-    # show the labels as £ rather than pennies
-    ticks_labels = []
-    for x in np.nditer(ticks_range.T):
-        ticks_labels.append(money.pence_to_psd(x))
-    plt.yticks(ticks_range, ticks_labels)
-
     for term, term_group in df.groupby(common.TERM_COL, sort=False):
         values = term_group.groupby(common.WEEK_COL)[common.PENCE_COL].sum()
         sns.lineplot(y=values, x=values.index, label=term, marker='o')
 
+    # show the labels as £ rather than pennies
+    psd_axis(plt.gca())
+
     # add labels etc.
     set_labels_title('Week', 'Total value of receipts', 'Total value of receipts for each week of the term')
 
@@ -285,16 +273,10 @@ def plt_sheriff_total_by_week(term_name='Michaelmas', fig_no=1, save=True, is_lo
             common.PENCE_COL].sum()
         totals_df.at[week, cols[0]] = week_group[common.PENCE_COL].sum()
 
-    totals_df.plot()
-
-    max_value = totals_df[cols[0]].max()
-    top_range = (math.ceil(max_value / 12000)) * 12000
-    ticks_range = np.arange(0, top_range + 12000, 12000)
+    ax = totals_df.plot()
 
-    ticks_labels = []
-    for x in np.nditer(ticks_range.T):
-        ticks_labels.append(money.pence_to_psd(x))
-    plt.yticks(ticks_range, ticks_labels)
+    # show the labels as £ rather than pennies
+    psd_axis(ax)
 
     # plot labels
     set_labels(x_label, y_label)
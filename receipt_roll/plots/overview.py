@@ -4,7 +4,6 @@ receipt roll data. Methods provide default arguments for titles, labels, file
 names etc, but they can be overridden in case you needed to customise text
 for publication.
 """
-import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -12,6 +11,7 @@ from receipt_roll import money, common
 from receipt_roll.data import roll
 from receipt_roll.plots.base import PLOT_DIMENSIONS, save_or_show, title_text, FONT_NAME, set_labels, \
     ANNOTATION_FONT_SIZE, to_date, filter_out_nothing, SN_STYLE
+from receipt_roll.plots.ticker import psd_axis
 
 
 def plt_total_by_terms(save=True, title='Total payments, per term', x_label="Terms", y_label='Total payments',
@@ -24,19 +24,12 @@ def plt_total_by_terms(save=True, title='Total payments, per term', x_label="Ter
     # get the totals
     terms_df = roll.terms_overview_df()
 
-    # tick range in pence (divisible by 240, which is £1)
-    ticks_range = np.arange(0, 600000, 120000)
-
-    # show the labels as £ rather than pennies
-    ticks_labels = []
-
-    for x in np.nditer(ticks_range.T):
-        ticks_labels.append(money.pence_to_psd(x))
-    plt.yticks(ticks_range, ticks_labels, fontname=FONT_NAME)
-
     # plot the data
     ax = sns.barplot(x=terms_df.index, y=terms_df['Term total'])
 
+    # show the labels as £ rather than pennies
+    psd_axis(ax)
+    plt.yticks(fontname=FONT_NAME)
     plt.xticks(fontname=FONT_NAME)
 
     # add the £.s.d. to each bar
@@ -162,14 +155,8 @@ def plt_scatter_payments_year(save=True, title='Scatter plot of all payments', x
     # create the plot
     plt.scatter(df_plot['Date Time'].tolist(), df_plot['Pence'], s=2)
 
-    # tick range in pence (divisible by 240, which is £1)
-    ticks_range = np.arange(0, 84000, 6000)
-
     # show the labels as £ rather than pennies
-    ticks_labels = []
-    for x in np.nditer(ticks_range.T):
-        ticks_labels.append(money.pence_to_psd(x))
-    plt.yticks(ticks_range, ticks_labels)
+    psd_axis(plt.gca())
 
     plt.xticks(fontsize=ANNOTATION_FONT_SIZE, rotation=90, fontname=FONT_NAME)
 
@@ -194,16 +181,10 @@ def plt_total_payments_by_source(save=True, title='Total payments by source',
     plt.figure(figsize=fig_size)
     df = roll.payments_overview_df()
 
-    sns.barplot(data=df, x=common.SOURCE_COL, y=common.PENCE_COL)
-
-    # tick range in pence (divisible by 240, which is £1)
-    ticks_range = np.arange(0, 480000, 120000)
+    ax = sns.barplot(data=df, x=common.SOURCE_COL, y=common.PENCE_COL)
 
     # show the labels as £ rather than pennies
-    ticks_labels = []
-    for x in np.nditer(ticks_range.T):
-        ticks_labels.append(money.pence_to_psd(x))
-    plt.yticks(ticks_range, ticks_labels)
+    psd_axis(ax)
 
     plt.xticks(fontsize=ANNOTATION_FONT_SIZE, fontname=FONT_NAME, rotation=90)
 
@@ -224,7 +205,7 @@ def plt_source_term_heat_map(save=True, title='Payments per term by source',
 
     df = roll.source_term_payments_matrix_df()
 
-    df_psd = df.applymap(money.pence_to_psd)
+    df_psd = df.apply(money.pence_to_psd_series)
 
     plt.figure(figsize=fig_size)
     plt.rcParams['font.family'] = FONT_NAME
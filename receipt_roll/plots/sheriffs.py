@@ -17,19 +17,27 @@ def df_sheriffs():
     return sheriffs_df[sheriffs_df[common.SOURCE_COL] != 'DUBLIN MANOR']
 
 
-def plt_sheriffs_counties_terms_heatmap(save=False, file_name='plt_sheriffs_counties_terms_heatmap.png',
-                                        file_format='png'):
-    # just get the sheriffs
-    df = df_sheriffs()
+def sheriffs_terms_matrix(df):
+    """ A matrix of the counties (sources) and terms, 1 where sheriffs of a county appeared in a term. Only the terms
+        and counties that occur are grouped, even if they are categories. """
 
     # counties
     counties = list(set(df[common.SOURCE_COL].to_list()))
     counties.sort()
 
     matrix = pd.DataFrame(np.zeros(shape=(len(counties), len(common.TERMS))), columns=common.TERMS, index=counties)
-    for term, term_group in df.groupby(common.TERM_COL):
-        for area, area_group in term_group.groupby(common.SOURCE_COL):
+    for term, term_group in df.groupby(common.TERM_COL, observed=True):
+        for area, area_group in term_group.groupby(common.SOURCE_COL, observed=True):
             matrix.at[area, term] = 1
+    return matrix
+
+
+def plt_sheriffs_counties_terms_heatmap(save=False, file_name='plt_sheriffs_counties_terms_heatmap.png',
+                                        file_format='png'):
+    # just get the sheriffs
+    df = df_sheriffs()
+
+    matrix = sheriffs_terms_matrix(df)
 
     cmap = mpl.colors.ListedColormap(['#ffffff', '#c28cb8'])
     norm = mpl.colors.BoundaryNorm([0, 1, 3], cmap.N)
@@ -50,14 +58,7 @@ def plt_sheriffs_counties_terms_no_arrears_heatmap(save=False,
 
     df = df[~df[common.DETAILS_COL].str.contains('arrears')]
 
-    # counties
-    counties = list(set(df[common.SOURCE_COL].to_list()))
-    counties.sort()
-
-    matrix = pd.DataFrame(np.zeros(shape=(len(counties), len(common.TERMS))), columns=common.TERMS, index=counties)
-    for term, term_group in df.groupby(common.TERM_COL):
-        for area, area_group in term_group.groupby(common.SOURCE_COL):
-            matrix.at[area, term] = 1
+    matrix = sheriffs_terms_matrix(df)
 
     cmap = mpl.colors.ListedColormap(['#ffffff', '#c28cb8'])
     norm = mpl.colors.BoundaryNorm([0, 1, 3], cmap.N)
@@ -0,0 +1,72 @@
+""" Ticks for axes of money in pence. The locator places ticks on whole pounds (or marks) and scales with the data, and
+    the formatter labels them in £.s.d., e.g.
+
+        psd_axis(plt.gca())
+        psd_axis(ax, unit=money.mark_as_pence)
+"""
+
+from matplotlib import ticker
+
+from receipt_roll import money
+
+# the steps between ticks, in units, e.g. £1, £2, £5 or £10 (and their powers of ten). Ticks are on whole units, so
+# 2.5 is only a step from ten units up, e.g. £25, never £2.10s.
+STEPS = [1, 2, 2.5, 5, 10]
+
+# the maximum number of intervals between ticks
+BINS = 6
+
+
+class PsdFormatter(ticker.Formatter):
+    """ Label ticks in pence as £.s.d., e.g. 120000 is £500, or in marks where they are a simple number of marks.
+        The £.s.d. labels come from money.pence_to_psd, which is cached, so they aren't worked out again when the
+        plot is redrawn. """
+
+    def __init__(self, marks=False):
+        self.to_text = money.pence_to_marks if marks else money.pence_to_psd
+
+    def __call__(self, x, pos=None):
+        if x < 0:
+            return '-' + self.to_text(float(-x))
+        return self.to_text(float(x))
+
+
+class PsdLocator(ticker.Locator):
+    """ Place ticks on multiples of a unit, a pound (240 pence) by default or a mark (160 pence), with the step
+        chosen from the range of the axis. Ranges smaller than a unit are ticked in shillings and then pence. """
+
+    def __init__(self, unit=money.pound_as_pence, nbins=BINS):
+        self.unit = unit
+        self.nbins = nbins
+
+    def unit_for(self, vmin, vmax):
+        """ The unit to tick a range in, the given unit unless the range is smaller. """
+        for unit in (self.unit, money.shilling_as_pence):
+            if vmax - vmin >= unit:
+                return unit
+        return 1
+
+    def units_locator(self):
+        return ticker.MaxNLocator(nbins=self.nbins, steps=STEPS, integer=True)
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    def tick_values(self, vmin, vmax):
+        vmin, vmax = sorted((vmin, vmax))
+        unit = self.unit_for(vmin, vmax)
+        return self.raise_if_exceeds(self.units_locator().tick_values(vmin / unit, vmax / unit) * unit)
+
+    def view_limits(self, dmin, dmax):
+        unit = self.unit_for(*sorted((dmin, dmax)))
+        vmin, vmax = self.units_locator().view_limits(dmin / unit, dmax / unit)
+        return vmin * unit, vmax * unit
+
+
+def psd_axis(ax, axis='y', unit=money.pound_as_pence):
+    """ Tick and label an axis (y by default) of pence in £.s.d., or in marks if the unit is a mark. """
+    axis = ax.yaxis if axis == 'y' else ax.xaxis
+    axis.set_major_locator(PsdLocator(unit))
+    axis.set_major_formatter(PsdFormatter(marks=unit == money.mark_as_pence))
+    return ax
@@ -0,0 +1,210 @@
+""" A part of speech tagger trained on the details of the roll. The details are formulaic ('fine for trespass', 'to
+    have a writ', 'sheriff') and use few words, so a lookup of the tag of each word, and of each word after a tag,
+    learnt from the tags of the default NLTK tagger, is almost as accurate and many times quicker. Words that weren't
+    seen in training are tagged by their shape, e.g. capitalised words are proper nouns. Train the tagger and print a
+    report of its accuracy against the default tagger with:
+
+        python -m receipt_roll.roll_tagger
+"""
+
+import json
+import re
+import time
+from collections import Counter, defaultdict
+
+import settings
+
+# bump if the format of the model changes
+MODEL_VERSION = 1
+
+# the tag before the first word of a sentence
+START_TAG = '<S>'
+
+# the tags of words that weren't seen in training, by their shape
+UNKNOWN_WORD_TAGS = [(re.compile(r'^[A-Z]'), 'NNP'), (re.compile(r'^\d'), 'CD'), (re.compile(r'^\W+$'), '.'),
+                     (re.compile(r's$'), 'NNS')]
+
+# the default tag of words that weren't seen in training
+UNKNOWN_WORD_TAG = 'NN'
+
+# one in every HOLD_OUT sentences is kept out of training to measure the accuracy
+HOLD_OUT = 10
+
+# the gold cases of people extracted from the details, (details, people), tests/test_extract_person.py checks
+# them with the default tagger
+GOLD_PEOPLE = [
+    ('From Henry de Curcy 5 marks of a fine for trespass.', 'Henry de Curcy'),
+    ('John Maungne, 10s. for him and his pledges, for he came not though mainperned.', 'John Maungne'),
+    ('William de Kent, 10s., for him and his pledges likewise.', 'William de Kent'),
+    ('John Ringere, 1 mark for a false claim against J. de Fresingfeld.', 'John Ringere;J. de Fresingfeld'),
+    ('Richard fitz John, ½ mark to have a writ.', 'Richard fitz John'),
+    ('William de Cauntone, sheriff, £20 for debts of divers persons.', 'William de Cauntone, sheriff'),
+    ('Of profit of the county, 46s.8d. by William de Cauntone, sheriff.', 'William de Cauntone, sheriff'),
+    ('Thomas de Salop, chaplain, ½ mark as he did not have a warrant of the king’s service.',
+     'Thomas de Salop, chaplain'),
+    ('Richard, vicar of the church of Moling, 20d. for unjust detention.', 'Richard, vicar of the church of Moling'),
+    ('Farm of the lands of Thomas de Arundel, 20s. by Richard Botild.', 'Thomas de Arundel;Richard Botild'),
+    ('Farm of the mills of Taghyanewy, 10s. by Edusam Inmaulouz.', 'Edusam Inmaulouz'),
+    ('Roger Roth, sheriff, £20 of debts of divers persons.', 'Roger Roth, sheriff'),
+    ('Ralph de Monthermer, earl, and J. his wife, £6 of the arrears of their account by F., seneschal.',
+     'Ralph de Monthermer, earl;F., seneschal'),
+    ('The villata of Loughsewdy, 30s. for the escape of Reginald le Tanner.', 'Reginald le Tanner'),
+    ('William le Blund de Otimi, 53s.4d. of a fine for trespass.', 'William le Blund de Otimi'),
+    ('Nicholas, archbishop of Armagh, £10 of a fine for trespass.', 'Nicholas, archbishop of Armagh'),
+    ('Master Nicholas de Exeter, archdeacon of Ossory, one mark for himself and his pledges, as he did not '
+     'prosecute.', 'Master Nicholas de Exeter, archdeacon of Ossory'),
+    ('Roger de Novo Castro, an Irishman, 20s. for having entry on his tenements at Swords.', 'Roger de Novo Castro'),
+    ('Of the issues of the lands late of Cristiana de Mariscis at Killimen [?], 40s., by William Molroni.',
+     'Cristiana de Mariscis at Killimen;William Molroni'),
+    ('Richard de Peveneseie, seneschal, 10 marks of the arrears of his account for John fitz H., by John fitz John '
+     'de la Hide.', 'Richard de Peveneseie, seneschal;John fitz H.;John fitz John de la Hide'),
+    ('Ralph the baker [pistor] of Drogheda, 20d. of a fine for trespass.', 'Ralph the baker'),
+    ('Robert de Maundeville and Roger de Burford, 26s.8d. of a fine for trespass.',
+     'Robert de Maundeville;Roger de Burford')]
+
+# not found yet:
+# ('Adam de Cromelin, sheriff, £17.6s.8d. of the arrears of his account, by N. bishop of Leighlin of a fine for '
+#  'trespass.', 'Adam de Cromelin, sheriff; N. bishop of Leighlin')
+
+
+class RollTagger(object):
+    """ Tags words with the tag they had most often after the previous tag and, if that wasn't seen in training, the
+        tag they had most often. Only the tags after a previous tag that differ from the word's own are kept. """
+
+    def __init__(self, unigrams, bigrams):
+        self.unigrams = unigrams
+        self.bigrams = bigrams
+
+    @classmethod
+    def train(cls, tagged_sentences):
+        """ Learn the tags from sentences of (word, tag). """
+        unigram_counts = defaultdict(Counter)
+        bigram_counts = defaultdict(Counter)
+        for sentence in tagged_sentences:
+            previous = START_TAG
+            for word, tag in sentence:
+                unigram_counts[word][tag] += 1
+                bigram_counts[(previous, word)][tag] += 1
+                previous = tag
+
+        unigrams = {word: counts.most_common(1)[0][0] for word, counts in unigram_counts.items()}
+        bigrams = {}
+        for (previous, word), counts in bigram_counts.items():
+            tag = counts.most_common(1)[0][0]
+            if tag != unigrams[word]:
+                bigrams[(previous, word)] = tag
+        return cls(unigrams, bigrams)
+
+    @staticmethod
+    def unknown_word_tag(word):
+        for regex, tag in UNKNOWN_WORD_TAGS:
+            if regex.search(word):
+                return tag
+        return UNKNOWN_WORD_TAG
+
+    def tag(self, tokens):
+        """ Tag a sentence, a list of words, returning a list of (word, tag). """
+        tagged = []
+        previous = START_TAG
+        for word in tokens:
+            tag = self.bigrams.get((previous, word)) or self.unigrams.get(word) or self.unknown_word_tag(word)
+            tagged.append((word, tag))
+            previous = tag
+        return tagged
+
+    def tag_sents(self, sentences):
+        return [self.tag(tokens) for tokens in sentences]
+
+    def save(self, model_file):
+        model = {'version': MODEL_VERSION, 'unigrams': self.unigrams,
+                 'bigrams': [[previous, word, tag] for (previous, word), tag in self.bigrams.items()]}
+        with open(model_file, 'w') as file:
+            json.dump(model, file, ensure_ascii=False, sort_keys=True)
+
+    @classmethod
+    def load(cls, model_file):
+        with open(model_file, 'r') as file:
+            model = json.load(file)
+        if model.get('version') != MODEL_VERSION:
+            raise ValueError('The roll tagger in {} is out of date, train it again'.format(model_file))
+        return cls(model['unigrams'], {(previous, word): tag for previous, word, tag in model['bigrams']})
+
+
+def corpus_sentences(corpus_file=None):
+    """ The tokens of each line of the details corpus (see extract_entities.create_details_corpus()). """
+    from receipt_roll import extract_entities
+
+    if corpus_file is None:
+        corpus_file = settings.DETAILS_TEXT_CORPUS
+
+    with open(corpus_file, 'r') as file:
+        tokenize = extract_entities.word_tokenizer(extract_entities.NLTK_TOKENIZER)
+        return [tokenize(line.strip()) for line in file if line.strip()]
+
+
+def default_tags(sentences):
+    """ The tags of the default NLTK tagger. """
+    from receipt_roll import extract_entities
+    return extract_entities.sentence_tagger(extract_entities.PERCEPTRON_ENGINE)(sentences)
+
+
+def accuracy(tagged, reference):
+    """ The share of the words with the same tag as the reference. """
+    pairs = [(word_tag, reference_tag) for sentence, reference_sentence in zip(tagged, reference)
+             for word_tag, reference_tag in zip(sentence, reference_sentence)]
+    return sum(1 for word_tag, reference_tag in pairs if word_tag == reference_tag) / len(pairs) if pairs else 0
+
+
+def gold_cases_passed(engine, tokenizer=None, cases=GOLD_PEOPLE):
+    """ The number of the gold cases of people extracted with a tagger engine, and the number of cases. """
+    from receipt_roll import extract_entities
+
+    passed = sum(1 for details, people in cases
+                 if extract_entities.extract_people(details, engine=engine, tokenizer=tokenizer) == people)
+    return passed, len(cases)
+
+
+def accuracy_report(corpus_file=None):
+    """ Print the accuracy of a tagger trained on all but one in HOLD_OUT of the sentences of the details corpus, on
+        the sentences it didn't see, against the default tagger, the speed of both taggers and the gold cases of
+        people extracted with each. """
+    from receipt_roll import extract_entities
+
+    sentences = corpus_sentences(corpus_file)
+
+    start = time.perf_counter()
+    reference = default_tags(sentences)
+    default_time = time.perf_counter() - start
+
+    training = [tagged for idx, tagged in enumerate(reference) if idx % HOLD_OUT != 0]
+    held_out = [idx for idx in range(len(sentences)) if idx % HOLD_OUT == 0]
+    tagger = RollTagger.train(training)
+
+    start = time.perf_counter()
+    tagged = tagger.tag_sents(sentences)
+    roll_time = time.perf_counter() - start
+
+    print('Sentences: {:,}, words: {:,}'.format(len(sentences), sum(len(sentence) for sentence in sentences)))
+    print('Accuracy on held out sentences: {:.1%}'.format(
+        accuracy([tagged[idx] for idx in held_out], [reference[idx] for idx in held_out])))
+    print('Accuracy on all sentences: {:.1%}'.format(accuracy(tagged, reference)))
+    print('Default tagger: {:.3f}s, roll tagger: {:.3f}s ({:.0f}x)'.format(default_time, roll_time,
+                                                                           default_time / roll_time))
+    for engine in extract_entities.TAGGER_ENGINES:
+        print('Gold people with the {} tagger: {} of {}'.format(engine, *gold_cases_passed(engine)))
+
+
+def train_roll_tagger(corpus_file=None, model_file=None):
+    """ Train the tagger on all the sentences of the details corpus and save it to settings.ROLL_TAGGER_MODEL. """
+
+    if model_file is None:
+        model_file = settings.ROLL_TAGGER_MODEL
+
+    tagger = RollTagger.train(default_tags(corpus_sentences(corpus_file)))
+    tagger.save(model_file)
+    return tagger
+
+
+if __name__ == '__main__':
+    train_roll_tagger()
+    accuracy_report()
@@ -0,0 +1,82 @@
+""" A tokenizer for the details of the roll. Each entry is a single, formulaic sentence with little punctuation, so
+    one regex splits it into the same words as NLTK's Treebank word tokenizer run over the whole entry, without the
+    many passes of the Treebank tokenizer. As with the Treebank tokenizer, commas and the ’ of abbreviations and
+    possessives ('Assheb’', 'king’s') are split off and only the full stop at the end of the entry is split off, the
+    full stop of an initial ('J. de Fresingfeld') is kept. word_tokenize() splits the entry into sentences with punkt
+    first, so it also splits off a full stop that punkt takes as the end of a sentence inside an entry, which
+    roll_tokenize() keeps on its word. Print a token by token comparison with word_tokenize() on the details
+    corpus, and the speed of both, with:
+
+        python -m receipt_roll.roll_tokenizer
+"""
+
+import difflib
+import re
+import time
+
+import settings
+
+# regex for a token: an ellipsis, a double hyphen, the 'n't' of a contraction and the word before it, the ending of
+# a contraction or possessive after an apostrophe, a (hyphenated) word or number, e.g. '1,000', with the full stop
+# of an abbreviation or any other single character
+token_regex = re.compile(r"\.\.\.|--|\w+?(?=n't\b)|n't\b|'(?:[sSmMdD]|ll|LL|re|RE|ve|VE)\b|"
+                         r"\w+(?:[-.]\w+|[,:]\d\w*)*(?:\.(?!\.))?|\S")
+
+# regex for a word and full stop at the end of the entry, the full stop is split off
+final_stop_regex = re.compile(r'^(\w.*?)\.$')
+
+# the number of examples of each difference printed in the report
+EXAMPLES = 10
+
+
+def roll_tokenize(text):
+    """ The words of the details of an entry, as the Treebank word tokenizer would split them. """
+    tokens = token_regex.findall(text)
+    if tokens:
+        final_stop = final_stop_regex.match(tokens[-1])
+        if final_stop:
+            tokens[-1:] = [final_stop.group(1), '.']
+    return tokens
+
+
+def token_diff(reference, tokens):
+    """ The differences between the tokens of the reference and the roll tokenizer, as (reference, roll) pairs of
+        lists of tokens. """
+    matcher = difflib.SequenceMatcher(a=reference, b=tokens, autojunk=False)
+    return [(reference[i1:i2], tokens[j1:j2]) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+
+
+def diff_report(corpus_file=None):
+    """ Print a token by token comparison of roll_tokenize() with word_tokenize() on the lines of the details
+        corpus (see extract_entities.create_details_corpus()) and the time taken by each. """
+    from receipt_roll import extract_entities
+
+    if corpus_file is None:
+        corpus_file = settings.DETAILS_TEXT_CORPUS
+
+    with open(corpus_file, 'r') as file:
+        lines = [line.strip() for line in file if line.strip()]
+
+    word_tokenize = extract_entities.word_tokenizer(extract_entities.NLTK_TOKENIZER)
+    start = time.perf_counter()
+    reference = [word_tokenize(line) for line in lines]
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tokens = [roll_tokenize(line) for line in lines]
+    roll_time = time.perf_counter() - start
+
+    diffs = [(line, token_diff(ref, toks)) for line, ref, toks in zip(lines, reference, tokens) if ref != toks]
+    print('Lines: {:,}, tokens: {:,}'.format(len(lines), sum(len(ref) for ref in reference)))
+    print('Lines tokenized differently: {:,}'.format(len(diffs)))
+    print('Differences: {:,}'.format(sum(len(diff) for line, diff in diffs)))
+    for line, diff in diffs[:EXAMPLES]:
+        print('  {}'.format(line))
+        for ref, toks in diff:
+            print('    word_tokenize: {} roll_tokenize: {}'.format(ref, toks))
+    print('word_tokenize: {:.3f}s, roll_tokenize: {:.3f}s ({:.0f}x)'.format(reference_time, roll_time,
+                                                                            reference_time / roll_time))
+
+
+if __name__ == '__main__':
+    diff_report()
@@ -0,0 +1,71 @@
+""" A persistent cache of the POS tags of the cleaned details of the roll, so re-running the entity extraction doesn't
+    tag the same text again. The tags are kept in a SQLite file, keyed by a hash of the cleaned details. The cache
+    holds a fingerprint of the tokenizer, tagger and tidying rules that made the tags, and is emptied if it changes,
+    e.g.
+
+        with TagCache(settings.TAG_CACHE_DB, extract_entities.tagger_fingerprint()) as cache:
+            tags = cache.get_many(texts)
+"""
+
+import hashlib
+import json
+import sqlite3
+
+# bump if the format of the cache changes
+CACHE_VERSION = 1
+
+# the most keys in one query, SQLite limits the number of parameters
+QUERY_KEYS = 500
+
+
+def text_key(text):
+    """ The key of a cleaned details text. """
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class TagCache(object):
+    """ Tags of cleaned details, keyed by a hash of the text, in a SQLite file. """
+
+    def __init__(self, cache_file, fingerprint):
+        self.connection = sqlite3.connect(cache_file)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS tags (key TEXT PRIMARY KEY, tags TEXT)')
+
+        # the tags are out of date if they were made by another tagger or version of the cache
+        fingerprint = '{}:{}'.format(CACHE_VERSION, fingerprint)
+        row = self.connection.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+        if row is None or row[0] != fingerprint:
+            self.connection.execute('DELETE FROM tags')
+            self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+        self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def get_many(self, texts):
+        """ The tags of the texts that are in the cache, as a dictionary of text to a list of (word, tag). """
+        keys = {text_key(text): text for text in texts}
+        found = {}
+        key_list = list(keys)
+        for start in range(0, len(key_list), QUERY_KEYS):
+            batch = key_list[start:start + QUERY_KEYS]
+            rows = self.connection.execute('SELECT key, tags FROM tags WHERE key IN ({})'.format(
+                ','.join('?' * len(batch))), batch)
+            for key, tags in rows:
+                found[keys[key]] = [tuple(item) for item in json.loads(tags)]
+        return found
+
+    def put_many(self, tagged):
+        """ Add a dictionary of text to a list of (word, tag) to the cache. """
+        self.connection.executemany('INSERT OR REPLACE INTO tags VALUES (?, ?)',
+                                    ((text_key(text), json.dumps(tags)) for text, tags in tagged.items()))
+        self.connection.commit()
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM tags').fetchone()[0]
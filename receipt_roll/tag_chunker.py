@@ -0,0 +1,44 @@
+""" A chunker for the grammars of extract_entities.py that gives the same chunks as NLTK's RegexpParser, quicker.
+    The tags of a sentence are encoded as a string, e.g. '<NNP><FW><NNP>', in the same way as RegexpParser does, and
+    the tag pattern of the grammar is compiled once into a regex over that string. The chunks are the matches, as
+    spans of the tagged words, so no trees are built, e.g.
+
+        chunker = TagChunker('PP: {<NNP><FW><NNP>}')
+        chunker.spans([('Richard', 'NNP'), ('fitz', 'FW'), ('John', 'NNP')])  # [(0, 3)]
+"""
+
+import re
+
+# regex for a grammar of one chunk rule, e.g. 'PP: {<NNP><NNP>}'
+grammar_regex = re.compile(r'^\s*(?P<label>[^:\s]+)\s*:\s*\{(?P<pattern>[^{}]*)\}\s*$')
+
+
+class TagChunker(object):
+    """ Finds the chunks of a grammar of one chunk rule in tagged words. """
+
+    def __init__(self, grammar):
+        from nltk.chunk.regexp import tag_pattern2re_pattern
+
+        match = grammar_regex.match(grammar)
+        if match is None:
+            raise ValueError('Only a grammar of one chunk rule can be compiled: {}'.format(grammar))
+        self.label = match.group('label')
+        self.regex = re.compile(tag_pattern2re_pattern(match.group('pattern')))
+
+    def spans(self, tagged):
+        """ The (start, end) of each chunk in a list of (word, tag), in order. """
+
+        # the word that starts at each offset of the encoded tags, and the end of the last word
+        words = {}
+        offset = 0
+        for idx, (word, tag) in enumerate(tagged):
+            words[offset] = idx
+            offset += len(tag) + 2
+        words[offset] = len(tagged)
+
+        encoded = ''.join(['<' + tag + '>' for word, tag in tagged])
+        return [(words[match.start()], words[match.end()]) for match in self.regex.finditer(encoded)]
+
+    def chunks(self, tagged):
+        """ The tagged words of each chunk, in order. """
+        return [tagged[start:end] for start, end in self.spans(tagged)]
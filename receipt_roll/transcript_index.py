@@ -0,0 +1,147 @@
+""" An index of the transcript, so the text of a day or a membrane can be read without scanning the whole file.
+    The index records the byte offsets of every membrane declaration, date heading and daily sum, and is saved
+    as JSON next to the transcript. A TranscriptReader uses the index to read slices of the transcript through
+    mmap, e.g.
+
+        with TranscriptReader() as reader:
+            print(reader.read_day('1302-07-11'))
+            print(reader.read_membrane(12))
+"""
+
+import json
+import mmap
+import os
+
+import settings
+from receipt_roll import create_data_csv, parse_corpus
+
+# bump if the format of the index changes
+INDEX_VERSION = 1
+
+
+def index_file_for(transcript):
+    """ The index file that sits next to a transcript, e.g. roll_1301.index.json for roll_1301.txt. """
+    return os.path.splitext(transcript)[0] + '.index.json'
+
+
+def build_index(transcript=None, index_file=None):
+    """ Scan the transcript and save the byte offsets (start and end) of each membrane, day and daily sum. A day
+        runs from its date heading to the end of its daily sum or, if it has none, the next date heading. """
+
+    if transcript is None:
+        transcript = settings.ROLL_TXT
+
+    if index_file is None:
+        index_file = index_file_for(transcript)
+
+    start_year = parse_corpus.roll_start_year(transcript)
+    membranes = {}
+    days = {}
+    daily_sums = {}
+
+    membrane = None
+    date = None
+    offset = 0
+
+    with open(transcript, 'rb') as file:
+        for raw_line in file:
+            end = offset + len(raw_line)
+            kind, match = create_data_csv.classify_line(raw_line.decode('utf-8').rstrip('\n'))
+            if kind == create_data_csv.MEMBRANE_LINE:
+                if membrane is not None:
+                    membranes[membrane][1] = offset
+                membrane = match.group('membrane_no')
+                membranes[membrane] = [offset, None]
+            elif kind == create_data_csv.DATE_LINE:
+                if date is not None and days[date][1] is None:
+                    days[date][1] = offset
+                date = create_data_csv.date_parts_to_values(match.group('weekday'), match.group('day_no'),
+                                                            match.group('month'), start_year)[1]
+                days[date] = [offset, None]
+            elif kind == create_data_csv.DAILY_SUM_LINE and date is not None:
+                daily_sums[date] = [offset, end]
+                days[date][1] = end
+            offset = end
+
+    # the last membrane and day run to the end of the file
+    if membrane is not None:
+        membranes[membrane][1] = offset
+    if date is not None and days[date][1] is None:
+        days[date][1] = offset
+
+    stat = os.stat(transcript)
+    index = {'version': INDEX_VERSION, 'size': stat.st_size, 'mtime': stat.st_mtime, 'membranes': membranes,
+             'days': days, 'daily_sums': daily_sums}
+
+    with open(index_file, 'w') as file:
+        json.dump(index, file)
+
+    return index
+
+
+def load_index(transcript=None, index_file=None):
+    """ Load the index of the transcript, building it if it is missing or the transcript has changed. """
+
+    if transcript is None:
+        transcript = settings.ROLL_TXT
+
+    if index_file is None:
+        index_file = index_file_for(transcript)
+
+    if os.path.isfile(index_file):
+        with open(index_file, 'r') as file:
+            index = json.load(file)
+        stat = os.stat(transcript)
+        if index.get('version') == INDEX_VERSION and index['size'] == stat.st_size and \
+                index['mtime'] == stat.st_mtime:
+            return index
+
+    return build_index(transcript, index_file)
+
+
+def date_key(date):
+    """ The date as a YYYY-MM-DD string, the date can be a string, date or pandas Timestamp. """
+    if isinstance(date, str):
+        return date
+    return date.isoformat()[:10]
+
+
+class TranscriptReader(object):
+    """ Read the text of days, daily sums and membranes from a memory-mapped transcript. """
+
+    def __init__(self, transcript=None, index_file=None):
+        if transcript is None:
+            transcript = settings.ROLL_TXT
+        self.index = load_index(transcript, index_file)
+        self.file = open(transcript, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def read_slice(self, span):
+        start, end = span
+        return self.map[start:end].decode('utf-8')
+
+    def read_day(self, date):
+        """ The text of a day, from the date heading to the daily sum, e.g. read_day('1302-07-11'). """
+        return self.read_slice(self.index['days'][date_key(date)])
+
+    def read_daily_sum(self, date):
+        """ The line with the daily sum of a day. """
+        return self.read_slice(self.index['daily_sums'][date_key(date)])
+
+    def read_membrane(self, number):
+        """ The text of a membrane, from its declaration, e.g. '[m. 12]', to the next. """
+        return self.read_slice(self.index['membranes'][str(number)])
+
+    def dates(self):
+        """ The dates in the transcript, in order. """
+        return list(self.index['days'].keys())
@@ -0,0 +1,217 @@
+""" Updates the CSV files created by create_data_csv.py after the transcript has been edited. A manifest (a small
+    JSON file) records a hash of the text of each membrane, and the entries parsed from each membrane are kept in a
+    JSON file of their own in a directory next to it. On a re-run, only the membranes whose text has changed are
+    parsed again (and only their files written), and the results are joined with those of the unchanged membranes.
+    If nothing has changed, the CSV files aren't written at all. The CSV files are identical to those from
+    create_data_csv.parse_roll(). """
+
+import hashlib
+import json
+import os
+
+import settings
+from receipt_roll import create_data_csv, money, parse_corpus
+from receipt_roll.create_data_csv import RollEntry, DailySum
+from receipt_roll.data import columnar
+
+# bump if the format of the manifest changes
+MANIFEST_VERSION = 4
+
+# the records that can be in the manifest, by name
+RECORD_TYPES = {RollEntry.__name__: RollEntry, DailySum.__name__: DailySum}
+
+
+def parser_fingerprint():
+    """ A hash of the parsing code. If the parser changes, the entries in the manifest are out of date. """
+    digest = hashlib.sha1()
+    for module in (create_data_csv, money, parse_corpus):
+        with open(module.__file__, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def membrane_hash(lines):
+    """ A hash of the text of a membrane. """
+    return hashlib.sha1('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+def file_hash(file):
+    """ A hash of the contents of a file, None if there isn't a file. """
+    if file is None or not os.path.isfile(file):
+        return None
+    with open(file, 'rb') as contents:
+        return hashlib.sha1(contents.read()).hexdigest()
+
+
+def output_files(transcript):
+    """ The roll CSV, daily sums CSV and manifest of a transcript. These are the files in settings for the 1301-2
+        roll, otherwise they are next to the transcript, e.g. 'roll_1305.csv', 'roll_1305_daily_sums.csv' and
+        'roll_1305.manifest' for 'roll_1305.txt'. """
+    if os.path.abspath(transcript) == os.path.abspath(settings.ROLL_TXT):
+        return settings.ROLL_CSV, settings.DAILY_SUMS_CSV, settings.ROLL_MANIFEST
+    base = os.path.splitext(transcript)[0]
+    return base + '.csv', base + '_daily_sums.csv', base + '.manifest'
+
+
+def record_to_json(record):
+    """ An entry or daily sum as [type, fields]. """
+    return [type(record).__name__, list(record)] if record is not None else None
+
+
+def record_from_json(item):
+    if item is None:
+        return None
+    name, fields = item
+    return RECORD_TYPES[name](*fields)
+
+
+def parsed_to_json(parsed):
+    """ The records and state at the end of parse_corpus.parse_chunk() of a membrane. """
+    records, state = parsed
+    state = {name: getattr(state, name) for name in create_data_csv.ParseState.__slots__}
+    state['previous'] = record_to_json(state['previous'])
+    return {'records': [record_to_json(record) for record in records], 'state': state}
+
+
+def parsed_from_json(item):
+    state = dict(item['state'])
+    state['previous'] = record_from_json(state['previous'])
+    return [record_from_json(record) for record in item['records']], create_data_csv.ParseState(**state)
+
+
+def membranes_dir(manifest_file):
+    """ The directory of the files of the parsed membranes of a manifest, e.g. 'roll_1301.manifest.membranes'. """
+    return manifest_file + '.membranes'
+
+
+def membrane_file_name(key):
+    """ The name of the file of a parsed membrane, from its key. """
+    return hashlib.sha1(json.dumps(list(key)).encode('utf-8')).hexdigest() + '.json'
+
+
+def load_parsed(manifest_file, file_name):
+    """ The parsed membrane in a file, None if it is missing or can't be read. """
+    try:
+        with open(os.path.join(membranes_dir(manifest_file), file_name), 'r', encoding='utf-8') as file:
+            return parsed_from_json(json.load(file))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_parsed(manifest_file, key, parsed):
+    """ Write a parsed membrane to its own file, returning the name of the file. """
+    file_name = membrane_file_name(key)
+    os.makedirs(membranes_dir(manifest_file), exist_ok=True)
+    with open(os.path.join(membranes_dir(manifest_file), file_name), 'w', encoding='utf-8') as file:
+        json.dump(parsed_to_json(parsed), file, ensure_ascii=False)
+    return file_name
+
+
+def remove_stale_parsed(manifest_file, file_names):
+    """ Remove the files of parsed membranes that aren't in file_names. """
+    directory = membranes_dir(manifest_file)
+    if os.path.isdir(directory):
+        for file_name in set(os.listdir(directory)) - set(file_names):
+            os.remove(os.path.join(directory, file_name))
+
+
+def load_manifest(manifest_file):
+    """ Load the manifest, returning an empty one if it is missing or out of date. The keys are those of the
+        membranes of the transcript, in order, and the membranes are the name of the file of each parsed membrane,
+        by key; the parsed membranes are only read when they are needed. """
+    empty = {'version': MANIFEST_VERSION, 'parser': parser_fingerprint(), 'keys': [], 'membranes': {}}
+    if not os.path.isfile(manifest_file):
+        return empty
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except ValueError:
+        # not a manifest, e.g. written by an older version
+        return empty
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION or \
+            manifest.get('parser') != empty['parser']:
+        return empty
+    manifest['keys'] = [tuple(key) for key, file_name in manifest['membranes']]
+    manifest['membranes'] = {tuple(key): file_name for key, file_name in manifest['membranes']}
+    return manifest
+
+
+def save_manifest(manifest, manifest_file):
+    """ Write the manifest, the membranes as [key, file name] in the order of the transcript. """
+    saved = {name: value for name, value in manifest.items() if name != 'keys'}
+    saved['membranes'] = [[list(key), manifest['membranes'][key]] for key in manifest['keys']]
+    with open(manifest_file, 'w', encoding='utf-8') as file:
+        json.dump(saved, file, ensure_ascii=False)
+
+
+def update_roll(transcript=None, manifest_file=None):
+    """ Update the roll and daily sums CSV files of a transcript (settings.ROLL_CSV and settings.DAILY_SUMS_CSV for
+        the 1301-2 roll, see output_files()), only parsing the membranes of the transcript that have changed since
+        the last run. If no membrane, nor the days the Exchequer didn't sit, has changed and the CSV files are there,
+        nothing is written. Returns the number of membranes that were parsed. """
+
+    if transcript is None:
+        transcript = settings.ROLL_TXT
+
+    roll_csv, daily_sums_csv, default_manifest_file = output_files(transcript)
+    if manifest_file is None:
+        manifest_file = default_manifest_file
+
+    manifest = load_manifest(manifest_file)
+    stored = manifest['membranes']
+
+    # each membrane is a chunk (the first also has the text before the first membrane)
+    membranes = parse_corpus.split_at_membranes(create_data_csv.read_transcript(transcript), 1)
+    start_year = parse_corpus.roll_start_year(transcript)
+    locale = parse_corpus.roll_locale(transcript)
+
+    # the first chunk is parsed differently and dates and values depend on the year and locale, so they are all part
+    # of the key
+    keys = [(idx == 0, start_year, locale, membrane_hash(lines)) for idx, lines in enumerate(membranes)]
+
+    # the files depend on the days this roll's Exchequer didn't sit too
+    nothing_hash = file_hash(create_data_csv.nothing_csv_for(transcript))
+    outputs = [roll_csv, daily_sums_csv]
+
+    # nothing has changed since the files were written
+    if keys == manifest['keys'] and manifest.get('nothing') == nothing_hash and manifest.get('outputs') == outputs and \
+            all(os.path.isfile(output) for output in outputs):
+        return 0
+
+    results = []
+    parsed = 0
+    for key, lines in zip(keys, membranes):
+        result = load_parsed(manifest_file, stored[key]) if key in stored else None
+        if result is None:
+            result = parse_corpus.parse_chunk((lines, key[0], start_year, locale))
+            stored[key] = save_parsed(manifest_file, key, result)
+            parsed += 1
+        results.append(result)
+
+    records = parse_corpus.resolve_chunks(membranes, results, start_year, locale)
+    entries = [record for record in records if isinstance(record, RollEntry)]
+    daily_sums = [record for record in records if isinstance(record, DailySum)]
+
+    # create the data directory if necessary
+    if not os.path.exists(os.path.dirname(roll_csv)):
+        os.makedirs(os.path.dirname(roll_csv))
+
+    # with the days this roll's Exchequer didn't sit
+    columnar.write_df(create_data_csv.roll_df_from_entries(entries, create_data_csv.nothing_df_for(transcript)),
+                      roll_csv)
+    columnar.write_df(create_data_csv.daily_sums_df_from_records(daily_sums), daily_sums_csv)
+
+    # only keep the membranes in the current transcript
+    manifest['keys'] = keys
+    manifest['membranes'] = {key: stored[key] for key in keys}
+    manifest['nothing'] = nothing_hash
+    manifest['outputs'] = outputs
+    remove_stale_parsed(manifest_file, manifest['membranes'].values())
+    save_manifest(manifest, manifest_file)
+
+    return parsed
+
+
+if __name__ == '__main__':
+    parsed = update_roll()
+    print('Parsed {} membrane(s)'.format(parsed))
@@ -12,18 +12,60 @@ STOP_WORDS_DIR = DATA_DIR + '/stop_words'
 # the transcript created by Paul Dryburgh and Brendan Smith of the 1301/2 Irish Exchequer receipt roll
 ROLL_TXT = DATA_DIR + '/roll_1301.txt'
 
+# directory of transcripts of other rolls, parsed together as a corpus
+ROLLS_DIR = DATA_DIR + '/rolls'
+
+# the locale of the monetary values of rolls in the corpus that aren't in English (£.s.d. and marks), by roll name,
+# e.g. {'roll_1290': 'la'}, see money.MONEY_LOCALES
+ROLL_LOCALES = {}
+
 # csv of 'NOTHING' dates
 NOTHING_CSV = DATA_DIR + '/nothing_dates.csv'
 
 # roll data as csv
 ROLL_CSV = DATA_DIR + '/roll_1301.csv'
 
+# data of all the rolls in the corpus as csv
+CORPUS_CSV = DATA_DIR + '/corpus.csv'
+
+# daily sums of all the rolls in the corpus as csv
+CORPUS_DAILY_SUMS_CSV = DATA_DIR + '/corpus_daily_sums.csv'
+
 # roll data with extracted entities
 ROLL_WITH_ENTITIES_CSV = DATA_DIR + '/roll_entities_1301.csv'
 
+# the extractor that made the entities CSV, so a re-run only extracts the entities of rows that have changed
+ROLL_ENTITIES_MANIFEST = DATA_DIR + '/roll_entities_1301.manifest'
+
+# cache of the POS tags of the details, so unchanged details aren't tagged again when entities are extracted
+TAG_CACHE_DB = DATA_DIR + '/tag_cache.sqlite'
+
+# the POS tagger used to extract entities, the default NLTK tagger ('perceptron') or the quicker tagger trained on the
+# details of the roll ('roll'), see roll_tagger.py
+TAGGER_ENGINE = 'perceptron'
+
+# the tagger trained on the details of the roll
+ROLL_TAGGER_MODEL = DATA_DIR + '/roll_tagger.json'
+
+# local directory of the NLTK models (punkt and the tagger), looked in before NLTK's usual places
+NLTK_DATA_DIR = DATA_DIR + '/nltk_data'
+
+# download the NLTK models into NLTK_DATA_DIR if they're missing, set to False on machines without network access
+NLTK_DOWNLOAD = True
+
+# the tokenizer that splits the details into words to extract entities, NLTK's word_tokenize ('nltk') or the quicker
+# regex tokenizer for the details of the roll ('roll'), see roll_tokenizer.py
+TOKENIZER = 'nltk'
+
 # daily sums as csv
 DAILY_SUMS_CSV = DATA_DIR + '/daily_sums_1301.csv'
 
+# hashes of the membranes of the transcript and their parsed entries, so only edited membranes are parsed again
+ROLL_MANIFEST = DATA_DIR + '/roll_1301.manifest'
+
+# number of values and amounts of pence whose conversions are remembered by money.value_to_pence and pence_to_psd
+MONEY_CACHE_SIZE = 4096
+
 # report comparing daily sums
 DAILY_SUMS_COMPARE_CSV = DATA_DIR + '/daily_sums_compare.csv'
 
@@ -0,0 +1,57 @@
+import unittest
+
+from receipt_roll import create_data_csv
+
+
+class TestClassifyLine(unittest.TestCase):
+    """ Test the classification of lines in the transcript. """
+
+    def test_1(self):
+        kind, match = create_data_csv.classify_line('[m. 12]')
+        self.assertEqual(kind, create_data_csv.MEMBRANE_LINE)
+        self.assertEqual(match.group('membrane_no'), '12')
+
+    def test_2(self):
+        self.assertEqual(create_data_csv.classify_line('DROGHEDA IN MEATH')[0], create_data_csv.PLACE_LINE)
+
+    def test_3(self):
+        self.assertEqual(create_data_csv.classify_line('[DUBLIN]')[0], create_data_csv.PLACE_LINE)
+
+    def test_4(self):
+        kind, match = create_data_csv.classify_line('Saturday 30 September 1301')
+        self.assertEqual(kind, create_data_csv.DATE_LINE)
+        self.assertEqual((match.group('weekday'), match.group('day_no'), match.group('month')),
+                         ('Saturday', '30', 'September'))
+
+    def test_5(self):
+        self.assertEqual(create_data_csv.classify_line('Gross receipt in Easter term, 30 Edward I [1302]')[0],
+                         create_data_csv.TERM_LINE)
+
+    def test_6(self):
+        self.assertEqual(create_data_csv.classify_line('DAILY SUM RECEIVED: £97.5s.')[0],
+                         create_data_csv.DAILY_SUM_LINE)
+
+    def test_7(self):
+        self.assertEqual(create_data_csv.classify_line('SUM: £17.20d.')[0], create_data_csv.DAILY_SUM_LINE)
+
+    def test_8(self):
+        self.assertEqual(create_data_csv.classify_line('SUM OF EASTER TERM: £1,000')[0], create_data_csv.IGNORED_LINE)
+
+    def test_9(self):
+        self.assertEqual(create_data_csv.classify_line('WEEKLY SUM: £20')[0], create_data_csv.IGNORED_LINE)
+
+    def test_10(self):
+        self.assertEqual(create_data_csv.classify_line('NOTHING.')[0], create_data_csv.IGNORED_LINE)
+
+    def test_11(self):
+        self.assertEqual(create_data_csv.classify_line('Receipts of the middle time')[0],
+                         create_data_csv.IGNORED_LINE)
+
+    def test_12(self):
+        kind, match = create_data_csv.classify_line('Richard fitz John, ½ mark to have a writ.')
+        self.assertEqual(kind, create_data_csv.DETAILS_LINE)
+        self.assertIsNone(match)
+
+
+if __name__ == '__main__':
+    unittest.main()
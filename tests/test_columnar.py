@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import settings
+from receipt_roll import common
+from receipt_roll.data import columnar, roll
+from receipt_roll.plots import sheriffs
+
+
+class TestTypedDf(unittest.TestCase):
+    """ Test the types given to the columns of the data sets. """
+
+    def setUp(self):
+        self.df = columnar.typed_df(pd.DataFrame({
+            common.MEM_COL: [1, 1],
+            common.TERM_COL: ['Michaelmas', 'Michaelmas'],
+            common.DATE_COL: ['1301-09-30', '1301-10-18'],
+            common.DAY_ENTRY: [1.0, None],
+            common.DAY_COL: ['Saturday', 'Wednesday'],
+            common.SOURCE_COL: ['URIEL', 'NOTHING'],
+            common.PENCE_COL: [80.25, 0.0]}))
+
+    def test_1(self):
+        self.assertEqual(self.df[common.MEM_COL].dtype, 'int64')
+        self.assertEqual(str(self.df[common.DAY_ENTRY].dtype), 'Int64')
+        self.assertTrue(pd.isna(self.df[common.DAY_ENTRY][1]))
+
+    def test_2(self):
+        self.assertEqual(list(self.df[common.TERM_COL].cat.categories), common.TERMS)
+        self.assertEqual(self.df[common.SOURCE_COL].dtype, 'category')
+
+    def test_3(self):
+        self.assertEqual(self.df[common.DATE_COL][0], pd.Timestamp('1301-09-30'))
+
+    def test_4(self):
+        self.assertEqual(self.df[common.PENCE_COL][0], 80.25)
+
+    def test_5(self):
+        self.assertEqual(columnar.columnar_file('data/roll_1301.csv'), 'data/roll_1301.parquet')
+
+
+@unittest.skipUnless(columnar.HAVE_PYARROW, 'pyarrow is needed to write the Parquet file')
+class TestReadDf(unittest.TestCase):
+    """ Test the roll matrices on a data set read from its typed Parquet file. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_file = os.path.join(self.tmp_dir, 'roll_entities.csv')
+        columnar.write_df(pd.DataFrame({
+            common.MEM_COL: [1, 1, 1, 2],
+            common.TERM_COL: ['Michaelmas', 'Michaelmas', 'Michaelmas', 'Hilary'],
+            common.DATE_COL: ['1301-09-30', '1301-10-02', '1301-10-18', '1302-01-15'],
+            common.DAY_COL: ['Saturday', 'Monday', 'Wednesday', 'Monday'],
+            common.SOURCE_COL: ['URIEL', 'DUBLIN', 'NOTHING', 'DUBLIN'],
+            common.DETAILS_COL: ['From Henry de Curcy 5 marks.', 'Nicholas de Cruis, 50s.', 'NOTHING',
+                                 'Roger Roth, sheriff, £20.'],
+            common.PENCE_COL: [800, 600, 0, 4800]}), self.csv_file)
+
+    def tearDown(self):
+        for file in os.listdir(self.tmp_dir):
+            os.remove(os.path.join(self.tmp_dir, file))
+        os.rmdir(self.tmp_dir)
+
+    def test_1(self):
+        self.assertTrue(os.path.isfile(columnar.columnar_file(self.csv_file)))
+        self.assertEqual(columnar.read_df(self.csv_file)[common.SOURCE_COL].dtype, object)
+        self.assertEqual(columnar.read_df(self.csv_file, categories=True)[common.SOURCE_COL].dtype, 'category')
+
+    def test_2(self):
+        # only the sources and terms that occur are in the matrices
+        with mock.patch.object(settings, 'ROLL_WITH_ENTITIES_CSV', self.csv_file):
+            matrix = roll.source_term_payments_matrix_df()
+            days = roll.days_of_week_total_by_term()
+        self.assertEqual(list(matrix.index), ['Dublin', 'Uriel'])
+        self.assertEqual(matrix.loc['Uriel'].tolist(), [800, 0, 0, 0])
+        self.assertEqual(matrix.loc['Dublin'].tolist(), [600, 4800, 0, 0])
+        self.assertEqual(list(days.index), roll.terms_for_column())
+        self.assertEqual(days.loc['Michaelmas', 'Saturday'], 800)
+        self.assertEqual(days.loc['Hilary', 'Saturday'], 0)
+        self.assertEqual(days.loc['Hilary', 'Monday'], 4800)
+
+    def test_3(self):
+        # a county is only marked in the terms its sheriff appeared in, whether the sources are categories or not
+        for categories in (False, True):
+            df = columnar.read_df(self.csv_file, categories=categories)
+            matrix = sheriffs.sheriffs_terms_matrix(df[df[common.SOURCE_COL] != 'NOTHING'])
+            self.assertEqual(list(matrix.index), ['DUBLIN', 'URIEL'])
+            self.assertEqual(matrix.loc['URIEL'].tolist(), [1, 0, 0, 0])
+            self.assertEqual(matrix.loc['DUBLIN'].tolist(), [1, 1, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
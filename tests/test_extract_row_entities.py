@@ -0,0 +1,49 @@
+import unittest
+
+from nltk import pos_tag, word_tokenize
+
+from receipt_roll import extract_entities
+
+
+class TestExtractRowEntities(unittest.TestCase):
+    """ People, places and keywords from one tagging of the details are the same as extracting each on its own. """
+
+    def test_1(self):
+        details = 'Of the farm of the manor of Chapelizod, £11.13s.4d., by Brother W. de Ros, prior of Kilmainham.'
+        people, places, keywords = extract_entities.extract_row_entities(details, 'DUBLIN')
+        self.assertEqual(people, extract_entities.extract_people(details))
+        self.assertEqual(places, extract_entities.apply_extract_places({'Details': details, 'Source': 'DUBLIN',
+                                                                        'People': people}))
+        self.assertEqual(keywords, extract_entities.extract_keywords({'Details': details}))
+
+    def test_2(self):
+        people, places, keywords = extract_entities.extract_row_entities('Richard fitz John, ½ mark to have a writ.',
+                                                                         'DUBLIN')
+        self.assertEqual(people, 'Richard fitz John')
+
+
+class TestExtractEntitiesOfRows(unittest.TestCase):
+    """ Extracting entities across worker processes gives the same results, in the same order, as one process. """
+
+    def test_1(self):
+        rows = [('From Henry de Curcy 5 marks of a fine for trespass.', 'DUBLIN'),
+                ('William de Kent, 10s., for him and his pledges likewise.', 'KILKENNY'),
+                ('Richard fitz John, ½ mark to have a writ.', 'DUBLIN')] * 3
+        self.assertEqual(extract_entities.extract_entities_of_rows(rows, workers=2, chunk_rows=2),
+                         extract_entities.extract_entities_of_rows(rows))
+
+
+class TestTagChunk(unittest.TestCase):
+    """ Tagging details in batches gives the same tags as tagging them one at a time. """
+
+    def test_1(self):
+        texts = [extract_entities.clean_details(details) for details in [
+            'From Henry de Curcy 5 marks of a fine for trespass.',
+            'William de Cauntone, sheriff, £20 for debts of divers persons.',
+            'Of the rent of Thristeldermot and Gavernagh, £7, by Walter Ivethorn.']]
+        tags = [extract_entities.tidy_tuples(pos_tag(word_tokenize(text))) for text in texts]
+        self.assertEqual(extract_entities.tag_chunk(texts, batch_rows=2), tags)
+
+
+if __name__ == '__main__':
+    unittest.main()
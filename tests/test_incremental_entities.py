@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+import pandas
+
+from receipt_roll import common, extract_entities
+
+ROWS = [(1, '1301-09-30', 1.0, 'Richard fitz John, OVP to have a writ.', 'TRIM', 'Richard fitz John', 'Trim', 'writ'),
+        (1, '1301-09-30', 2.0, 'Of the same.', 'TRIM', None, 'Trim', ''),
+        (2, '1301-10-01', float('nan'), 'NOTHING', 'NOTHING', None, '', '')]
+
+COLUMNS = [common.MEM_COL, common.DATE_COL, common.DAY_ENTRY, common.DETAILS_COL, common.SOURCE_COL,
+           common.PEOPLE_COL, common.PLACES_COL, common.KEYWORDS_COL]
+
+
+class TestIncrementalEntities(unittest.TestCase):
+    """ Test the entities of unchanged rows are carried over from the previous run. """
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.entities_csv = os.path.join(self.data_dir, 'roll_entities.csv')
+        self.manifest_file = os.path.join(self.data_dir, 'roll_entities.manifest')
+        pandas.DataFrame(ROWS, columns=COLUMNS).to_csv(self.entities_csv, index=False)
+        extract_entities.save_entities_manifest('extractor', self.manifest_file)
+
+    def tearDown(self):
+        for file in (self.entities_csv, self.manifest_file):
+            os.remove(file)
+        os.rmdir(self.data_dir)
+
+    def test_1(self):
+        # a missing day entry is the same key however it's read
+        self.assertEqual(extract_entities.row_key(2, '1301-10-01', float('nan')), (2, '1301-10-01', None))
+        self.assertEqual(extract_entities.row_key(1.0, '1301-09-30', 2.0), (1, '1301-09-30', 2))
+
+    def test_2(self):
+        previous = extract_entities.previous_entities(self.entities_csv, self.manifest_file, 'extractor')
+        keys = [extract_entities.row_key(*row[:3]) for row in ROWS] + [(3, '1301-10-02', 1)]
+        rows = [('Richard fitz John, OVP to have a writ.', 'TRIM'), ('Of the same.', 'DUBLIN'),
+                ('NOTHING', 'NOTHING'), ('A new entry.', 'TRIM')]
+        entities = extract_entities.carried_entities(keys, rows, previous)
+
+        # the unchanged rows are carried over, the changed and new rows aren't
+        self.assertEqual(entities[0], ('Richard fitz John', 'Trim', 'writ'))
+        self.assertIsNone(entities[1])
+        self.assertEqual(len(entities[2]), 3)
+        self.assertIsNone(entities[3])
+
+    def test_3(self):
+        # nothing is carried over from entities made by another extractor
+        self.assertEqual(extract_entities.previous_entities(self.entities_csv, self.manifest_file, 'another'), {})
+        os.remove(self.manifest_file)
+        self.assertEqual(extract_entities.previous_entities(self.entities_csv, self.manifest_file, 'extractor'), {})
+        extract_entities.save_entities_manifest('extractor', self.manifest_file)
+
+    def test_4(self):
+        # the manifest is JSON, anything else is ignored
+        with open(self.manifest_file, 'rb') as file:
+            self.assertTrue(file.read().startswith(b'{'))
+        with open(self.manifest_file, 'wb') as file:
+            file.write(b'\x80\x04not json')
+        self.assertEqual(extract_entities.previous_entities(self.entities_csv, self.manifest_file, 'extractor'), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
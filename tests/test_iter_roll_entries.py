@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from receipt_roll import create_data_csv
+
+TRANSCRIPT = ['[m. 1]',
+              'Gross receipt in Michaelmas term at the end of 29 Edward I.',
+              '',
+              'Saturday 30 September 1301',
+              'URIEL',
+              'From Henry de Curcy 5 marks of a fine for trespass.',
+              'The same, of the profits of the county.',
+              'DAILY SUM RECEIVED: 10 marks',
+              '',
+              'Monday 2 October',
+              '[DUBLIN]',
+              'Nicholas de Cruis, 50s. for the wardship.',
+              'SUM: 50s.']
+
+
+class TestIterRollEntries(unittest.TestCase):
+    """ Test the streaming of entries and daily sums from the transcript. """
+
+    def setUp(self):
+        self.records = list(create_data_csv.iter_roll_entries(TRANSCRIPT))
+        self.entries = [r for r in self.records if isinstance(r, create_data_csv.RollEntry)]
+        self.sums = [r for r in self.records if isinstance(r, create_data_csv.DailySum)]
+
+    def test_1(self):
+        self.assertEqual(len(self.entries), 3)
+        self.assertEqual(len(self.sums), 2)
+
+    def test_2(self):
+        self.assertEqual(self.entries[0], create_data_csv.RollEntry(
+            1, 'Michaelmas', '1301-09-30', 1, 'Saturday', 'URIEL',
+            'From Henry de Curcy 5 marks of a fine for trespass.', '5 marks', 800, 6, 101))
+
+    def test_3(self):
+        # 'the same' takes the value of the line above
+        self.assertEqual((self.entries[1].value, self.entries[1].pence, self.entries[1].day_entry),
+                         ('5 marks', 800, 2))
+
+    def test_4(self):
+        self.assertEqual((self.entries[2].date, self.entries[2].source, self.entries[2].day_entry),
+                         ('1301-10-02', 'DUBLIN', 1))
+
+    def test_5(self):
+        self.assertEqual(self.sums[1], create_data_csv.DailySum('1301-10-02', '50s.', 600, 13, 291))
+
+    def test_6(self):
+        # records are compact, i.e. they don't have a __dict__
+        self.assertFalse(hasattr(self.entries[0], '__dict__'))
+
+    def test_7(self):
+        # the offset of each record is the start of its line in the transcript
+        text = '\n'.join(TRANSCRIPT).encode('utf-8')
+        for record in self.records:
+            line = TRANSCRIPT[record.line - 1]
+            self.assertEqual(text[record.offset:record.offset + len(line)].decode('utf-8'), line)
+
+    def test_8(self):
+        # the raw dump of the entries and daily sums reads back as the records, and the roll data made from it is
+        # the same as that made from the records
+        tmp_dir = tempfile.mkdtemp()
+        roll_file = os.path.join(tmp_dir, 'roll.csv')
+        sums_file = os.path.join(tmp_dir, 'daily_sums.csv')
+        try:
+            create_data_csv.write_entries_csv(iter(self.records), roll_file, sums_file)
+            roll_df = pd.read_csv(roll_file)
+            sums_df = pd.read_csv(sums_file)
+        finally:
+            os.remove(roll_file)
+            os.remove(sums_file)
+            os.rmdir(tmp_dir)
+
+        self.assertEqual(list(roll_df.columns), create_data_csv.DATA_COLUMNS)
+        self.assertEqual([create_data_csv.RollEntry(*row) for row in roll_df.itertuples(index=False)], self.entries)
+        self.assertEqual([create_data_csv.DailySum(*row) for row in sums_df.itertuples(index=False)], self.sums)
+
+        nothing_df = pd.DataFrame({'Membrane': [1], 'Term': ['Michaelmas'], 'Date': ['1301-10-01'],
+                                   'Day': ['Sunday'], 'Source': ['NOTHING'], 'Details': ['NOTHING'],
+                                   'Value': ['NOTHING'], 'Pence': [0]})
+        pd.testing.assert_frame_equal(create_data_csv.roll_df_from_entries(roll_df, nothing_df),
+                                      create_data_csv.roll_df_from_entries(self.entries, nothing_df))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import receipt_roll.money as money
+import settings
+from receipt_roll.money import pence_to_psd
+
+
+class TestMoneyCache(unittest.TestCase):
+    """ Test the cache of money conversions. """
+
+    def tearDown(self):
+        money.set_cache_size(settings.MONEY_CACHE_SIZE)
+
+    def test_1(self):
+        money.cache_clear()
+        for _ in range(3):
+            self.assertEqual(money.value_to_pence('½ mark'), 80)
+        info = money.cache_info()['value_to_pence']
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_2(self):
+        # ints and floats are cached apart
+        money.cache_clear()
+        self.assertEqual(money.pence_to_psd(240), money.pence_to_psd(240.0))
+        self.assertEqual(money.cache_info()['pence_to_psd'].currsize, 2)
+
+    def test_3(self):
+        money.set_cache_size(1)
+        money.pence_to_psd(12)
+        money.pence_to_psd(24)
+        money.pence_to_psd(12)
+        info = money.cache_info()['pence_to_psd']
+        self.assertEqual((info.hits, info.misses, info.maxsize), (0, 3, 1))
+
+    def test_4(self):
+        # a conversion imported before the size is changed uses the new cache
+        money.set_cache_size(2)
+        pence_to_psd(12)
+        pence_to_psd(12)
+        self.assertIs(pence_to_psd, money.pence_to_psd)
+        info = pence_to_psd.cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize), (1, 1, 2))
+        self.assertEqual(money.cache_info()['pence_to_psd'], info)
+
+
+if __name__ == '__main__':
+    unittest.main()
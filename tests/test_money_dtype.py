@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import receipt_roll.money as money
+from receipt_roll.data import roll
+
+
+class TestMoneyDtype(unittest.TestCase):
+    """ Test the exact, farthing backed, money dtype. """
+
+    def test_1(self):
+        amounts = pd.Series([800, 316.25, np.nan, 0.75]).astype('money')
+        self.assertEqual(str(amounts.dtype), 'money')
+        self.assertEqual(amounts.values.farthings.tolist(), [3200, 1265, 0, 3])
+        self.assertEqual(amounts.isna().tolist(), [False, False, True, False])
+
+    def test_2(self):
+        # sums are exact whole numbers of farthings, NaN are skipped
+        amounts = pd.Series(money.MoneyArray.from_pence([0.25] * 10 + [np.nan]))
+        self.assertEqual(amounts.sum(), money.Money(10))
+        self.assertEqual(amounts.sum().pence, 2.5)
+
+    def test_3(self):
+        df = pd.DataFrame({'Date': ['a', 'b', 'a', 'c'],
+                           'Pence': money.MoneyArray.from_pence([240, 0.5, 12.25, np.nan])})
+        sums = df.groupby('Date')['Pence'].sum()
+        self.assertEqual(sums.tolist(), [money.Money(1009), money.Money(2), money.Money(0)])
+
+    def test_4(self):
+        # values in £.s.d. and marks
+        amounts = pd.Series(['£1.6s.4d.', '2 marks', 'the same']).astype('money')
+        self.assertEqual(amounts[0], money.Money.from_pence(316))
+        self.assertEqual(amounts[1].pence, 320)
+        self.assertIs(amounts[2], pd.NA)
+
+    def test_5(self):
+        amounts = money.MoneyArray.from_pence([240, 316.25])
+        self.assertEqual(str(amounts[1]), '£1.6s.4¼d.')
+        self.assertEqual(np.asarray(amounts).tolist(), [240, 316.25])
+        self.assertEqual((amounts == money.Money(960)).tolist(), [True, False])
+
+    def test_6(self):
+        self.assertEqual(money.Money.from_pence(800).marks(), '5 marks')
+        self.assertEqual(money.Money.from_pence(160).marks(), '1 mark')
+        self.assertEqual(money.Money.from_pence(80).marks(), '½ mark')
+        self.assertEqual(money.Money.from_pence(316).marks(), '£1.6s.4d.')
+
+    def test_7(self):
+        # daily sums are exact whole numbers of farthings, a day without amounts sums to nothing
+        df = pd.DataFrame({'Date': ['a', 'b', 'a', 'c'], 'Pence': [240, 0.5, 12.25, np.nan]})
+        sums = roll.daily_sum_from_roll_df(df)
+        self.assertEqual(sums['Pence'].tolist(), [252.25, 0.5, 0])
+        self.assertEqual(sums['£.s.d.'].tolist(), ['£1.1s.0¼d.', '0½d.', ''])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+import receipt_roll.money as money
+from tests.test_parse_money import VALUES
+
+
+class TestLatinMoney(unittest.TestCase):
+    """ Test finding values with the Latin denominations. """
+
+    def test_1(self):
+        text = 'De vicecomite Dublin, xx li. xiii s. iiij d. ob., de firma.'
+        self.assertEqual(money.parse_money(text, 'la'), ('xx li. xiii s. iiij d. ob.', 4960.5, (22, 48)))
+
+    def test_2(self):
+        self.assertEqual(money.parse_money('x marc.', 'la')[1], 1600)
+        self.assertEqual(money.parse_money('di. marc. de fine', 'la')[1], 80)
+        self.assertEqual(money.parse_money('xl s. et vi d.', 'la')[1], 486)
+        self.assertEqual(money.parse_money('ob. et qua.', 'la')[1], 0.75)
+        self.assertEqual(money.parse_money('ii solidos et iii denarios', 'la')[1], 27)
+
+    def test_3(self):
+        # units and numerals aren't found inside words
+        self.assertEqual(money.parse_money('Willelmus de Lacy, pro licentia', 'la'), (None, None, None))
+        self.assertEqual(money.parse_money('NOTHING', 'la'), ('NOTHING', 0, (0, 7)))
+
+    def test_4(self):
+        self.assertEqual(money.value_to_pence('C s.', 'la'), 1200)
+
+    def test_5(self):
+        with self.assertRaises(ValueError):
+            money.parse_money('£1', 'fr')
+
+    def test_6(self):
+        # English values are found by the forms of its table, in order of precedence
+        self.assertIsNotNone(money.money_scanner(money.DEFAULT_LOCALE).forms)
+        self.assertEqual(money.parse_money('£20 marks', money.DEFAULT_LOCALE), ('20 marks', 3200, (1, 9)))
+
+
+class TestDenominationTables(unittest.TestCase):
+    """ Test a scanner compiled from a table of the English denominations. """
+
+    def test_1(self):
+        # values on their own have the same pence as value_to_pence()
+        scanner = money.MoneyScanner(money.MoneyLocale(
+            denominations=[
+                money.Denomination('pound', money.pound_as_pence, ['£'], prefix=True),
+                money.Denomination('mark', money.mark_as_pence, ['mark', 'marks']),
+                money.Denomination('shilling', money.shilling_as_pence, ['s.']),
+                money.Denomination('penny', 1, ['d.'])],
+            number_words={'one': 1, 'a': 1}, conjunctions=[], roman=False))
+        for value, pence in VALUES:
+            self.assertEqual(scanner.scan('Of a fine, {}, for trespass.'.format(value))[1], pence)
+
+    def test_2(self):
+        self.assertEqual(money.trie_pattern(['marc.', 'marca', 'marcas']), r'marc(?:\.|a(?:s)?)')
+        self.assertEqual(money.roman_to_int('xiiij'), 14)
+        self.assertEqual(money.roman_to_int('xlix'), 49)
+
+
+if __name__ == '__main__':
+    unittest.main()
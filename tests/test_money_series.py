@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import receipt_roll.money as money
+from tests.test_parse_money import VALUES
+
+
+class TestValuesToPence(unittest.TestCase):
+    """ Test converting a Series of values to pence. """
+
+    def test_1(self):
+        values = pd.Series([value for value, pence in VALUES])
+        self.assertEqual(money.values_to_pence(values).tolist(), [pence for value, pence in VALUES])
+
+    def test_2(self):
+        pence = money.values_to_pence(pd.Series(['NOTHING', 'the same', None, '2 marks', '2 marks']))
+        self.assertEqual(pence[0], 0)
+        self.assertTrue(np.isnan(pence[1]) and np.isnan(pence[2]))
+        self.assertEqual(pence[4], 320)
+
+    def test_3(self):
+        # the same as the scalar function, including values with text after them
+        values = ['One mark', '¾ marks', '£1.6s.4d. of', '12s.4d', '£3 marks']
+        self.assertEqual(money.values_to_pence(pd.Series(values)).tolist(),
+                         [money.value_to_pence(value) for value in values])
+
+
+class TestPenceToPsdSeries(unittest.TestCase):
+    """ Test converting a Series of pence to £.s.d. """
+
+    def test_1(self):
+        pence = [0, 1, 0.25, 12, 160, 240, 241.75, 316.5, 2716, 3540, 244.75]
+        self.assertEqual(money.pence_to_psd_series(pd.Series(pence)).tolist(),
+                         [money.pence_to_psd(value) for value in pence])
+
+    def test_2(self):
+        self.assertEqual(money.pence_to_psd_series(pd.Series([np.nan, 316.25])).tolist(), ['', '£1.6s.4¼d.'])
+
+    def test_3(self):
+        # the index is kept
+        psd = money.pence_to_psd_series(pd.Series([240, 12], index=['a', 'b']))
+        self.assertEqual(psd['b'], '1s.')
+
+
+if __name__ == '__main__':
+    unittest.main()
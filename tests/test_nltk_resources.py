@@ -0,0 +1,51 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import nltk
+
+from receipt_roll import nltk_resources
+
+
+class TestNltkResources(unittest.TestCase):
+    """ Test the NLTK models are found in the local directory without touching the network. """
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.path = list(nltk.data.path)
+
+    def tearDown(self):
+        nltk.data.path[:] = self.path
+        shutil.rmtree(self.data_dir)
+
+    def test_1(self):
+        for resource, package in nltk_resources.required_resources():
+            os.makedirs(os.path.join(self.data_dir, resource))
+        with mock.patch.object(nltk, 'download', side_effect=AssertionError('downloaded')):
+            nltk_resources.check_resources(data_dir=self.data_dir, download=True)
+        self.assertEqual(nltk.data.path[0], self.data_dir)
+
+    def test_2(self):
+        self.assertEqual(nltk_resources.missing_resources([('tokenizers/no_such_model', 'no_such_model')]),
+                         [('tokenizers/no_such_model', 'no_such_model')])
+
+    def test_3(self):
+        # only the models that are needed
+        self.assertEqual(nltk_resources.required_resources(tokenize=False, tag=False), [])
+        self.assertEqual([package for resource, package in nltk_resources.required_resources(tag=False)],
+                         ['punkt_tab' if nltk_resources.nltk_version() >= (3, 8, 2) else 'punkt'])
+
+    def test_4(self):
+        # importing the entity extraction doesn't import NLTK or load the stop words
+        code = 'import sys; from receipt_roll import extract_entities; print("nltk" in sys.modules)'
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(output.stdout.strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+import pandas as pd
+
+from receipt_roll import common, create_data_csv
+
+
+class TestAddNothingDays(unittest.TestCase):
+    """ Test adding the days the Exchequer didn't sit to the entries. """
+
+    def setUp(self):
+        self.entries = pd.DataFrame([
+            [9, 'Hilary', '1302-03-16', 1, 'Friday', 'TRIM', 'Entry A', '½ mark', 80.0, 10, 400],
+            [9, 'Hilary', '1302-03-17', 1, 'Saturday', 'TRIM', 'Entry B', '74s.', 888.0, 12, 460],
+            [9, 'Hilary', '1302-03-17', 2, 'Saturday', 'DUBLIN', 'Entry C', '£20', 4800.0, 13, 500],
+            [9, 'Hilary', '1302-03-20', 1, 'Tuesday', 'DUBLIN', 'Entry D', '10s.', 120.0, 16, 560]],
+            columns=create_data_csv.DATA_COLUMNS)
+        self.nothing = pd.DataFrame([
+            [9, 'Hilary', '1302-03-17', None, 'Saturday', 'NOTHING', 'NOTHING', 'NOTHING', 0.0],
+            [9, 'Hilary', '1302-03-19', None, 'Monday', 'NOTHING', 'NOTHING', 'NOTHING', 0.0]],
+            columns=create_data_csv.DATA_COLUMNS[:-2])
+
+    def test_1(self):
+        df = create_data_csv.add_nothing_days(self.entries, self.nothing)
+        self.assertEqual(df[common.DETAILS_COL].tolist(), ['Entry A', 'Entry B', 'Entry C', 'NOTHING', 'NOTHING',
+                                                           'Entry D'])
+
+    def test_2(self):
+        df = create_data_csv.add_nothing_days(self.entries, self.nothing.iloc[0:0])
+        self.assertEqual(df[common.DETAILS_COL].tolist(), ['Entry A', 'Entry B', 'Entry C', 'Entry D'])
+
+    def test_3(self):
+        self.assertIsNone(create_data_csv.nothing_csv_for('/tmp/no_such_dir/roll_1305.txt'))
+
+    def test_4(self):
+        # feast days are not in the transcript, so don't have a line
+        df = create_data_csv.add_nothing_days(self.entries, self.nothing)
+        self.assertEqual(df[common.LINE_COL].isna().tolist(), [False, False, False, True, True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
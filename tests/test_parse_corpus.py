@@ -0,0 +1,39 @@
+import unittest
+
+from receipt_roll import create_data_csv, money, parse_corpus
+
+
+class TestParseCorpus(unittest.TestCase):
+    """ Parsing a transcript in chunks should give the same result as parsing it in one go. """
+
+    def setUp(self):
+        self.lines = create_data_csv.read_transcript()
+        self.records = list(create_data_csv.iter_roll_entries(self.lines))
+
+    def parse_in_chunks(self, chunk_lines):
+        chunks = parse_corpus.split_at_membranes(self.lines, chunk_lines)
+        results = [parse_corpus.parse_chunk((chunk, idx == 0, create_data_csv.START_YEAR, money.DEFAULT_LOCALE))
+                   for idx, chunk in enumerate(chunks)]
+        return chunks, parse_corpus.resolve_chunks(chunks, results, create_data_csv.START_YEAR)
+
+    def test_1(self):
+        chunks, records = self.parse_in_chunks(1)
+        # every membrane is a chunk
+        self.assertEqual(len(chunks), 19)
+        self.assertEqual(records, self.records)
+
+    def test_2(self):
+        chunks, records = self.parse_in_chunks(300)
+        self.assertEqual(records, self.records)
+
+    def test_3(self):
+        chunks = parse_corpus.split_at_membranes(self.lines, 300)
+        for chunk in chunks[1:]:
+            self.assertTrue(create_data_csv.membrane_regex.match(chunk[0]))
+
+    def test_4(self):
+        self.assertEqual(parse_corpus.roll_start_year('data/rolls/roll_1305.txt'), 1305)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+import receipt_roll.money as money
+from receipt_roll import create_data_csv
+
+# values and their pence, the same cases as TestValueToPence
+VALUES = [("1 mark", 160), ("a mark", 160), ("one mark", 160), ("½ mark", 80), ("2 marks", 320),
+          ("£1.6s.4d.", 316), ("£11.6s.4d.", 2716), ("£1.6s.4¼d.", 316.25), ("£1.6s.4½d.", 316.5),
+          ("£1.6s.4¾d.", 316.75), ("£1.6s.", 312), ("£11.6s.", 2712), ("£14.15s.", 3540), ("6s.4d.", 76),
+          ("16s.9d.", 201), ("6s.4¼d.", 76.25), ("6s.4½d.", 76.5), ("6s.4¾d.", 76.75), ("4d.", 4), ("4¼d.", 4.25),
+          ("4½d.", 4.5), ("4¾d.", 4.75), ("6s.", 72), ("16s.", 192), ("£1.", 240), ("£12.", 2880), ("£1.4d.", 244),
+          ("£11.4d.", 2644), ("£1.4¼d.", 244.25), ("£1.4½d.", 244.5), ("£1.4¾d.", 244.75)]
+
+
+class TestParseMoney(unittest.TestCase):
+    """ Test finding a value and its pence in a single scan. """
+
+    def test_1(self):
+        for value, pence in VALUES:
+            self.assertEqual(money.parse_money('Of a fine, {}, for trespass.'.format(value))[1], pence)
+
+    def test_2(self):
+        text = 'Of aid promised to the king, £8.13s.4d., by the community of the town of Kilkenny.'
+        self.assertEqual(money.parse_money(text), ('£8.13s.4d.', 2080, (29, 39)))
+
+    def test_3(self):
+        # marks come first, wherever they are
+        self.assertEqual(money.parse_money('10s. and 5 marks')[:2], ('5 marks', 800))
+
+    def test_4(self):
+        # a value that starts inside another
+        self.assertEqual(money.parse_money('£20 marks')[:2], ('20 marks', 3200))
+
+    def test_5(self):
+        self.assertEqual(money.parse_money('NOTHING'), ('NOTHING', 0, (0, 7)))
+
+    def test_6(self):
+        self.assertEqual(money.parse_money('The same, for the same.'), (None, None, None))
+
+    def test_7(self):
+        # the same as extract_value() and the regexes for each kind of value
+        for text in ['£3 and 4½d.', '1½ marks', 'Ida mark 3d.', '6s.4½d. 4d.', '£14.15s. and £2']:
+            value = money.extract_value(text)
+            self.assertEqual(money.parse_money(text)[:2], (value, money.regex_value_to_pence(value)))
+
+    def test_8(self):
+        # the English table gives exactly the same values and pence, of the same types, as the regexes for every
+        # line of the transcript
+        for line in create_data_csv.read_transcript():
+            value = money.extract_value(line)
+            pence = money.regex_value_to_pence(value) if value is not None else None
+            found, pennies, span = money.parse_money(line)
+            self.assertEqual((found, pennies, type(pennies)), (value, pence, type(pence)), line)
+            if value is not None:
+                self.assertEqual(money.value_to_pence(value), pence)
+
+
+if __name__ == '__main__':
+    unittest.main()
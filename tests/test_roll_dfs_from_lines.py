@@ -0,0 +1,64 @@
+import unittest
+
+import pandas as pd
+
+from receipt_roll import create_data_csv
+from tests.test_iter_roll_entries import TRANSCRIPT
+
+
+LATIN_TRANSCRIPT = ['[m. 1]',
+                    'Gross receipt in Michaelmas term',
+                    'Saturday 30 September 1301',
+                    'URIEL',
+                    'De Henrico de Curcy, v marc. de fine pro transgressione.',
+                    'De eodem, the same.',
+                    'De Johanne Maungne, x s. vi d. ob.',
+                    'DAILY SUM RECEIVED: xx li. xiii s. iiij d.']
+
+
+def loop_dfs(lines, locale=create_data_csv.money.DEFAULT_LOCALE):
+    """ The data frames of the entries and daily sums from the loop over the lines. """
+    records = list(create_data_csv.iter_roll_entries(lines, locale=locale))
+    entries = [r for r in records if isinstance(r, create_data_csv.RollEntry)]
+    daily_sums = [r for r in records if isinstance(r, create_data_csv.DailySum)]
+    return pd.DataFrame(entries, columns=create_data_csv.DATA_COLUMNS), \
+        create_data_csv.daily_sums_df_from_records(daily_sums)
+
+
+class TestRollDfsFromLines(unittest.TestCase):
+    """ The vectorised engine should give the same data frames as the loop over the lines. """
+
+    def assert_same(self, lines, locale=create_data_csv.money.DEFAULT_LOCALE):
+        for expected, actual in zip(loop_dfs(lines, locale), create_data_csv.roll_dfs_from_lines(lines, locale=locale)):
+            pd.testing.assert_frame_equal(actual, expected)
+
+    def test_1(self):
+        self.assert_same(TRANSCRIPT)
+
+    def test_2(self):
+        # 'the same' after 'the same', a term heading and a line without a value
+        self.assert_same(TRANSCRIPT + ['The same again.', 'Monday 9 October', '[m. 2]', 'The same, nothing here.',
+                                       'Gross receipt in Easter term', 'Adam 3d.', 'Bob owes nothing', 'the same'])
+
+    def test_3(self):
+        self.assert_same(create_data_csv.read_transcript())
+
+    def test_4(self):
+        entries, daily_sums = create_data_csv.roll_dfs_from_lines(TRANSCRIPT)
+        self.assertEqual(entries[create_data_csv.common.PENCE_COL].tolist(), [800, 800, 600])
+        self.assertEqual(daily_sums[create_data_csv.common.DATE_COL].tolist(), ['1301-09-30', '1301-10-02'])
+
+    def test_5(self):
+        # values in other locales
+        self.assert_same(LATIN_TRANSCRIPT, 'la')
+        entries, daily_sums = create_data_csv.roll_dfs_from_lines(LATIN_TRANSCRIPT, locale='la')
+        self.assertEqual(entries[create_data_csv.common.PENCE_COL].tolist(), [800, 800, 126.5])
+        self.assertEqual(daily_sums[create_data_csv.common.PENCE_COL].tolist(), [4960])
+
+    def test_6(self):
+        with self.assertRaises(ValueError):
+            create_data_csv.roll_dfs_from_lines(TRANSCRIPT, locale='fr')
+
+
+if __name__ == '__main__':
+    unittest.main()
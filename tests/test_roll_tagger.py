@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import settings
+from receipt_roll import extract_entities
+from receipt_roll.roll_tagger import RollTagger, accuracy, gold_cases_passed
+
+TRAINING = [[('Richard', 'NNP'), ('fitz', 'FW'), ('John', 'NNP'), (',', ','), ('OVP', 'OVP'), ('to', 'TO'),
+             ('have', 'VB'), ('a', 'DT'), ('writ', 'NN'), ('.', '.')],
+            [('William', 'NNP'), ('le', 'FW'), ('Blund', 'NNP'), (',', ','), ('OVP', 'OVP'), ('for', 'IN'),
+             ('trespass', 'NN'), ('.', '.')],
+            [('Of', 'IN'), ('the', 'DT'), ('prior', 'NN'), ('of', 'IN'), ('the', 'DT'), ('same', 'JJ'), ('.', '.')],
+            [('prior', 'RB'), ('to', 'TO'), ('that', 'DT'), ('.', '.')]]
+
+
+class TestRollTagger(unittest.TestCase):
+    """ Test the tagger trained on the details of the roll. """
+
+    def setUp(self):
+        self.tagger = RollTagger.train(TRAINING)
+
+    def test_1(self):
+        # sentences it was trained on are tagged as they were
+        self.assertEqual(self.tagger.tag_sents([[word for word, tag in tagged] for tagged in TRAINING]), TRAINING)
+
+    def test_2(self):
+        # the tag of a word depends on the tag before it, where that was seen in training
+        self.assertEqual(self.tagger.tag(['the', 'prior']), [('the', 'DT'), ('prior', 'NN')])
+        self.assertEqual(self.tagger.tag(['prior']), [('prior', 'RB')])
+
+    def test_3(self):
+        # words that weren't seen in training are tagged by their shape
+        self.assertEqual(self.tagger.tag(['Geoffrey', '12', 'fines', 'debt', ';']),
+                         [('Geoffrey', 'NNP'), ('12', 'CD'), ('fines', 'NNS'), ('debt', 'NN'), (';', '.')])
+
+    def test_4(self):
+        model_dir = tempfile.mkdtemp()
+        model_file = os.path.join(model_dir, 'roll_tagger.json')
+        try:
+            self.tagger.save(model_file)
+            loaded = RollTagger.load(model_file)
+        finally:
+            os.remove(model_file)
+            os.rmdir(model_dir)
+        self.assertEqual(loaded.unigrams, self.tagger.unigrams)
+        self.assertEqual(loaded.bigrams, self.tagger.bigrams)
+
+    def test_5(self):
+        self.assertEqual(accuracy([[('a', 'DT'), ('writ', 'NN')]], [[('a', 'DT'), ('writ', 'VB')]]), 0.5)
+
+    def test_6(self):
+        # the gold cases are scored with the engine asked for, the settings are left alone
+        model_dir = tempfile.mkdtemp()
+        model_file = os.path.join(model_dir, 'roll_tagger.json')
+        cases = [('Richard fitz John, ½ mark to have a writ.', 'Richard fitz John'),
+                 ('William le Blund, 10s. for trespass.', 'Richard fitz John')]
+        try:
+            self.tagger.save(model_file)
+            with mock.patch.object(settings, 'ROLL_TAGGER_MODEL', model_file):
+                passed = gold_cases_passed('roll', tokenizer='roll', cases=cases)
+        finally:
+            os.remove(model_file)
+            os.rmdir(model_dir)
+        self.assertEqual(passed, (1, 2))
+        self.assertEqual(settings.TAGGER_ENGINE, 'perceptron')
+
+    def test_7(self):
+        # the details are tagged as a list of (word, tag), which the chunkers take as it is
+        model_dir = tempfile.mkdtemp()
+        model_file = os.path.join(model_dir, 'roll_tagger.json')
+        try:
+            self.tagger.save(model_file)
+            with mock.patch.object(settings, 'ROLL_TAGGER_MODEL', model_file):
+                tagged = extract_entities.tokenize_tag_text('Richard fitz John, ½ mark to have a writ.', 'roll', 'roll')
+        finally:
+            os.remove(model_file)
+            os.rmdir(model_dir)
+        self.assertEqual(tagged, TRAINING[0])
+        self.assertEqual(extract_entities.people_from_tagged(tagged), 'Richard fitz John')
+
+
+if __name__ == '__main__':
+    unittest.main()
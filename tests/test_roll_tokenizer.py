@@ -0,0 +1,53 @@
+import unittest
+
+import nltk
+from nltk.tokenize import NLTKWordTokenizer
+
+from receipt_roll import nltk_resources
+from receipt_roll.roll_tokenizer import roll_tokenize, token_diff
+import settings
+
+
+class TestRollTokenizer(unittest.TestCase):
+    """ Test the tokenizer for the details of the roll splits them as NLTK's Treebank word tokenizer does, and as
+        word_tokenize() does but for the full stops at the end of the sentences punkt finds inside an entry. """
+
+    def test_1(self):
+        self.assertEqual(roll_tokenize('Of aid promised to the king, OVP, by T. de Assheb’.'),
+                         ['Of', 'aid', 'promised', 'to', 'the', 'king', ',', 'OVP', ',', 'by', 'T.', 'de', 'Assheb',
+                          '’', '.'])
+
+    def test_2(self):
+        self.assertEqual(roll_tokenize('Of the promised king’s aid, OVP, by the same R.'),
+                         ['Of', 'the', 'promised', 'king', '’', 's', 'aid', ',', 'OVP', ',', 'by', 'the', 'same', 'R',
+                          '.'])
+
+    def test_3(self):
+        tokenizer = NLTKWordTokenizer()
+        for text in ["I don't know the king's men...", '1,000 men: (a) b; c!', 'plough-beasts bought', '']:
+            self.assertEqual(roll_tokenize(text), tokenizer.tokenize(text), text)
+
+    def test_4(self):
+        # the details of every entry of the roll, as they are tokenized, against word_tokenize(), which splits the
+        # entry into sentences with punkt first. The only differences can be full stops that punkt takes as the end
+        # of a sentence inside an entry, e.g. 'T.' before a name, which word_tokenize() splits off and
+        # roll_tokenize() keeps.
+        nltk_resources.use_data_dir()
+        if nltk_resources.missing_resources(nltk_resources.required_resources(tag=False)):
+            self.skipTest('the punkt model is not installed')
+        with open(settings.DETAILS_TEXT_CORPUS, 'r') as file:
+            for line in file:
+                for reference, tokens in token_diff(nltk.word_tokenize(line), roll_tokenize(line)):
+                    self.assertEqual(len(tokens), 1, line)
+                    self.assertEqual(reference, [tokens[0][:-1], '.'], line)
+
+    def test_5(self):
+        # every line of the details corpus, against the Treebank tokenizer without sentence splitting
+        tokenizer = NLTKWordTokenizer()
+        with open(settings.DETAILS_TEXT_CORPUS, 'r') as file:
+            for line in file:
+                self.assertEqual(token_diff(tokenizer.tokenize(line), roll_tokenize(line)), [], line)
+
+
+if __name__ == '__main__':
+    unittest.main()
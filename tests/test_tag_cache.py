@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from receipt_roll.tag_cache import TagCache
+
+TAGS = {'Richard fitz John, OVP to have a writ.': [('Richard', 'NNP'), ('fitz', 'FW'), ('John', 'NNP'), (',', ','),
+                                                   ('OVP', 'OVP'), ('to', 'TO'), ('have', 'VB'), ('a', 'DT'),
+                                                   ('writ', 'NN'), ('.', '.')],
+        'Of the same.': [('Of', 'IN'), ('the', 'DT'), ('same', 'JJ'), ('.', '.')]}
+
+
+class TestTagCache(unittest.TestCase):
+    """ Test the persistent cache of tags. """
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.cache_dir, 'tag_cache.sqlite')
+
+    def tearDown(self):
+        os.remove(self.cache_file)
+        os.rmdir(self.cache_dir)
+
+    def test_1(self):
+        with TagCache(self.cache_file, 'tagger') as cache:
+            cache.put_many(TAGS)
+        with TagCache(self.cache_file, 'tagger') as cache:
+            self.assertEqual(cache.get_many(list(TAGS) + ['Not tagged.']), TAGS)
+
+    def test_2(self):
+        # tags from another tagger are thrown away
+        with TagCache(self.cache_file, 'tagger') as cache:
+            cache.put_many(TAGS)
+        with TagCache(self.cache_file, 'another tagger') as cache:
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(cache.get_many(list(TAGS)), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from nltk import RegexpParser, Tree
+
+from receipt_roll.extract_entities import PERSON_GRAMMAR_REGEX, PLACE_GRAMMAR_REGEX
+from receipt_roll.tag_chunker import TagChunker
+
+# tags found in the details, weighted towards those in the grammars
+TAGS = ['NNP'] * 6 + ['NN'] * 3 + ['FW', 'NNS', ',', '.', ':', 'DT', 'IN', 'CC', 'OVP', 'VB', 'JJ', 'TO', 'CD',
+                                   'PRP$', '``']
+
+# number of random sentences compared with RegexpParser
+SENTENCES = 2000
+
+
+def parser_spans(parser, tagged):
+    spans = []
+    start = 0
+    for child in parser.parse(Tree(1, tagged)):
+        end = start + (len(child) if isinstance(child, Tree) else 1)
+        if isinstance(child, Tree):
+            spans.append((start, end))
+        start = end
+    return spans
+
+
+class TestTagChunker(unittest.TestCase):
+    """ Test the chunker gives the same chunks as NLTK's RegexpParser. """
+
+    def test_1(self):
+        chunker = TagChunker(PERSON_GRAMMAR_REGEX)
+        tagged = [('Richard', 'NNP'), ('fitz', 'FW'), ('John', 'NNP'), (',', ','), ('OVP', 'OVP'), ('to', 'TO'),
+                  ('have', 'VB'), ('a', 'DT'), ('writ', 'NN'), ('.', '.')]
+        self.assertEqual(chunker.spans(tagged), [(0, 4)])
+        self.assertEqual(chunker.chunks(tagged), [tagged[:4]])
+
+    def test_2(self):
+        chunker = TagChunker(PLACE_GRAMMAR_REGEX)
+        tagged = [('city', 'NN'), ('of', 'IN'), ('Dublin', 'NNP'), ('and', 'CC'), ('Cork', 'NNP'), ('.', '.')]
+        self.assertEqual(chunker.label, 'PPL')
+        self.assertEqual(chunker.spans(tagged), [(0, 5)])
+        self.assertEqual(chunker.spans([]), [])
+
+    def test_3(self):
+        rng = random.Random(1301)
+        for grammar in (PERSON_GRAMMAR_REGEX, PLACE_GRAMMAR_REGEX):
+            parser = RegexpParser(grammar)
+            chunker = TagChunker(grammar)
+            for _ in range(SENTENCES):
+                tagged = [('w', rng.choice(TAGS)) for _ in range(rng.randint(1, 20))]
+                self.assertEqual(chunker.spans(tagged), parser_spans(parser, tagged), tagged)
+
+    def test_4(self):
+        # only grammars of one chunk rule can be compiled
+        with self.assertRaises(ValueError):
+            TagChunker('NP: {<DT><NN>}\nVP: {<VB>}')
+
+
+if __name__ == '__main__':
+    unittest.main()
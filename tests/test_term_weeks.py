@@ -0,0 +1,52 @@
+import unittest
+
+import pandas as pd
+
+from receipt_roll import common, create_data_csv
+
+
+def term_weeks_loop(df):
+    """ The original calculation of the week of the term, row by row. """
+    week_values = []
+    for term, term_g in df.groupby(common.TERM_COL, sort=False):
+        new_week_on_monday = False
+        week = 1
+        for index, row in term_g.iterrows():
+            day = row[common.DAY_COL]
+            if new_week_on_monday is True and day == 'Monday':
+                new_week_on_monday = False
+                week = week + 1
+            if day != 'Monday':
+                new_week_on_monday = True
+            week_values.append(week)
+    return week_values
+
+
+class TestTermWeeks(unittest.TestCase):
+    """ The vectorised week of the term should match the row by row calculation on the 1301-2 roll. """
+
+    @classmethod
+    def setUpClass(cls):
+        entries = [record for record in create_data_csv.iter_roll_entries(create_data_csv.read_transcript())
+                   if isinstance(record, create_data_csv.RollEntry)]
+        cls.df = create_data_csv.roll_df_from_entries(entries).drop(columns=common.WEEK_COL)
+
+    def test_1(self):
+        self.assertEqual(create_data_csv.term_weeks(self.df).tolist(), term_weeks_loop(self.df))
+
+    def test_2(self):
+        # each roll in a corpus has its own weeks
+        df_a = self.df.assign(**{common.ROLL_COL: 'roll_a'})
+        df_b = self.df.assign(**{common.ROLL_COL: 'roll_b'})
+        weeks = create_data_csv.term_weeks(pd.concat([df_a, df_b], ignore_index=True))
+        self.assertEqual(weeks.tolist(), term_weeks_loop(self.df) * 2)
+
+    def test_3(self):
+        # a term that starts on a Monday is still in week 1
+        df = pd.DataFrame({common.TERM_COL: ['Easter'] * 4,
+                           common.DAY_COL: ['Monday', 'Monday', 'Tuesday', 'Monday']})
+        self.assertEqual(create_data_csv.term_weeks(df).tolist(), [1, 1, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
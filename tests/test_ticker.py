@@ -0,0 +1,47 @@
+import unittest
+
+from receipt_roll import money
+from receipt_roll.plots.ticker import PsdFormatter, PsdLocator
+
+
+class TestPsdFormatter(unittest.TestCase):
+    """ Test labelling ticks in £.s.d. """
+
+    def test_1(self):
+        formatter = PsdFormatter()
+        self.assertEqual([formatter(x) for x in [0, 120000.0, 316.25, -240]], ['', '£500.', '£1.6s.4¼d.', '-£1.'])
+
+    def test_2(self):
+        formatter = PsdFormatter(marks=True)
+        self.assertEqual([formatter(x) for x in [800, 80, 316]], ['5 marks', '½ mark', '£1.6s.4d.'])
+
+
+class TestPsdLocator(unittest.TestCase):
+    """ Test placing ticks on pounds and marks. """
+
+    def test_1(self):
+        # ticks are whole pounds, beyond the old fixed range too
+        for vmax in [84000, 600000, 5000000]:
+            ticks = PsdLocator().tick_values(0, vmax)
+            self.assertTrue(all(tick % money.pound_as_pence == 0 for tick in ticks))
+            self.assertGreaterEqual(ticks[-1], vmax)
+
+    def test_2(self):
+        ticks = PsdLocator(money.mark_as_pence).tick_values(0, 3200)
+        self.assertEqual(list(ticks), [0, 800, 1600, 2400, 3200])
+
+    def test_3(self):
+        # less than a pound is ticked in shillings
+        ticks = PsdLocator().tick_values(0, 150)
+        self.assertTrue(all(tick % money.shilling_as_pence == 0 for tick in ticks))
+
+    def test_4(self):
+        # ticks are whole pounds, so a step of 2.5 is £25 rather than £2.10s.
+        self.assertEqual(list(PsdLocator().tick_values(0, 14 * money.pound_as_pence) / money.pound_as_pence),
+                         [0, 5, 10, 15])
+        self.assertEqual(list(PsdLocator().tick_values(0, 140 * money.pound_as_pence) / money.pound_as_pence),
+                         [0, 25, 50, 75, 100, 125, 150])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+import settings
+from receipt_roll import transcript_index
+
+
+class TestTranscriptReader(unittest.TestCase):
+    """ Test reading days and membranes from the transcript through the index. """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index_dir = tempfile.mkdtemp()
+        cls.index_file = os.path.join(cls.index_dir, 'roll_1301.index.json')
+        cls.reader = transcript_index.TranscriptReader(settings.ROLL_TXT, cls.index_file)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.reader.close()
+        os.remove(cls.index_file)
+        os.rmdir(cls.index_dir)
+
+    def test_1(self):
+        day = self.reader.read_day('1301-10-02')
+        self.assertTrue(day.startswith('Monday 2 October\n'))
+        self.assertTrue(day.endswith('SUM: £17.20d.\n'))
+
+    def test_2(self):
+        self.assertEqual(self.reader.read_daily_sum('1301-09-30'), 'DAILY SUM RECEIVED: £97.5s.\n')
+
+    def test_3(self):
+        self.assertTrue(self.reader.read_membrane(2).startswith('[m. 2]\n'))
+        self.assertNotIn('[m. 3]', self.reader.read_membrane(2))
+
+    def test_4(self):
+        # the last membrane runs to the end of the transcript
+        with open(settings.ROLL_TXT, encoding='utf-8') as transcript:
+            self.assertTrue(transcript.read().endswith(self.reader.read_membrane(18)))
+
+    def test_5(self):
+        self.assertEqual(len(self.reader.dates()), 187)
+
+    def test_6(self):
+        with self.assertRaises(KeyError):
+            self.reader.read_day('1301-09-01')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import settings
+from receipt_roll import create_data_csv, update_data_csv
+from receipt_roll.data import columnar
+
+# the first three membranes of the 1301-2 roll (and the title before them), parsed as the roll of another year
+MEMBRANE_LINES = 378
+
+NOTHING_DATES = 'Membrane,Term,Date,Day Entry,Day,Source,Details,Value,Pence\n' \
+                '2,Michaelmas,1305-10-18,,Wednesday,NOTHING,NOTHING,NOTHING,0.0\n'
+
+
+class TestUpdateDataCsv(unittest.TestCase):
+    """ Updating the CSV files of a transcript should only parse the edited membranes, and give the same files as
+        parsing the whole transcript. """
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.transcript = os.path.join(self.data_dir, 'roll_1305.txt')
+        self.lines = create_data_csv.read_transcript(settings.ROLL_TXT)[:MEMBRANE_LINES]
+        self.write_transcript(self.lines)
+        with open(os.path.join(self.data_dir, 'roll_1305_nothing_dates.csv'), 'w') as file:
+            file.write(NOTHING_DATES)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+        settings.ROLL_LOCALES.pop('roll_1305', None)
+
+    def write_transcript(self, lines):
+        with open(self.transcript, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines))
+
+    def read_files(self, files):
+        contents = []
+        for file in files:
+            with open(file, 'rb') as csv_file:
+                contents.append(csv_file.read())
+        return contents
+
+    def full_parse(self):
+        """ The CSV files of parsing the whole transcript in one go. """
+        records = list(create_data_csv.iter_roll_entries(create_data_csv.read_transcript(self.transcript),
+                                                         start_year=1305))
+        entries = [record for record in records if isinstance(record, create_data_csv.RollEntry)]
+        daily_sums = [record for record in records if isinstance(record, create_data_csv.DailySum)]
+        roll_csv = os.path.join(self.data_dir, 'full.csv')
+        sums_csv = os.path.join(self.data_dir, 'full_daily_sums.csv')
+        columnar.write_df(create_data_csv.roll_df_from_entries(entries,
+                                                               create_data_csv.nothing_df_for(self.transcript)),
+                          roll_csv)
+        columnar.write_df(create_data_csv.daily_sums_df_from_records(daily_sums), sums_csv)
+        return self.read_files([roll_csv, sums_csv])
+
+    def test_1(self):
+        roll_csv, sums_csv, manifest_file = update_data_csv.output_files(self.transcript)
+        self.assertEqual(update_data_csv.update_roll(self.transcript), 4)
+        self.assertEqual(update_data_csv.update_roll(self.transcript), 0)
+        self.assertTrue(os.path.isfile(manifest_file))
+        self.assertEqual(self.read_files([roll_csv, sums_csv]), self.full_parse())
+
+        # the roll has its own days the Exchequer didn't sit
+        self.assertIn(b'1305-10-18', self.read_files([roll_csv])[0])
+
+        # edit the second membrane
+        lines = list(self.lines)
+        idx = lines.index('Thomas de Salop, chaplain, ½ mark as he did not have a warrant of the king’s service.')
+        lines[idx] = 'Thomas de Salop, chaplain, 1 mark as he did not have a warrant of the king’s service.'
+        self.write_transcript(lines)
+        self.assertEqual(update_data_csv.update_roll(self.transcript), 1)
+        self.assertEqual(self.read_files([roll_csv, sums_csv]), self.full_parse())
+
+    def test_2(self):
+        # the year the roll starts and its locale are part of the key of a membrane
+        roll_csv, sums_csv, manifest_file = update_data_csv.output_files(self.transcript)
+        self.assertEqual(update_data_csv.update_roll(self.transcript), 4)
+
+        other_year = os.path.join(self.data_dir, 'roll_1306.txt')
+        shutil.copy(self.transcript, other_year)
+        self.assertEqual(update_data_csv.update_roll(other_year, manifest_file), 4)
+
+        settings.ROLL_LOCALES['roll_1305'] = 'la'
+        parsed = update_data_csv.update_roll(self.transcript, manifest_file)
+        self.assertEqual(parsed, 4)
+
+    def test_3(self):
+        # the 1301-2 roll keeps its files in settings
+        files = (settings.ROLL_CSV, settings.DAILY_SUMS_CSV, settings.ROLL_MANIFEST)
+        self.assertEqual(update_data_csv.output_files(settings.ROLL_TXT), files)
+
+    def test_4(self):
+        # an update when nothing has changed doesn't write any files
+        roll_csv, sums_csv, manifest_file = update_data_csv.output_files(self.transcript)
+        self.assertEqual(update_data_csv.update_roll(self.transcript), 4)
+        files = [roll_csv, sums_csv, columnar.columnar_file(roll_csv), manifest_file]
+        files = [file for file in files if os.path.isfile(file)]
+        for file in files:
+            os.utime(file, ns=(10 ** 18, 10 ** 18))
+        self.assertEqual(update_data_csv.update_roll(self.transcript), 0)
+        self.assertEqual([os.stat(file).st_mtime_ns for file in files], [10 ** 18] * len(files))
+
+        # each parsed membrane has its own file, only an edited membrane's is written
+        membranes_dir = update_data_csv.membranes_dir(manifest_file)
+        self.assertEqual(len(os.listdir(membranes_dir)), 4)
+        lines = list(self.lines)
+        lines[lines.index('URIEL')] = 'URIEL '
+        self.write_transcript(lines)
+        self.assertEqual(update_data_csv.update_roll(self.transcript), 1)
+        self.assertEqual(len(os.listdir(membranes_dir)), 4)
+        self.assertNotEqual(os.stat(roll_csv).st_mtime_ns, 10 ** 18)
+
+        # the days the Exchequer didn't sit are written again when they change
+        with open(os.path.join(self.data_dir, 'roll_1305_nothing_dates.csv'), 'a') as file:
+            file.write('3,Michaelmas,1305-10-26,,Thursday,NOTHING,NOTHING,NOTHING,0.0\n')
+        self.assertEqual(update_data_csv.update_roll(self.transcript), 0)
+        self.assertIn(b'1305-10-26', self.read_files([roll_csv])[0])
+        self.assertEqual(self.read_files([roll_csv, sums_csv]), self.full_parse())
+
+
+if __name__ == '__main__':
+    unittest.main()